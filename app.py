@@ -1,33 +1,41 @@
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-import sqlite3
 from datetime import datetime
-from xhtml2pdf import pisa
 
-# دالة لتحويل HTML إلى PDF
-def convert_html_to_pdf(source_html, output_filename):
-    with open(output_filename, "w+b") as result_file:
-        pisa_status = pisa.CreatePDF(source_html, dest=result_file)
-    return pisa_status.err
+import readiness_store
+import report_jobs
 
-# دالة لحفظ النتائج في قاعدة البيانات
+# حالة تقرير PDF: يُرسم في الخلفية (report_jobs)، واللوحة لا تُحدَّث دوريًا إلا ما دام التقرير قيد الإنشاء
+def report_panel():
+    job = st.session_state.get("report_job")
+    if not job:
+        return
+    state = report_jobs.status(job["id"])
+    if state == "done":
+        # البايتات تُقرأ عند الضغط على زر التحميل فقط
+        st.download_button("📄 تحميل تقرير PDF", data=lambda: report_jobs.result(job["id"]),
+                           file_name=job["file_name"], mime="application/pdf", key="download_report")
+    elif state == "failed":
+        st.error("❌ فشل في إنشاء ملف PDF.")
+    elif state is None:
+        # مهمة غير معروفة (مثلًا بعد إعادة تشغيل الخادم قبل اكتمالها)
+        del st.session_state["report_job"]
+    else:
+        report_progress(job)
+
+@st.fragment(run_every=1)
+def report_progress(job):
+    # يُستدعى فقط والتقرير قيد الإنشاء، وعند انتهائه يُعاد تشغيل الصفحة مرة واحدة
+    # فيعرض report_panel النتيجة ويتوقف التحديث الدوري
+    state = report_jobs.status(job["id"])
+    if state not in ("pending", "running"):
+        st.rerun(scope="app")
+    st.info(f"{report_jobs.STATUS_LABELS.get(state, state)}: {job['file_name']}")
+
+# دالة لحفظ النتائج في قاعدة البيانات (اتصال مشترك وترحيلات مرة واحدة في readiness_store)
 def save_to_db(company, date, scores, total):
-    conn = sqlite3.connect("ai_readiness.db")
-    c = conn.cursor()
-    c.execute('''CREATE TABLE IF NOT EXISTS assessments (
-                 company TEXT, date TEXT, plan INTEGER, source INTEGER, make INTEGER, deliver INTEGER, return_score INTEGER, total REAL)''')
-    c.execute('''INSERT INTO assessments VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
-              (company, date, scores[0], scores[1], scores[2], scores[3], scores[4], total))
-    conn.commit()
-    conn.close()
-
-# دالة لجلب نتائج شركات أخرى للمقارنة
-def get_all_assessments():
-    conn = sqlite3.connect("ai_readiness.db")
-    df = pd.read_sql_query("SELECT * FROM assessments", conn)
-    conn.close()
-    return df
+    readiness_store.save_assessment(company, date, scores, total)
 
 # عنوان الصفحة
 st.set_page_config(page_title="منصة تقييم جاهزية الذكاء الاصطناعي", layout="wide")
@@ -72,6 +80,7 @@ if submit_btn:
     # تصدير PDF
     if company_name:
         html_content = f"""
+        <style>body {{ font-family: Amiri; }}</style>
         <h1>تقرير تقييم جاهزية الذكاء الاصطناعي</h1>
         <p><strong>اسم الشركة:</strong> {company_name}</p>
         <p><strong>تاريخ التقييم:</strong> {datetime.today().date()}</p>
@@ -85,11 +94,10 @@ if submit_btn:
         </table>
         <br><p><strong>التقييم النهائي:</strong> {total_score:.1f} / 100</p>
         """
-        pdf_file = f"تقرير جاهزية {company_name}.pdf"
-        if convert_html_to_pdf(html_content, pdf_file) == 0:
-            st.success(f"📄 تم إنشاء ملف PDF باسم: {pdf_file}")
-        else:
-            st.error("❌ فشل في إنشاء ملف PDF.")
+        st.session_state.report_job = {
+            "id": report_jobs.submit(html_content),
+            "file_name": f"تقرير جاهزية {company_name}.pdf",
+        }
 
         # حفظ النتائج في قاعدة البيانات
         save_to_db(company_name, str(datetime.today().date()),
@@ -97,8 +105,25 @@ if submit_btn:
     else:
         st.warning("⚠️ يرجى إدخال اسم الشركة أولاً.")
 
+report_panel()
+
 # عرض جميع الشركات المسجلة
 st.header("📂 مقارنة مع شركات أخرى")
 if st.checkbox("📋 عرض جميع التقييمات المسجلة"):
-    data = get_all_assessments()
-    st.dataframe(data)
+    total_rows = readiness_store.count_assessments()
+    if total_rows:
+        # ملخص إحصائي لكل مرحلة (متوسط ومئينات) محسوب داخل قاعدة البيانات
+        st.subheader("📊 توزيع الدرجات لكل مرحلة")
+        st.dataframe(readiness_store.phase_summary().round(1), use_container_width=True, hide_index=True)
+
+        st.subheader("🏢 متوسطات الشركات")
+        company_pages = max(1, -(-readiness_store.count_companies() // 20))
+        company_page = st.number_input(f"صفحة الشركات (من {company_pages})", min_value=1, max_value=company_pages, value=1)
+        st.dataframe(readiness_store.company_summary(company_page, 20), use_container_width=True, hide_index=True)
+
+        st.subheader("📋 التقييمات المسجلة")
+        rows_pages = max(1, -(-total_rows // 50))
+        rows_page = st.number_input(f"صفحة التقييمات (من {rows_pages})", min_value=1, max_value=rows_pages, value=1)
+        st.dataframe(readiness_store.page_assessments(rows_page, 50), use_container_width=True)
+    else:
+        st.info("لا توجد تقييمات مسجلة بعد.")
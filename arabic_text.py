@@ -0,0 +1,27 @@
+# تشكيل النص العربي لتقارير PDF (arabic_reshaper + bidi) مع كاش LRU محدود
+# التسميات نفسها (أسماء المراحل، "الدولة"، "القطاع"، الاستراتيجيات) تتكرر في كل تقرير،
+# فتُشكَّل مرة واحدة فقط لكل عملية.
+
+from functools import lru_cache
+
+SHAPE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=SHAPE_CACHE_SIZE)
+def shape(text):
+    # reshape ثم get_display: يعيد النص جاهزًا للرسم من اليمين إلى اليسار
+    import arabic_reshaper
+    from bidi.algorithm import get_display
+
+    return get_display(arabic_reshaper.reshape(text))
+
+
+def shape_many(texts):
+    # واجهة مجمّعة: تشكيل عدة نصوص دفعة واحدة، والمكرر منها يُشكَّل مرة واحدة
+    texts = [str(t) for t in texts]
+    shaped = {t: shape(t) for t in dict.fromkeys(texts)}
+    return [shaped[t] for t in texts]
+
+
+def cache_info():
+    return shape.cache_info()
@@ -0,0 +1,748 @@
+# مخزن التقييمات - طبقة تخزين SQLite (WAL) تحل محل إعادة كتابة benchmark_data.xlsx و data_log.xlsx
+# الحفظ أصبح إضافة صف واحد (O(1))، وملفات Excel أصبحت صيغة تصدير فقط.
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+# ======================= #
+#        الإعدادات
+# ======================= #
+DB_PATH = os.environ.get("SCOR_DB_PATH", "scor_data.db")
+LEGACY_BENCHMARK_XLSX = "benchmark_data.xlsx"
+LEGACY_LOG_XLSX = "data_log.xlsx"
+SCOR_PHASES = ("Plan", "Source", "Make", "Deliver", "Return")
+# WAL مع synchronous=NORMAL لا يستدعي fsync عند كل commit: انقطاع الكهرباء قد يُفقد آخر المعاملات
+# (دون إفساد القاعدة). دفعات سجل العمليات تُكتب بـ FULL لأنها غادرت ذاكرة الكاتب في الخلفية بالفعل.
+LOG_SYNCHRONOUS = "FULL"
+
+# أعمدة ملف Excel القديم بالترتيب نفسه
+EXPORT_COLUMNS = {
+    "name": "الاسم",
+    "company": "الشركة",
+    "sector": "القطاع",
+    "country": "الدولة",
+    "created_at": "التاريخ",
+    "iot_avg": "متوسط IoT",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assessments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT,
+    company TEXT,
+    sector TEXT,
+    country TEXT,
+    created_at TEXT,
+    iot_avg REAL,
+    plan REAL,
+    source REAL,
+    make REAL,
+    deliver REAL,
+    return_score REAL,
+    submission_hash TEXT,
+    change_seq INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS data_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT,
+    company TEXT,
+    sector TEXT,
+    country TEXT,
+    created_at TEXT,
+    iot_avg REAL,
+    cpm_score REAL,
+    status TEXT,
+    method TEXT,
+    plan REAL,
+    source REAL,
+    make REAL,
+    deliver REAL,
+    return_score REAL
+);
+CREATE INDEX IF NOT EXISTS idx_log_company ON data_log (company);
+CREATE INDEX IF NOT EXISTS idx_log_sector ON data_log (sector);
+CREATE INDEX IF NOT EXISTS idx_log_country ON data_log (country);
+CREATE TABLE IF NOT EXISTS log_aggregates (
+    dimension TEXT NOT NULL,
+    key TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    total REAL NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (dimension, key, metric)
+);
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO store_meta (key, value) VALUES ('version', 0);
+INSERT OR IGNORE INTO store_meta (key, value) VALUES ('log_version', 0);
+INSERT OR IGNORE INTO store_meta (key, value) VALUES ('change_seq', 0);
+CREATE TABLE IF NOT EXISTS webhook_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    endpoint TEXT,
+    payload TEXT NOT NULL,
+    log_entry TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    created_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_due ON webhook_outbox (status, next_attempt_at);
+CREATE TABLE IF NOT EXISTS push_marks (
+    endpoint TEXT PRIMARY KEY,
+    high_water_id INTEGER NOT NULL,
+    updated_at TEXT,
+    change_mark INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS push_state (
+    endpoint TEXT NOT NULL,
+    assessment_id INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    PRIMARY KEY (endpoint, assessment_id)
+);
+"""
+
+# اسم عمود كل مرحلة داخل قاعدة البيانات ("return" كلمة محجوزة في SQL)
+PHASE_COLUMNS = {
+    "Plan": "plan",
+    "Source": "source",
+    "Make": "make",
+    "Deliver": "deliver",
+    "Return": "return_score",
+}
+
+_INSERT_SQL = (
+    "INSERT INTO assessments (name, company, sector, country, created_at, iot_avg, "
+    "plan, source, make, deliver, return_score, submission_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+# الإرسال نفسه (نفس المستخدم ونفس الإجابات) لا يُخزَّن مرتين
+_INSERT_ONCE_SQL = _INSERT_SQL.replace("INSERT INTO", "INSERT OR IGNORE INTO", 1)
+# الأعمدة التي تحدد محتوى التقييم (كل شيء عدا المعرف والتاريخ)
+_CONTENT_COLUMNS = ("name", "company", "sector", "country", "iot_avg") + tuple(PHASE_COLUMNS.values())
+
+# أي تعديل على محتوى تقييم محفوظ يأخذ الرقم التالي من store_meta.change_seq
+_CHANGE_TRIGGER_SQL = (
+    "CREATE TRIGGER IF NOT EXISTS trg_assessments_changed AFTER UPDATE OF "
+    + ", ".join(("created_at",) + _CONTENT_COLUMNS) + " ON assessments BEGIN "
+    "UPDATE store_meta SET value = value + 1 WHERE key = 'change_seq'; "
+    "UPDATE assessments SET change_seq = (SELECT value FROM store_meta WHERE key = 'change_seq') WHERE id = NEW.id; "
+    "END"
+)
+
+# أعمدة سجل العمليات (data_log.xlsx) كما يكتبها log_company_data
+LOG_COLUMNS = {
+    "name": "الاسم",
+    "company": "الشركة",
+    "sector": "القطاع",
+    "country": "الدولة",
+    "created_at": "التاريخ",
+    "iot_avg": "متوسط IoT",
+    "cpm_score": "نتيجة CPM",
+    "status": "حالة العملية",
+    "method": "الطريقة",
+}
+
+_INSERT_LOG_SQL = (
+    "INSERT INTO data_log (name, company, sector, country, created_at, iot_avg, cpm_score, "
+    "status, method, plan, source, make, deliver, return_score) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# مجاميع تراكمية (مجموع/عدد) لكل قطاع ودولة تُحدَّث مع كل قيد في السجل
+AGGREGATE_DIMENSIONS = {"sector": 2, "country": 3}
+AGGREGATE_METRICS = {"cpm_score": 6, "iot_avg": 5, "plan": 9, "source": 10, "make": 11, "deliver": 12, "return_score": 13}
+
+_UPSERT_AGGREGATE_SQL = (
+    "INSERT INTO log_aggregates (dimension, key, metric, total, n) VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (dimension, key, metric) DO UPDATE SET total = total + excluded.total, n = n + excluded.n"
+)
+
+# كتابة السجل تزيد الإصدار العام وإصدار السجل معًا؛ حفظ التقييمات يزيد الإصدار العام فقط
+_BUMP_LOG_VERSION_SQL = "UPDATE store_meta SET value = value + 1 WHERE key IN ('version', 'log_version')"
+
+_lock = threading.Lock()
+_conn = None
+_conn_path = None
+
+
+# ======================= #
+#     الاتصال بقاعدة البيانات
+# ======================= #
+def get_connection():
+    # اتصال واحد طويل العمر لكل عملية، محمي بقفل لأن Streamlit يشغّل الجلسات في خيوط متعددة
+    global _conn, _conn_path
+    with _lock:
+        if _conn is None or _conn_path != DB_PATH:
+            conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            _migrate(conn)
+            conn.commit()
+            _conn, _conn_path = conn, DB_PATH
+            _import_legacy_excel(conn)
+            if (conn.execute("SELECT 1 FROM data_log LIMIT 1").fetchone()
+                    and not conn.execute("SELECT 1 FROM log_aggregates LIMIT 1").fetchone()):
+                _rebuild_aggregates(conn)
+        return _conn
+
+
+def _migrate(conn):
+    # قواعد البيانات الأقدم لا تحتوي على عمود بصمة الإرسال
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(assessments)")}
+    if "submission_hash" not in columns:
+        conn.execute("ALTER TABLE assessments ADD COLUMN submission_hash TEXT")
+    conn.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_assessments_submission ON assessments (submission_hash)"
+    )
+    # رقم تسلسلي لآخر تعديل على محتوى التقييم: الدفع المجمّع يعيد فحص ما تغيّر فقط بعد آخر تشغيل
+    if "change_seq" not in columns:
+        # التعديلات قبل الترحيل غير معروفة: أول دفع بعده يفحص بصمات كل الصفوف مرة واحدة
+        conn.execute("ALTER TABLE assessments ADD COLUMN change_seq INTEGER NOT NULL DEFAULT 1")
+        conn.execute("UPDATE store_meta SET value = MAX(value, 1) WHERE key = 'change_seq'")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_assessments_change ON assessments (change_seq)")
+    conn.execute(_CHANGE_TRIGGER_SQL)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(push_marks)")}
+    if "change_mark" not in columns:
+        conn.execute("ALTER TABLE push_marks ADD COLUMN change_mark INTEGER NOT NULL DEFAULT 0")
+    # صندوق الصادر الأقدم لا يحتوي على مفتاح النظام الخارجي (الإرسالات القديمة تُجمَّع حسب الرابط)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(webhook_outbox)")}
+    if "endpoint" not in columns:
+        conn.execute("ALTER TABLE webhook_outbox ADD COLUMN endpoint TEXT")
+
+
+def _import_legacy_excel(conn):
+    # ترحيل لمرة واحدة: إذا كان الجدول فارغًا ويوجد ملف Excel قديم
+    if os.path.exists(LEGACY_BENCHMARK_XLSX) and not conn.execute("SELECT 1 FROM assessments LIMIT 1").fetchone():
+        df = pd.read_excel(LEGACY_BENCHMARK_XLSX)
+        rows = []
+        for rec in df.to_dict("records"):
+            user_info = {key: rec.get(label, "") for key, label in EXPORT_COLUMNS.items()}
+            results = {phase: rec.get(phase) for phase in SCOR_PHASES if phase in rec}
+            rows.append(_to_row(user_info, rec.get("متوسط IoT", 0), results, str(rec.get("التاريخ", ""))))
+        _insert_rows(conn, _INSERT_SQL, rows)
+    if os.path.exists(LEGACY_LOG_XLSX) and not conn.execute("SELECT 1 FROM data_log LIMIT 1").fetchone():
+        df = pd.read_excel(LEGACY_LOG_XLSX)
+        _insert_log_rows(conn, [_to_log_row(rec) for rec in df.to_dict("records")])
+
+
+# ======================= #
+#        الكتابة
+# ======================= #
+def _clean(value):
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return None
+    return value
+
+
+def submission_hash(user_info, answers):
+    # بصمة محتوى الإرسال: بيانات المستخدم + الإجابات (بغض النظر عن وقت الإرسال)
+    payload = json.dumps(
+        [[user_info.get(key, "") for key in ("name", "company", "sector", "country")], answers],
+        ensure_ascii=False, sort_keys=True, default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _to_row(user_info, iot_avg, results, created_at=None, submission_key=None):
+    created_at = created_at or datetime.now().strftime("%Y-%m-%d %H:%M")
+    row = [
+        _clean(user_info.get("name", "")),
+        _clean(user_info.get("company", "")),
+        _clean(user_info.get("sector", "")),
+        _clean(user_info.get("country", "")),
+        created_at,
+        round(float(iot_avg or 0), 2),
+    ]
+    for phase in SCOR_PHASES:
+        score = _clean(results.get(phase))
+        row.append(round(float(score), 2) if score is not None else None)
+    row.append(submission_key)
+    return tuple(row)
+
+
+def _to_log_row(entry):
+    # entry بنفس مفاتيح السجل العربية، ودرجات المراحل بمفاتيح "SCOR - Plan" ...
+    row = [_clean(entry.get(label)) for label in LOG_COLUMNS.values()]
+    if row[4] is not None:
+        row[4] = str(row[4])
+    for phase in SCOR_PHASES:
+        score = _clean(entry.get(f"SCOR - {phase}"))
+        row.append(float(score) if score is not None else None)
+    return tuple(row)
+
+
+def _insert_rows(conn, sql, rows):
+    # يعيد عدد الصفوف المضافة فعلًا (INSERT OR IGNORE يتجاهل الإرسال المحفوظ مسبقًا)
+    if not rows:
+        return 0
+    with conn:
+        before = conn.total_changes
+        conn.executemany(sql, rows)
+        inserted = conn.total_changes - before
+        if inserted:
+            conn.execute("UPDATE store_meta SET value = value + 1 WHERE key = 'version'")
+    return inserted
+
+
+def _aggregate_rows(rows):
+    # نفس منطق صفحة القطاع: تُستبعد الصفوف التي ليس لها قيمة للبعد أو لنتيجة CPM
+    sums = {}
+    cpm_idx = AGGREGATE_METRICS["cpm_score"]
+    for row in rows:
+        if row[cpm_idx] is None:
+            continue
+        for dimension, dim_idx in AGGREGATE_DIMENSIONS.items():
+            key = row[dim_idx]
+            if key is None:
+                continue
+            for metric, idx in AGGREGATE_METRICS.items():
+                if row[idx] is None:
+                    continue
+                total, n = sums.get((dimension, key, metric), (0.0, 0))
+                sums[(dimension, key, metric)] = (total + row[idx], n + 1)
+    return [(d, k, m, total, n) for (d, k, m), (total, n) in sums.items()]
+
+
+def _insert_log_rows(conn, rows):
+    # القيد والمجاميع تُكتب في المعاملة نفسها فلا تنفصل أبدًا
+    if not rows:
+        return 0
+    with conn:
+        conn.executemany(_INSERT_LOG_SQL, rows)
+        conn.executemany(_UPSERT_AGGREGATE_SQL, _aggregate_rows(rows))
+        conn.execute(_BUMP_LOG_VERSION_SQL)
+    return len(rows)
+
+
+def append_assessment(user_info, iot_avg, results, created_at=None, submission_key=None):
+    # إضافة تقييم واحد - تكلفة ثابتة مهما كان عدد الصفوف المخزنة
+    # مع submission_key: يعيد None إذا كان الإرسال نفسه محفوظًا مسبقًا
+    conn = get_connection()
+    row = _to_row(user_info, iot_avg, results, created_at, submission_key)
+    with _lock:
+        with conn:
+            cur = conn.execute(_INSERT_ONCE_SQL, row)
+            if cur.rowcount == 0:
+                return None
+            conn.execute("UPDATE store_meta SET value = value + 1 WHERE key = 'version'")
+    return cur.lastrowid
+
+
+def append_assessments(rows):
+    # إضافة مجمّعة: rows عبارة عن (user_info, iot_avg, results[, created_at[, submission_key]])
+    # الصفوف التي لها بصمة محفوظة مسبقًا تُتجاهل كما في append_assessment
+    conn = get_connection()
+    prepared = [_to_row(*r) for r in rows]
+    with _lock:
+        return _insert_rows(conn, _INSERT_ONCE_SQL, prepared)
+
+
+def append_log_entries(entries):
+    # كتابة دفعة من سجل العمليات في معاملة واحدة (يستخدمها كاتب السجل في الخلفية)
+    conn = get_connection()
+    rows = [_to_log_row(e) for e in entries]
+    with _lock:
+        # لا يمكن تغيير synchronous داخل معاملة، لذا يُضبط حول الدفعة ويُعاد بعدها
+        conn.execute(f"PRAGMA synchronous={LOG_SYNCHRONOUS}")
+        try:
+            return _insert_log_rows(conn, rows)
+        finally:
+            conn.execute("PRAGMA synchronous=NORMAL")
+
+
+# ======================= #
+#        القراءة
+# ======================= #
+def store_version():
+    # عداد يزداد مع كل عملية كتابة - يُستخدم لإبطال الكاش
+    conn = get_connection()
+    with _lock:
+        return conn.execute("SELECT value FROM store_meta WHERE key = 'version'").fetchone()[0]
+
+
+def log_version():
+    # عداد لا يزداد إلا مع كتابة سجل العمليات - مفتاح كاش السجل حتى لا يبطله حفظ التقييمات
+    conn = get_connection()
+    with _lock:
+        return conn.execute("SELECT value FROM store_meta WHERE key = 'log_version'").fetchone()[0]
+
+
+def count_assessments():
+    conn = get_connection()
+    with _lock:
+        return conn.execute("SELECT COUNT(*) FROM assessments").fetchone()[0]
+
+
+def load_assessments():
+    # إرجاع التقييمات بنفس أعمدة ملف Excel القديم
+    conn = get_connection()
+    with _lock:
+        df = pd.read_sql_query("SELECT * FROM assessments ORDER BY id", conn)
+    rename = dict(EXPORT_COLUMNS)
+    rename.update({col: phase for phase, col in PHASE_COLUMNS.items()})
+    return df.drop(columns=["id", "submission_hash", "change_seq"]).rename(columns=rename)
+
+
+def count_log_entries():
+    conn = get_connection()
+    with _lock:
+        return conn.execute("SELECT COUNT(*) FROM data_log").fetchone()[0]
+
+
+def load_log():
+    # إرجاع سجل العمليات بنفس أعمدة data_log.xlsx القديم
+    conn = get_connection()
+    with _lock:
+        df = pd.read_sql_query("SELECT * FROM data_log ORDER BY id", conn)
+    rename = dict(LOG_COLUMNS)
+    rename.update({col: f"SCOR - {phase}" for phase, col in PHASE_COLUMNS.items()})
+    return df.drop(columns=["id"]).rename(columns=rename)
+
+
+def log_export_header():
+    # نفس أعمدة load_log وبنفس الترتيب
+    return list(LOG_COLUMNS.values()) + [f"SCOR - {phase}" for phase in SCOR_PHASES]
+
+
+def iter_log_chunks(chunk_size=10_000, company=None, sector=None, country=None, date_from=None, date_to=None):
+    # قراءة السجل على دفعات بمفتاح id (keyset) للتصدير المتدفق - لا يُحمَّل السجل كاملًا في الذاكرة
+    # date_from / date_to بصيغة YYYY-MM-DD وكلاهما ضمن الفترة
+    filters = [(f"{col} = ?", value) for col, value in (("company", company), ("sector", sector), ("country", country))
+               if value is not None]
+    if date_from is not None:
+        filters.append(("created_at >= ?", str(date_from)))
+    if date_to is not None:
+        filters.append(("substr(created_at, 1, 10) <= ?", str(date_to)))
+    where = "".join(f" AND {condition}" for condition, _ in filters)
+    columns = ", ".join(list(LOG_COLUMNS) + [PHASE_COLUMNS[p] for p in SCOR_PHASES])
+    sql = f"SELECT id, {columns} FROM data_log WHERE id > ?{where} ORDER BY id LIMIT ?"
+    conn = get_connection()
+    after_id = 0
+    while True:
+        with _lock:
+            rows = conn.execute(sql, [after_id] + [value for _, value in filters] + [chunk_size]).fetchall()
+        if not rows:
+            return
+        after_id = rows[-1][0]
+        yield [row[1:] for row in rows]
+
+
+def load_aggregates(dimension):
+    # متوسطات القطاع/الدولة من الجدول المجمّع - O(عدد المجموعات) بدل المرور على كل السجل
+    conn = get_connection()
+    with _lock:
+        df = pd.read_sql_query(
+            "SELECT key, metric, total / n AS mean FROM log_aggregates WHERE dimension = ? ORDER BY key",
+            conn, params=(dimension,),
+        )
+    table = df.pivot(index="key", columns="metric", values="mean")
+    return table.reindex(columns=list(AGGREGATE_METRICS))
+
+
+def _compute_aggregates(conn):
+    rows = conn.execute(
+        "SELECT name, company, sector, country, created_at, iot_avg, cpm_score, status, method, "
+        "plan, source, make, deliver, return_score FROM data_log"
+    ).fetchall()
+    return _aggregate_rows(rows)
+
+
+def _rebuild_aggregates(conn):
+    fresh = _compute_aggregates(conn)
+    with conn:
+        conn.execute("DELETE FROM log_aggregates")
+        conn.executemany(_UPSERT_AGGREGATE_SQL, fresh)
+        conn.execute(_BUMP_LOG_VERSION_SQL)
+    return fresh
+
+
+def rebuild_aggregates(verify=True):
+    # إعادة حساب المجاميع من الصفر، مع مقارنة المجاميع الحالية بها قبل الاستبدال
+    conn = get_connection()
+    with _lock:
+        mismatches = []
+        if verify:
+            current = {
+                (d, k, m): (total, n)
+                for d, k, m, total, n in conn.execute("SELECT dimension, key, metric, total, n FROM log_aggregates")
+            }
+            expected = {(d, k, m): (total, n) for d, k, m, total, n in _compute_aggregates(conn)}
+            for group in current.keys() | expected.keys():
+                got, want = current.get(group), expected.get(group)
+                if got is None or want is None or got[1] != want[1] or abs(got[0] - want[0]) > 1e-6:
+                    mismatches.append((group, got, want))
+        _rebuild_aggregates(conn)
+    return mismatches
+
+
+# ======================= #
+#   صندوق الصادر (Webhook Outbox)
+# ======================= #
+# حالات الإرسال: pending (بانتظار موعده) ← sending ← delivered | failed
+# الجدول لا يغيّر store_version لأنه لا يؤثر على بيانات التقييمات أو السجل.
+def enqueue_delivery(url, payload, log_entry=None, endpoint=None):
+    # endpoint: مفتاح النظام الخارجي الذي يُحسب عليه حد الطلبات (webhook_outbox.endpoint_of)
+    conn = get_connection()
+    row = (
+        url,
+        endpoint or url,
+        json.dumps(payload, ensure_ascii=False, default=str),
+        json.dumps(log_entry, ensure_ascii=False, default=str) if log_entry is not None else None,
+        time.time(),
+        datetime.now().strftime("%Y-%m-%d %H:%M"),
+    )
+    with _lock:
+        with conn:
+            cur = conn.execute(
+                "INSERT INTO webhook_outbox (url, endpoint, payload, log_entry, next_attempt_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)", row,
+            )
+    return cur.lastrowid
+
+
+def due_deliveries(now=None, limit=100, per_endpoint=None):
+    # per_endpoint: أقصى عدد من الطلبات لكل نظام خارجي (نفس مفتاح حد التزامن في الموزّع)،
+    # والترتيب بالدور بين الأنظمة حتى لا يستهلك نظام واحد متأخر كل الدفعة ويؤخر باقي الأنظمة
+    conn = get_connection()
+    with _lock:
+        rows = conn.execute(
+            "SELECT id, url, endpoint, payload, log_entry, attempts FROM ("
+            "  SELECT id, url, COALESCE(endpoint, url) AS endpoint, payload, log_entry, attempts, next_attempt_at,"
+            "         ROW_NUMBER() OVER (PARTITION BY COALESCE(endpoint, url) ORDER BY next_attempt_at, id) AS turn"
+            "  FROM webhook_outbox WHERE status = 'pending' AND next_attempt_at <= ?"
+            ") WHERE ? IS NULL OR turn <= ? ORDER BY turn, next_attempt_at LIMIT ?",
+            (time.time() if now is None else now, per_endpoint, per_endpoint, limit),
+        ).fetchall()
+    return [
+        {"id": i, "url": url, "endpoint": endpoint, "payload": payload,
+         "log_entry": json.loads(entry) if entry else None, "attempts": n}
+        for i, url, endpoint, payload, entry, n in rows
+    ]
+
+
+def claim_delivery(delivery_id):
+    # ينقل الإرسال إلى sending - يعيد False إذا سبقه عامل آخر
+    conn = get_connection()
+    with _lock:
+        with conn:
+            cur = conn.execute(
+                "UPDATE webhook_outbox SET status = 'sending' WHERE id = ? AND status = 'pending'", (delivery_id,)
+            )
+    return cur.rowcount == 1
+
+
+def reschedule_delivery(delivery_id, attempts, next_attempt_at, error):
+    conn = get_connection()
+    with _lock:
+        with conn:
+            conn.execute(
+                "UPDATE webhook_outbox SET status = 'pending', attempts = ?, next_attempt_at = ?, last_error = ? "
+                "WHERE id = ?", (attempts, next_attempt_at, error, delivery_id),
+            )
+
+
+def finish_delivery(delivery_id, status, attempts, error=None):
+    conn = get_connection()
+    with _lock:
+        with conn:
+            conn.execute(
+                "UPDATE webhook_outbox SET status = ?, attempts = ?, last_error = ? WHERE id = ?",
+                (status, attempts, error, delivery_id),
+            )
+
+
+def reset_inflight_deliveries():
+    # بعد إعادة التشغيل: ما كان قيد الإرسال لحظة التوقف يعود إلى الانتظار
+    conn = get_connection()
+    with _lock:
+        with conn:
+            return conn.execute("UPDATE webhook_outbox SET status = 'pending' WHERE status = 'sending'").rowcount
+
+
+def delivery_status(delivery_ids):
+    conn = get_connection()
+    ids = list(delivery_ids)
+    if not ids:
+        return []
+    with _lock:
+        rows = conn.execute(
+            f"SELECT id, url, status, attempts, last_error, created_at FROM webhook_outbox "
+            f"WHERE id IN ({', '.join('?' * len(ids))}) ORDER BY id",
+            ids,
+        ).fetchall()
+    return [
+        {"id": i, "url": url, "status": status, "attempts": n, "last_error": error, "created_at": created}
+        for i, url, status, n, error, created in rows
+    ]
+
+
+def count_pending_deliveries():
+    conn = get_connection()
+    with _lock:
+        return conn.execute(
+            "SELECT COUNT(*) FROM webhook_outbox WHERE status IN ('pending', 'sending')"
+        ).fetchone()[0]
+
+
+# ======================= #
+#   الدفع المجمّع (Bulk push)
+# ======================= #
+def fetch_assessment_rows(after_id=0, limit=1000):
+    # قراءة على صفحات بمفتاح id (keyset) - لا OFFSET ولا تحميل الجدول كاملًا
+    conn = get_connection()
+    with _lock:
+        cur = conn.execute(
+            "SELECT * FROM assessments WHERE id > ? ORDER BY id LIMIT ?", (after_id, limit)
+        )
+        columns = [d[0] for d in cur.description]
+        return [dict(zip(columns, row)) for row in cur.fetchall()]
+
+
+def fetch_changed_rows(since_seq, max_id, after_id=0, limit=1000):
+    # التقييمات حتى max_id التي عُدّل محتواها بعد since_seq، على صفحات بمفتاح id
+    conn = get_connection()
+    with _lock:
+        cur = conn.execute(
+            "SELECT * FROM assessments WHERE change_seq > ? AND id > ? AND id <= ? ORDER BY id LIMIT ?",
+            (since_seq, after_id, max_id, limit),
+        )
+        columns = [d[0] for d in cur.description]
+        return [dict(zip(columns, row)) for row in cur.fetchall()]
+
+
+def change_seq():
+    # آخر رقم تعديل أُعطي لتقييم محفوظ
+    conn = get_connection()
+    with _lock:
+        return conn.execute("SELECT value FROM store_meta WHERE key = 'change_seq'").fetchone()[0]
+
+
+def push_high_water(endpoint):
+    return push_marks(endpoint)[0]
+
+
+def push_marks(endpoint):
+    # (آخر معرف أُرسل، آخر رقم تعديل فُحص) لهذا الرابط
+    conn = get_connection()
+    with _lock:
+        row = conn.execute(
+            "SELECT high_water_id, change_mark FROM push_marks WHERE endpoint = ?", (endpoint,)
+        ).fetchone()
+    return tuple(row) if row else (0, 0)
+
+
+def set_push_high_water(endpoint, high_water_id, change_mark=None):
+    # change_mark=None يُبقي رقم التعديل المحفوظ كما هو
+    conn = get_connection()
+    with _lock:
+        with conn:
+            conn.execute(
+                "INSERT INTO push_marks (endpoint, high_water_id, updated_at, change_mark) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (endpoint) DO UPDATE SET high_water_id = excluded.high_water_id, "
+                "updated_at = excluded.updated_at, change_mark = COALESCE(?, change_mark)",
+                (endpoint, high_water_id, datetime.now().strftime("%Y-%m-%d %H:%M"), change_mark or 0, change_mark),
+            )
+
+
+def load_push_digests(endpoint, first_id=None, last_id=None):
+    # بصمة آخر نسخة أُرسلت من كل تقييم إلى هذا الرابط، أو لمدى المعرفات [first_id, last_id] فقط
+    sql, params = "SELECT assessment_id, digest FROM push_state WHERE endpoint = ?", [endpoint]
+    if first_id is not None:
+        sql += " AND assessment_id BETWEEN ? AND ?"
+        params += [first_id, last_id]
+    conn = get_connection()
+    with _lock:
+        return dict(conn.execute(sql, params).fetchall())
+
+
+def record_pushed(endpoint, pairs):
+    # pairs: (assessment_id, digest) للتقييمات التي قبلها النظام الخارجي
+    conn = get_connection()
+    with _lock:
+        with conn:
+            conn.executemany(
+                "INSERT INTO push_state (endpoint, assessment_id, digest) VALUES (?, ?, ?) "
+                "ON CONFLICT (endpoint, assessment_id) DO UPDATE SET digest = excluded.digest",
+                [(endpoint, assessment_id, digest) for assessment_id, digest in pairs],
+            )
+
+
+# ======================= #
+#   ضغط البيانات المكررة
+# ======================= #
+def compact_assessments():
+    # أداة لمرة واحدة: حذف التقييمات المكررة التي خزّنها الحفظ عند كل إعادة تشغيل
+    # يُحتفظ بأقدم صف لكل محتوى. الصفوف القديمة تبقى بلا بصمة (NULL) لأن الإجابات غير مخزنة
+    # ولا يمكن إعادة بناء submission_hash منها
+    conn = get_connection()
+    with _lock:
+        rows = conn.execute(
+            f"SELECT id, {', '.join(_CONTENT_COLUMNS)} FROM assessments ORDER BY id"
+        ).fetchall()
+        seen = set()
+        duplicates = []
+        for row_id, *content in rows:
+            content = tuple(content)
+            if content in seen:
+                duplicates.append((row_id,))
+                continue
+            seen.add(content)
+        if duplicates:
+            with conn:
+                conn.executemany("DELETE FROM assessments WHERE id = ?", duplicates)
+                conn.execute("UPDATE store_meta SET value = value + 1 WHERE key = 'version'")
+        conn.execute("VACUUM")
+    return len(duplicates), len(rows) - len(duplicates)
+
+
+def compact_excel(path=LEGACY_BENCHMARK_XLSX):
+    # نفس الأداة لملف benchmark_data.xlsx القديم: الصفوف المتطابقة (عدا التاريخ) تُحذف
+    df = pd.read_excel(path)
+    subset = [col for col in df.columns if col != EXPORT_COLUMNS["created_at"]]
+    compacted = df.drop_duplicates(subset=subset, keep="first")
+    compacted.to_excel(path, index=False)
+    return len(df) - len(compacted), len(compacted)
+
+
+def export_to_excel(path=LEGACY_BENCHMARK_XLSX):
+    # Excel صيغة تصدير فقط وليس مصدر البيانات
+    load_assessments().to_excel(path, index=False)
+    return path
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "export":
+        out = export_to_excel(sys.argv[2] if len(sys.argv) > 2 else LEGACY_BENCHMARK_XLSX)
+        print(f"✅ تم التصدير إلى {out} ({count_assessments()} تقييم)")
+    elif len(sys.argv) > 1 and sys.argv[1] == "export-log":
+        out = sys.argv[2] if len(sys.argv) > 2 else LEGACY_LOG_XLSX
+        load_log().to_excel(out, index=False)
+        print(f"✅ تم تصدير السجل إلى {out} ({count_log_entries()} عملية)")
+    elif len(sys.argv) > 1 and sys.argv[1] == "rebuild-aggregates":
+        mismatches = rebuild_aggregates()
+        for group, got, want in mismatches:
+            print(f"⚠️ {group}: المخزَّن={got} المحسوب={want}")
+        print(f"✅ تمت إعادة بناء مجاميع القطاع/الدولة ({len(mismatches)} اختلاف)")
+    elif len(sys.argv) > 1 and sys.argv[1] == "compact":
+        if len(sys.argv) > 2:
+            removed, kept = compact_excel(sys.argv[2])
+            print(f"✅ تم ضغط {sys.argv[2]}: حُذف {removed} صف مكرر وبقي {kept}")
+        else:
+            removed, kept = compact_assessments()
+            print(f"✅ تم ضغط مخزن التقييمات: حُذف {removed} تقييم مكرر وبقي {kept}")
+    else:
+        print("الاستخدام: python assessment_store.py export|export-log [path.xlsx] | rebuild-aggregates | compact [path.xlsx]")
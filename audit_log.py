@@ -0,0 +1,139 @@
+# كاتب السجل في الخلفية (Write-behind) لسجل العمليات
+# صفحات الإرسال تضيف القيد إلى طابور وتعود فورًا،
+# وخيط واحد يجمع القيود ويكتبها دفعة واحدة عند بلوغ حجم أو مدة محددة.
+
+import atexit
+import queue
+import sys
+import threading
+import time
+
+import assessment_store
+
+# ======================= #
+#        الإعدادات
+# ======================= #
+FLUSH_SIZE = 50         # عدد القيود التي تستدعي الكتابة فورًا
+FLUSH_INTERVAL = 2.0    # أقصى مدة (ثوانٍ) يبقى فيها القيد في الذاكرة
+MAX_PENDING = 10_000    # أقصى عدد من القيود المحتفظ بها لإعادة المحاولة بعد فشل الكتابة
+
+_STOP = object()
+
+
+class LogWriter:
+    def __init__(self, sink=assessment_store.append_log_entries,
+                 flush_size=FLUSH_SIZE, flush_interval=FLUSH_INTERVAL, max_pending=MAX_PENDING):
+        self._sink = sink
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self.lost = 0           # عدد القيود التي أُسقطت ولم تُكتب أبدًا
+        self._queue = queue.Queue()
+        self._pending = []
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="scor-log-writer", daemon=True)
+        self._thread.start()
+
+    # --- واجهة الاستخدام ---
+    def enqueue(self, entry):
+        if self._closed:
+            raise RuntimeError("LogWriter is closed")
+        self._queue.put(dict(entry))
+
+    def flush(self, timeout=None):
+        # ينتظر حتى تُكتب كل القيود الموجودة في الطابور حاليًا
+        if self._closed:
+            # بعد close يكتب الخيط ما تبقى ثم ينتهي ولا يقرأ الطابور بعدها
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        done = threading.Event()
+        self._queue.put(done)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = 0.1 if deadline is None else min(0.1, max(deadline - time.monotonic(), 0))
+            if done.wait(wait):
+                return True
+            # close() من خيط آخر قد يسبق الحدث في الطابور فلا يُضبط أبدًا
+            if not self._thread.is_alive():
+                return done.is_set()
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+    def close(self, timeout=5.0):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    # --- خيط الكتابة ---
+    def _write_pending(self):
+        if not self._pending:
+            return
+        try:
+            self._sink(self._pending)
+            self._pending = []
+        except Exception as e:
+            # نُبقي القيود في الذاكرة ونعيد المحاولة في الدفعة التالية، بحد أقصى max_pending
+            print(f"⚠️ تعذر كتابة سجل العمليات: {e}", file=sys.stderr)
+            overflow = len(self._pending) - self._max_pending
+            if overflow > 0:
+                # تُسقط الأقدم أولًا حتى لا تنمو الذاكرة بلا حد أثناء تعطل القاعدة
+                del self._pending[:overflow]
+                self._report_lost(overflow)
+
+    def _report_lost(self, count):
+        self.lost += count
+        print(f"⚠️ فُقد {count} قيد من سجل العمليات (الإجمالي {self.lost})", file=sys.stderr)
+
+    def _run(self):
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                self._write_pending()
+                if self._pending:
+                    # المحاولة الأخيرة فشلت: لا توجد فرصة أخرى لكتابة هذه القيود
+                    self._report_lost(len(self._pending))
+                    self._pending = []
+                return
+            if isinstance(item, threading.Event):
+                self._write_pending()
+                item.set()
+            elif item is not None:
+                self._pending.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self._flush_interval
+
+            if len(self._pending) >= self._flush_size or (deadline is not None and time.monotonic() >= deadline):
+                self._write_pending()
+            if not self._pending:
+                deadline = None
+            elif deadline is not None and time.monotonic() >= deadline:
+                deadline = time.monotonic() + self._flush_interval
+
+
+# ======================= #
+#   كاتب واحد لكل عملية
+# ======================= #
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_log_writer():
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = LogWriter()
+            atexit.register(_writer.close)
+        return _writer
+
+
+def log_entry(entry):
+    # إضافة قيد إلى الطابور والعودة فورًا
+    get_log_writer().enqueue(entry)
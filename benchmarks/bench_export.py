@@ -0,0 +1,59 @@
+# مقارنة ذاكرة وزمن تصدير سجل العمليات: الطريقة القديمة (DataFrame + pd.ExcelWriter) مقابل التصدير المتدفق
+# كل قياس في عملية منفصلة حتى لا تتأثر الذروة بما قبله.
+# التشغيل من جذر المشروع: python -m benchmarks.bench_export [عدد الصفوف]
+
+import os
+import subprocess
+import sys
+import tempfile
+
+ROW = ("الاسم {i}", "شركة {c}", "التصنيع", "مصر", "2024-01-01 10:00", 3.5, 3.2, "نجاح", "JSON", 1.0, 2.0, 3.0, 4.0, 5.0)
+
+SEED = """
+import assessment_store
+conn = assessment_store.get_connection()
+row = {row!r}
+rows = (tuple(v.format(i=i, c=i % 500) if isinstance(v, str) else v for v in row) for i in range({n}))
+with conn:
+    conn.executemany(assessment_store._INSERT_LOG_SQL, rows)
+"""
+
+MEASURE = """
+import os, resource, time
+import exports
+# المكتبات تُستورد قبل القياس حتى تُقاس ذاكرة التصدير وحدها
+import pandas, pyarrow.parquet, xlsxwriter
+start = time.perf_counter()
+with exports.PeakMemory() as memory:
+    if {fmt!r} == "legacy":
+        from io import BytesIO
+        import pandas as pd
+        import assessment_store
+        buffer = BytesIO()
+        with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
+            assessment_store.load_log().to_excel(writer, index=False, sheet_name="Log")
+        size = len(buffer.getvalue())
+    else:
+        with exports.export_log({fmt!r}) as reader:
+            size = os.fstat(reader.fileno()).st_size
+print(f"{{'legacy Excel' if {fmt!r} == 'legacy' else {fmt!r}:<13}} {{time.perf_counter() - start:>8.1f}}s "
+      f"{{size / 1024 / 1024:>9.1f}} MB {{memory.growth / 1024 / 1024:>12.1f}} MB")
+"""
+
+
+def run(code, db_path):
+    env = dict(os.environ, SCOR_DB_PATH=db_path, PYTHONPATH=os.getcwd())
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+def main(n_rows=200_000):
+    db_path = os.path.join(tempfile.mkdtemp(), "bench_export.db")
+    run(SEED.format(row=ROW, n=n_rows), db_path)
+    print(f"rows: {n_rows:,}")
+    print(f"{'format':<13} {'time':>9} {'file':>12} {'memory growth':>15}")
+    for fmt in ["legacy", "Excel", "CSV", "Parquet"]:
+        run(MEASURE.format(fmt=fmt), db_path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
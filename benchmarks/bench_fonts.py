@@ -0,0 +1,120 @@
+# قياس خدمة الخطوط (font_service): زمن إنشاء التقرير وحجمه
+# FPDF: add_font بتحليل الخط لكل تقرير مقابل المقاييس المحفوظة في مجلد الذاكرة المؤقتة (font_service)،
+# مرة لإعادة بناء التقرير نفسه ومرة لتقارير مختلفة كلها (مستخدم مختلف في كل تقرير)،
+# reportlab: تحليل TTFont لكل تقرير مقابل التسجيل مرة واحدة. الحجم يُقارن بحجم ملف الخط كاملًا.
+# التشغيل من جذر المشروع: python -m benchmarks.bench_fonts [عدد التقارير]
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+from io import BytesIO
+from itertools import count
+
+import font_service
+
+NAMES = ["سها ناصر", "أحمد علي", "مريم حسن", "يوسف خالد", "ليلى سعيد", "عمر فاروق", "نور الهدى", "خالد منصور"]
+_unique = count()
+
+
+def report_lines(name="سها ناصر"):
+    return [
+        "📄 تقرير الاستراتيجية الكاملة",
+        f"المستخدم: {name}",
+        "IFE: 2.85 | EFE: 3.10",
+        "BCG Region: Star",
+        "IE Matrix Region: Grow & Build",
+    ]
+
+
+def unique_lines():
+    # اسم مختلف في كل تقرير، فتختلف مجموعة الحروف المستخدمة ولا يُستفاد من الخطوط المقتطعة المحفوظة
+    i = next(_unique)
+    return report_lines(f"{NAMES[i % len(NAMES)]} {NAMES[(i // len(NAMES)) % len(NAMES)]} {i}")
+
+
+def fpdf_legacy(cache_mode):
+    import fpdf
+    import fpdf.fpdf as fpdf_module
+
+    fpdf_module.FPDF_CACHE_MODE = cache_mode
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    pdf.add_font(font_service.FONT_NAME, "", font_service.FONT_PATH, uni=True)
+    pdf.set_font(font_service.FONT_NAME, "", 14)
+    for line in font_service.pdf_texts(report_lines()):
+        pdf.cell(200, 10, txt=line, ln=True)
+    return pdf.output(dest="S").encode("latin-1")
+
+
+def fpdf_service(lines=None):
+    pdf = font_service.new_fpdf(14)
+    pdf.add_page()
+    for line in font_service.pdf_texts(lines or report_lines()):
+        pdf.cell(200, 10, txt=line, ln=True)
+    return pdf.output(dest="S").encode("latin-1")
+
+
+def reportlab_build(font_name):
+    from reportlab.pdfgen import canvas
+
+    buffer = BytesIO()
+    c = canvas.Canvas(buffer)
+    c.setFont(font_name, 14)
+    y = 800
+    for line in font_service.pdf_texts(report_lines()):
+        c.drawRightString(550, y, line)
+        y -= 30
+    c.save()
+    return buffer.getvalue()
+
+
+def reportlab_legacy():
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    pdfmetrics.registerFont(TTFont("AmiriLegacy", font_service.FONT_PATH))
+    return reportlab_build("AmiriLegacy")
+
+
+def reportlab_service():
+    return reportlab_build(font_service.register_reportlab_font())
+
+
+def measure(name, build, n):
+    times, sizes = [], []
+    for _ in range(n):
+        start = time.perf_counter()
+        sizes.append(len(build()))
+        times.append(time.perf_counter() - start)
+    print(f"{name:<24} {statistics.median(times) * 1000:8.2f} ms {max(times) * 1000:9.2f} ms "
+          f"{statistics.mean(sizes) / 1024:9.1f} KB")
+    return statistics.median(times), statistics.mean(sizes)
+
+
+def main(n_reports=100):
+    # تحميل المكتبات وتشكيل النصوص خارج القياس
+    font_service.FONT_CACHE_DIR = tempfile.mkdtemp()
+    fpdf_legacy(1)
+    reportlab_legacy()
+    font_size = os.path.getsize(font_service.FONT_PATH)
+    print(f"reports: {n_reports} | font file: {font_size / 1024:.0f} KB")
+    print(f"{'':<24} {'median':>11} {'max':>12} {'size':>12}")
+
+    legacy_parse, _ = measure("fpdf add_font (no cache)", lambda: fpdf_legacy(1), n_reports)
+    fpdf_service()
+    service, fpdf_size = measure("fpdf font_service", fpdf_service, n_reports)
+    unique, _ = measure("fpdf font_service (new)", lambda: fpdf_service(unique_lines()), n_reports)
+    rl_legacy, _ = measure("reportlab TTFont/report", reportlab_legacy, n_reports)
+    rl_service, rl_size = measure("reportlab font_service", reportlab_service, n_reports)
+
+    print(f"fpdf speedup: {legacy_parse / service:.1f}x vs parse ({legacy_parse / unique:.1f}x for all-new reports) | "
+          f"reportlab speedup: {rl_legacy / rl_service:.1f}x")
+    print(f"embedded subset: fpdf {fpdf_size / font_size:.1%}, reportlab {rl_size / font_size:.1%} of the font file")
+    if max(fpdf_size, rl_size) >= font_size:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,68 @@
+# مقارنة تقرير PDF لسجل العمليات: الطريقة القديمة (FPDF، خلية لكل صف والمستند كاملًا في الذاكرة)
+# مقابل log_report (reportlab، صفحةً صفحة من مكرر صفوف إلى ملف) لعدة أحجام، مع الزمن والحجم وذروة الذاكرة.
+# كل قياس في عملية منفصلة حتى لا تتأثر الذروة بما قبله.
+# التشغيل من جذر المشروع: python -m benchmarks.bench_log_pdf [أقصى عدد صفوف]
+
+import os
+import subprocess
+import sys
+import tempfile
+
+ROW = ("الاسم {i}", "شركة {c}", "التصنيع", "مصر", "2024-01-01 10:00", 3.5, 3.2, "نجاح", "JSON", 1.0, 2.0, 3.0, 4.0, 5.0)
+
+SEED = """
+import assessment_store
+conn = assessment_store.get_connection()
+row = {row!r}
+rows = (tuple(v.format(i=i, c=i % 500) if isinstance(v, str) else v for v in row) for i in range({n}))
+with conn:
+    conn.executemany(assessment_store._INSERT_LOG_SQL, rows)
+"""
+
+MEASURE = """
+import os, tempfile, time
+import exports, font_service, log_report
+# الخط والمكتبات تُحمَّل قبل القياس حتى تُقاس ذاكرة بناء التقرير وحدها
+font_service.register_reportlab_font()
+import fpdf, pandas, arabic_reshaper, bidi.algorithm, reportlab.pdfgen.canvas
+start = time.perf_counter()
+with exports.PeakMemory() as memory:
+    if {mode!r} == "legacy":
+        import log_loader
+        df = log_loader.load_log().head({n})
+        pdf = font_service.new_fpdf(12)
+        pdf.add_page()
+        for line in font_service.pdf_texts(
+            f"{{c}} - {{d}} - {{s}}" for c, d, s in zip(df["الشركة"], df["التاريخ"], df["حالة العملية"])
+        ):
+            pdf.cell(200, 10, txt=line, ln=True)
+        size = len(pdf.output(dest="S").encode("latin-1"))
+        rows, pages = len(df), pdf.page
+    else:
+        with tempfile.TemporaryFile() as fp:
+            rows, pages = log_report.write_log_pdf(fp, log_report.iter_log_rows({n}))
+            size = fp.tell()
+seconds = time.perf_counter() - start
+print(f"{{{mode!r}:<10}} {{rows:>9,}} {{pages:>7,}} {{seconds:>8.1f}}s {{size / 1024 / 1024:>9.1f}} MB "
+      f"{{memory.growth / 1024 / 1024:>10.1f}} MB {{rows / seconds:>10,.0f}}")
+"""
+
+
+def run(code, db_path):
+    env = dict(os.environ, SCOR_DB_PATH=db_path, PYTHONPATH=os.getcwd())
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+def main(n_rows=100_000):
+    db_path = os.path.join(tempfile.mkdtemp(), "bench_log_pdf.db")
+    run(SEED.format(row=ROW, n=n_rows), db_path)
+    print(f"{'mode':<10} {'rows':>9} {'pages':>7} {'time':>9} {'file':>12} {'memory':>13} {'rows/s':>10}")
+    # FPDF القديم يبني كل الصفحات في الذاكرة، فيُقاس حتى 20 ألف صف فقط
+    for n in sorted({min(n_rows, 10_000), min(n_rows, 20_000)}):
+        run(MEASURE.format(mode="legacy", n=n), db_path)
+    for n in sorted({min(n_rows, 10_000), n_rows // 2, n_rows}):
+        run(MEASURE.format(mode="reportlab", n=n), db_path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,95 @@
+# قياس طابور تقارير PDF (report_jobs) مقابل الرسم المتزامن داخل معالج الإرسال
+# يُرسل N طلب تقرير مختلف من خيوط متزامنة (كأنهم N مستخدمين يضغطون زر الحساب معًا)، ويُقاس زمن عودة
+# الإرسال وزمن جاهزية كل التقارير، ثم تُعاد الطلبات نفسها لقياس الإصابة في الذاكرة وفي مجلد الذاكرة المؤقتة.
+# التشغيل من جذر المشروع: python -m benchmarks.bench_reports [عدد الطلبات] [عدد العمال]
+
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import report_jobs
+
+
+def report_html(i):
+    scores = [(i * 7 + k * 13) % 101 for k in range(5)]
+    rows = "".join(
+        f"<tr><td>{label}</td><td>{score}</td></tr>"
+        for label, score in zip(["الخطة", "المصدر", "الصنع", "التوصيل", "الإرجاع"], scores)
+    )
+    return f"""
+    <style>body {{ font-family: Amiri; }}</style>
+    <h1>تقرير تقييم جاهزية الذكاء الاصطناعي</h1>
+    <p><strong>اسم الشركة:</strong> شركة {i}</p>
+    <table border='1' cellpadding='5' cellspacing='0'><tr><th>العنصر</th><th>الدرجة</th></tr>{rows}</table>
+    <br><p><strong>التقييم النهائي:</strong> {sum(scores) / 5:.1f} / 100</p>
+    """
+
+
+def wait_all(queue, keys, timeout=600):
+    deadline = time.monotonic() + timeout
+    while any(queue.status(key) in ("pending", "running") for key in keys):
+        if time.monotonic() > deadline:
+            raise TimeoutError("reports not ready")
+        time.sleep(0.01)
+
+
+def concurrent_submit(queue, htmls):
+    # يعيد (المفاتيح، أزمنة عودة الإرسال)
+    def one(html):
+        start = time.perf_counter()
+        key = queue.submit(html)
+        return key, time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=len(htmls)) as pool:
+        results = list(pool.map(one, htmls))
+    return [key for key, _ in results], [seconds for _, seconds in results]
+
+
+def main(n_requests=20, workers=report_jobs.REPORT_WORKERS):
+    htmls = [report_html(i) for i in range(n_requests)]
+
+    # الأساس: كل طلب ينتظر رسمه المتزامن (السلوك السابق)، بعد رسم واحد للإحماء
+    report_jobs.render_pdf(htmls[0])
+    start = time.perf_counter()
+    sizes = [len(report_jobs.render_pdf(html)) for html in htmls]
+    sync_elapsed = time.perf_counter() - start
+    print(f"sync:   {n_requests} reports in {sync_elapsed:.2f}s ({n_requests / sync_elapsed:.1f} reports/s) | "
+          f"each request blocked ~{sync_elapsed / n_requests * 1000:.0f} ms | avg size {statistics.mean(sizes) / 1024:.1f} KB")
+
+    cache_dir = tempfile.mkdtemp()
+    queue = report_jobs.ReportQueue(workers=workers, cache_dir=cache_dir)
+    # إحماء العمال (استيراد xhtml2pdf) خارج القياس
+    wait_all(queue, [queue.submit(report_html(-1))])
+
+    start = time.perf_counter()
+    keys, latencies = concurrent_submit(queue, htmls)
+    submitted = time.perf_counter() - start
+    wait_all(queue, keys)
+    pool_elapsed = time.perf_counter() - start
+    failed = [key for key in keys if queue.status(key) != "done"]
+    print(f"queue:  {n_requests} reports in {pool_elapsed:.2f}s ({n_requests / pool_elapsed:.1f} reports/s, "
+          f"{workers} workers) | submit p50 {statistics.median(latencies) * 1000:.2f} ms, "
+          f"max {max(latencies) * 1000:.2f} ms | all submitted after {submitted * 1000:.1f} ms | failed {len(failed)}")
+
+    start = time.perf_counter()
+    keys, _ = concurrent_submit(queue, htmls)
+    hits = sum(queue.result(key) is not None for key in keys)
+    print(f"memory: {hits}/{n_requests} served in {(time.perf_counter() - start) * 1000:.1f} ms")
+    queue.close()
+
+    # طابور جديد (كأن الخادم أُعيد تشغيله): التقارير تُقرأ من مجلد الذاكرة المؤقتة دون رسم
+    queue = report_jobs.ReportQueue(workers=workers, cache_dir=cache_dir)
+    start = time.perf_counter()
+    keys, _ = concurrent_submit(queue, htmls)
+    hits = sum(queue.result(key) is not None for key in keys)
+    print(f"disk:   {hits}/{n_requests} served in {(time.perf_counter() - start) * 1000:.1f} ms")
+    queue.close()
+
+    if failed or hits != n_requests:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
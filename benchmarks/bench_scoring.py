@@ -0,0 +1,32 @@
+# قياس أداء محرك التقييم على عدد كبير من التقييمات العشوائية
+# التشغيل من جذر المشروع: python -m benchmarks.bench_scoring [عدد التقييمات]
+
+import sys
+import time
+
+import numpy as np
+
+import question_bank
+import scoring_engine
+
+
+def main(n_rows=500_000):
+    bank = question_bank.load_question_bank()
+    question_phases = bank.phase_of_questions()
+    rng = np.random.default_rng(0)
+    answers = rng.integers(1, 6, size=(n_rows, len(question_phases))).astype(float)
+    iot = rng.uniform(1, 5, size=n_rows)
+    ife, efe = rng.uniform(1, 4, size=n_rows), rng.uniform(1, 4, size=n_rows)
+
+    start = time.perf_counter()
+    scored = scoring_engine.score_assessments(answers, question_phases, iot=iot)
+    regions = scoring_engine.ie_regions(ife, efe)
+    elapsed = time.perf_counter() - start
+
+    print(f"rows: {n_rows:,} | questions: {len(question_phases)} | phases: {len(scored['phases'])}")
+    print(f"scoring time: {elapsed:.3f}s ({n_rows / elapsed:,.0f} rows/s)")
+    print(f"sample: {scored['swot'][0].tolist()} | {scored['bcg'][0].tolist()} | {regions[0]}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,58 @@
+# قياس تكلفة تشكيل النص العربي لكل تقرير قبل الكاش وبعده
+# التشغيل من جذر المشروع: python -m benchmarks.bench_shaping [عدد التقارير]
+
+import sys
+import time
+
+import arabic_reshaper
+from bidi.algorithm import get_display
+
+import arabic_text
+
+PHASES = ["📘 التخطيط", "📗 التوريد", "📙 التصنيع", "📕 التوزيع", "📒 المرتجعات"]
+STRATEGIES = [
+    "💼 استراتيجية النمو والفرص (Growth Strategy)",
+    "🔄 استراتيجية التحول والتحسين (Turnaround Strategy)",
+    "🛡️ استراتيجية الدفاع (Defensive Strategy)",
+    "⚠️ استراتيجية البقاء والنجاة (Survival Strategy)",
+]
+
+
+def report_lines(i):
+    # أسطر تقرير نموذجي: تسميات ثابتة تتكرر + قيم تختلف بين التقارير
+    return [
+        "📄 تقرير الاستراتيجية الكاملة",
+        f"📄 تقرير الشركة: شركة {i % 50}",
+        "الدولة: مصر",
+        "القطاع: التصنيع",
+        f"BCG Region: {STRATEGIES[i % 4]}",
+        *PHASES,
+        *STRATEGIES,
+    ]
+
+
+def uncached(lines):
+    return [get_display(arabic_reshaper.reshape(line)) for line in lines]
+
+
+def main(n_reports=500):
+    reports = [report_lines(i) for i in range(n_reports)]
+
+    start = time.perf_counter()
+    for lines in reports:
+        uncached(lines)
+    before = (time.perf_counter() - start) / n_reports
+
+    arabic_text.shape.cache_clear()
+    start = time.perf_counter()
+    for lines in reports:
+        arabic_text.shape_many(lines)
+    after = (time.perf_counter() - start) / n_reports
+
+    print(f"reports: {n_reports} | lines per report: {len(reports[0])}")
+    print(f"before: {before * 1000:.3f} ms/report")
+    print(f"after:  {after * 1000:.3f} ms/report ({before / after:.1f}x) | {arabic_text.cache_info()}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,75 @@
+# قياس زمن بدء تشغيل المنصة وتفصيل زمن استيراد كل وحدة (python -X importtime)
+# التشغيل من جذر المشروع: python -m benchmarks.bench_startup [--budget-ms 3000] [--top 15] [--output importtime.txt]
+# يفشل (exit 1) إذا تجاوز زمن البدء الميزانية، فيمكن استخدامه في CI لرصد أي استيراد ثقيل جديد.
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+DEFAULT_BUDGET_MS = float(os.environ.get("SCOR_STARTUP_BUDGET_MS", 3000))
+ENTRY_POINT = "scor_ai_platform.py"
+
+
+def parse_importtime(stderr):
+    # أسطر importtime: "import time: self [us] | cumulative | imported package"
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        # الإزاحة بعد المسافة الأولى تدل على عمق الاستيراد
+        rows.append((name.rstrip()[1:], int(self_us), int(cumulative_us)))
+    return rows
+
+
+def top_level(rows):
+    # الوحدات المستوردة مباشرة (بدون إزاحة) هي ما يدفعه البدء فعليًا
+    return [(name, self_us, cum) for name, self_us, cum in rows if not name.startswith(" ")]
+
+
+def measure(entry_point=ENTRY_POINT):
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", entry_point],
+        capture_output=True, text=True, env=env,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr[-2000:])
+        raise SystemExit(f"{entry_point} exited with code {proc.returncode}")
+    return wall_ms, proc.stderr
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup time budget for the SCOR platform")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--output", help="write the full importtime breakdown to this file")
+    args = parser.parse_args()
+
+    wall_ms, stderr = measure()
+    rows = parse_importtime(stderr)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(stderr)
+
+    print(f"{'module':<40} {'self ms':>9} {'cumulative ms':>14}")
+    for name, self_us, cum_us in sorted(top_level(rows), key=lambda r: r[2], reverse=True)[:args.top]:
+        print(f"{name.strip():<40} {self_us / 1000:>9.1f} {cum_us / 1000:>14.1f}")
+
+    imports_ms = sum(cum for _, _, cum in top_level(rows)) / 1000
+    heavy = [name for name in ("pandas", "plotly.express", "fpdf", "reportlab") if any(r[0].strip() == name for r in rows)]
+    print(f"\nimports: {imports_ms:.0f} ms | wall: {wall_ms:.0f} ms | budget: {args.budget_ms:.0f} ms")
+    print(f"heavy modules loaded at startup: {', '.join(heavy) or 'none'}")
+
+    if wall_ms > args.budget_ms:
+        print(f"FAIL: startup exceeded budget by {wall_ms - args.budget_ms:.0f} ms")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
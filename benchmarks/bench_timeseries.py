@@ -0,0 +1,47 @@
+# قياس حجم رسم تحليل الأداء الزمني قبل وبعد التقليص (LTTB) لسجل طويل لشركة واحدة
+# التشغيل من جذر المشروع: python -m benchmarks.bench_timeseries [عدد التقييمات]
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import timeseries
+
+
+def synthetic_log(n_rows):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "الشركة": "شركة النيل",
+        "التاريخ": pd.date_range("2015-01-01", periods=n_rows, freq="h"),
+    })
+    for col in timeseries.SERIES:
+        df[col] = np.clip(3 + np.cumsum(rng.normal(0, 0.05, n_rows)) % 2, 1, 5)
+    return df
+
+
+def main(n_rows=100_000):
+    df = synthetic_log(n_rows)
+
+    start = time.perf_counter()
+    entry = timeseries._build_index(df)["شركة النيل"]
+    index_time = time.perf_counter() - start
+
+    raw = {col: (entry["x"], y) for col, y in entry["series"].items()}
+    raw_bytes = timeseries.payload_size(timeseries.build_figure(raw))
+
+    start = time.perf_counter()
+    series = timeseries.downsample(entry)
+    fig = timeseries.build_figure(series)
+    downsample_time = time.perf_counter() - start
+    small_bytes = timeseries.payload_size(fig)
+
+    print(f"rows: {n_rows:,} | series: {len(series)} | target points: {timeseries.DEFAULT_TARGET_POINTS}")
+    print(f"index: {index_time * 1000:.1f} ms | downsample + figure: {downsample_time * 1000:.1f} ms")
+    print(f"payload: {raw_bytes / 1024:,.0f} KB raw -> {small_bytes / 1024:,.0f} KB downsampled "
+          f"({raw_bytes / small_bytes:,.0f}x smaller)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,82 @@
+# قياس صندوق الصادر (webhook_outbox) أمام خادم HTTP محلي بديل عن ERP/Odoo
+# الخادم يرد بخطأ 503 على نسبة من الطلبات ويتأخر قليلًا في كل رد، فيُختبر
+# إعادة المحاولة والتأخير الأُسّي وحد التزامن لكل نظام دون أي اتصال خارجي.
+# التشغيل من جذر المشروع: python -m benchmarks.bench_webhook [عدد الطلبات]
+
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import assessment_store
+import webhook_outbox
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    failure_rate = 0.3
+    latency = 0.01
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+    received = 0
+
+    def do_POST(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            json.loads(body)
+            time.sleep(cls.latency)
+            code = 503 if random.random() < cls.failure_rate else 200
+            if code == 200:
+                with cls.lock:
+                    cls.received += 1
+            self.send_response(code)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+def main(n_requests=200):
+    random.seed(0)
+    assessment_store.DB_PATH = os.path.join(tempfile.mkdtemp(), "bench_webhook.db")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/webhook"
+
+    results = {}
+    dispatcher = webhook_outbox.WebhookDispatcher(
+        backoff=lambda attempts: webhook_outbox.backoff_delay(attempts, base=0.01, cap=0.1),
+        on_result=lambda delivery, status: results.__setitem__(delivery["id"], status),
+    )
+    start = time.perf_counter()
+    ids = [dispatcher.submit(url, {"company": f"شركة {i}", "CPM": i % 5}) for i in range(n_requests)]
+    drained = dispatcher.drain(timeout=60)
+    elapsed = time.perf_counter() - start
+    dispatcher.close()
+    server.shutdown()
+
+    rows = webhook_outbox.status(ids)
+    delivered = sum(r["status"] == "delivered" for r in rows)
+    retries = sum(r["attempts"] - 1 for r in rows)
+    print(f"requests: {n_requests} | delivered: {delivered} | failed: {n_requests - delivered} | retries: {retries}")
+    print(f"elapsed: {elapsed:.2f}s ({n_requests / elapsed:,.0f} deliveries/s) | drained: {drained}")
+    print(f"server received: {StandInHandler.received} | peak concurrency: {StandInHandler.peak} "
+          f"(limit {webhook_outbox.PER_ENDPOINT_LIMIT})")
+    if StandInHandler.peak > webhook_outbox.PER_ENDPOINT_LIMIT or len(results) != n_requests:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
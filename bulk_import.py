@@ -0,0 +1,188 @@
+# استيراد مجمّع لإجابات الاستبيان (CSV / XLSX) من الاستبيانات الميدانية وملفات الشركاء
+# يُقرأ الملف على دفعات، وتُوزَّع الدفعات على ProcessPoolExecutor للتقييم،
+# ثم تُضاف النتائج إلى مخزن التقييمات بنفس شكل الحفظ من الواجهة.
+#
+# الاستخدام:
+#   python bulk_import.py answers.csv [--chunk-size 5000] [--workers 4]
+#
+# أعمدة الملف:
+#   الاسم، الشركة، القطاع، الدولة، التاريخ (اختياري)
+#   سؤال لكل عمود: مفتاح المنزلق (مثل Plan_0) أو نص السؤال بالعربية
+#   IoT 1 .. IoT 4 (أسئلة IoT الأربعة) أو عمود "متوسط IoT" جاهز
+# الصفوف المحفوظة مسبقًا (نفس المستخدم والإجابات) لا تُضاف مرة أخرى عند إعادة الاستيراد.
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+import assessment_store
+import question_bank
+import scoring_engine
+
+USER_COLUMNS = {"name": "الاسم", "company": "الشركة", "sector": "القطاع", "country": "الدولة"}
+IOT_COLUMNS = ["IoT 1", "IoT 2", "IoT 3", "IoT 4"]
+IOT_AVG_COLUMN = "متوسط IoT"
+
+
+# ======================= #
+#     قراءة الملف على دفعات
+# ======================= #
+def iter_chunks(path, chunk_size):
+    if path.lower().endswith(".csv"):
+        yield from pd.read_csv(path, chunksize=chunk_size)
+        return
+
+    # openpyxl في وضع القراءة فقط يقرأ الصفوف تدريجيًا دون تحميل الملف كاملًا
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = [str(h) if h is not None else "" for h in next(rows)]
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= chunk_size:
+                yield pd.DataFrame(batch, columns=header)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=header)
+    finally:
+        wb.close()
+
+
+def answer_columns(columns, bank):
+    # ربط كل سؤال بعمود في الملف (بالمفتاح أو بالنص)، مع التحقق من أعمدة IoT
+    # قبل تقييم أي دفعة، وذكر كل الأعمدة الناقصة في رسالة واحدة
+    mapping, missing = [], []
+    for q in bank.questions:
+        if q.key in columns:
+            mapping.append(q.key)
+        elif q.text in columns:
+            mapping.append(q.text)
+        else:
+            missing.append(f"{q.key} / {q.text}")
+    if not all(c in columns for c in IOT_COLUMNS) and IOT_AVG_COLUMN not in columns:
+        missing.append(f"{' / '.join(c for c in IOT_COLUMNS if c not in columns)} (أو {IOT_AVG_COLUMN})")
+    if missing:
+        raise ValueError("أعمدة غير موجودة في الملف: " + "، ".join(missing))
+    return mapping
+
+
+# ======================= #
+#     التقييم (داخل العامل)
+# ======================= #
+def score_chunk(answers, iot_answers, question_phases, phases):
+    # تعمل داخل عملية منفصلة - تعيد المتوسطات ومتوسط IoT لكل صف
+    _, means = scoring_engine.phase_means(answers, question_phases, phases)
+    iot_avg = iot_answers.mean(axis=1) if iot_answers.ndim == 2 else iot_answers
+    return means, iot_avg
+
+
+def _answer_value(value):
+    # المنزلقات في الواجهة تعيد أعدادًا صحيحة، فتُحوَّل 3.0 إلى 3 لتتطابق البصمة مع الإرسال من الواجهة
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def _submission_keys(users, answers, answer_keys, iot, iot_keys):
+    # بصمة كل صف بنفس submission_hash المستخدمة في الواجهة: إعادة استيراد الملف نفسه لا تكرر الصفوف
+    keys = []
+    for user, row, iot_row in zip(users, answers, iot):
+        values = dict(zip(answer_keys, map(_answer_value, row)))
+        values.update(zip(iot_keys, map(_answer_value, iot_row)))
+        keys.append(assessment_store.submission_hash(user, values))
+    return keys
+
+
+def _prepare(chunk, columns, answer_keys):
+    answers = chunk[columns].to_numpy(dtype=float)
+    if all(c in chunk.columns for c in IOT_COLUMNS):
+        iot = chunk[IOT_COLUMNS].to_numpy(dtype=float)
+        iot_keys = [f"iot_{i}" for i in range(1, len(IOT_COLUMNS) + 1)]
+        iot_rows = iot
+    else:
+        iot = chunk[IOT_AVG_COLUMN].to_numpy(dtype=float)
+        iot_keys = [IOT_AVG_COLUMN]
+        iot_rows = iot.reshape(-1, 1)
+    users = [
+        {key: ("" if pd.isna(rec.get(label)) else str(rec.get(label))) for key, label in USER_COLUMNS.items()}
+        for rec in chunk.to_dict("records")
+    ]
+    if "التاريخ" in chunk.columns:
+        # التواريخ الفارغة (NaN/NaT) تبقى None فيُستخدم وقت الاستيراد بدل النص "nan"
+        col = chunk["التاريخ"]
+        dates = col.astype(str).where(col.notna(), None).tolist()
+    else:
+        dates = [None] * len(chunk)
+    keys = _submission_keys(users, answers, answer_keys, iot_rows, iot_keys)
+    return answers, iot, users, dates, keys
+
+
+def _store(users, dates, keys, means, iot_avg, phases):
+    rows = [
+        (user, iot, scoring_engine.results_dict(phases, row), date, key)
+        for user, date, key, row, iot in zip(users, dates, keys, means, iot_avg)
+    ]
+    return assessment_store.append_assessments(rows)
+
+
+# ======================= #
+#        التشغيل
+# ======================= #
+def run_import(path, chunk_size=5000, workers=None):
+    bank = question_bank.load_question_bank()
+    question_phases, phases = bank.phase_of_questions(), bank.phases
+    answer_keys = [q.key for q in bank.questions]
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * 2     # حد أقصى للدفعات في الذاكرة مهما كان حجم الملف
+
+    total = 0
+    start = time.perf_counter()
+    pending = []
+    columns = None
+
+    def drain(limit):
+        nonlocal total
+        while len(pending) > limit:
+            future, users, dates, keys = pending.pop(0)
+            means, iot_avg = future.result()
+            total += _store(users, dates, keys, means, iot_avg, phases)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in iter_chunks(path, chunk_size):
+            if columns is None:
+                columns = answer_columns(chunk.columns, bank)
+            answers, iot, users, dates, keys = _prepare(chunk, columns, answer_keys)
+            future = pool.submit(score_chunk, answers, iot, question_phases, phases)
+            pending.append((future, users, dates, keys))
+            drain(max_in_flight)
+        drain(0)
+
+    elapsed = time.perf_counter() - start
+    return total, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="استيراد مجمّع لإجابات استبيان SCOR")
+    parser.add_argument("path", help="ملف CSV أو XLSX")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    try:
+        total, elapsed = run_import(args.path, args.chunk_size, args.workers)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    rate = total / elapsed if elapsed else 0
+    print(f"✅ تم استيراد {total:,} تقييم في {elapsed:.2f} ثانية ({rate:,.0f} صف/ثانية)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+# دفع مجمّع للتقييمات المخزنة إلى ERP / BI عبر Webhook (Odoo، Power BI ...)
+# تُقرأ التقييمات على صفحات وتُرسل على دفعات (NDJSON أو مصفوفة JSON) عبر عدد محدود من الطلبات المتزامنة،
+# ويُحفظ لكل رابط حد أعلى (high-water mark) وآخر رقم تعديل فُحص وبصمة كل تقييم أُرسل، فلا يقرأ التشغيل التالي
+# إلا التقييمات بعد الحد الأعلى والتي عُدّلت بعد آخر تشغيل، ولا يرسل منها إلا ما تغيّرت بصمته.
+#
+# الاستخدام:
+#   python bulk_push.py https://erp.example.com/webhook [--format ndjson|json] [--batch-size 500] [--concurrency 4]
+#   python bulk_push.py URL --new-only      # التقييمات بعد الحد الأعلى فقط (بدون فحص التعديلات)
+#   python bulk_push.py URL --dry-run       # عرض ما سيُرسل دون إرسال
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import assessment_store
+import webhook_outbox
+
+MAX_ATTEMPTS = 3
+CONTENT_TYPES = {"ndjson": "application/x-ndjson; charset=utf-8", "json": "application/json; charset=utf-8"}
+
+
+# ======================= #
+#     تجهيز السجلات
+# ======================= #
+def to_record(row):
+    # نفس شكل export_data في صفحة مقارنة الشركات
+    return {
+        "id": row["id"],
+        "user": {key: row[key] for key in ("name", "company", "sector", "country")},
+        "created_at": row["created_at"],
+        "IoT_score": row["iot_avg"],
+        "SCOR_scores": {phase: row[col] for phase, col in assessment_store.PHASE_COLUMNS.items()},
+    }
+
+
+def record_digest(record):
+    encoded = json.dumps(record, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def encode_batch(records, fmt):
+    if fmt == "ndjson":
+        lines = [json.dumps(r, ensure_ascii=False, default=str) for r in records]
+        return ("\n".join(lines) + "\n").encode("utf-8")
+    return json.dumps(records, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def _iter_pages(endpoint, fetch, check_digests, scanned=None):
+    # يولّد (record, digest) للصفوف التي تختلف بصمتها عن آخر نسخة أُرسلت، صفحةً صفحة
+    after_id = None
+    while rows := fetch(after_id):
+        digests = (assessment_store.load_push_digests(endpoint, rows[0]["id"], rows[-1]["id"])
+                   if check_digests else {})
+        for row in rows:
+            record = to_record(row)
+            digest = record_digest(record)
+            if digests.get(row["id"]) != digest:
+                yield record, digest
+        after_id = rows[-1]["id"]
+        if scanned is not None:
+            scanned["last_id"] = after_id
+
+
+def iter_changed(endpoint, page_size, new_only=False, scanned=None):
+    # يولّد (record, digest, is_new) لكل تقييم لم يصل بنسخته الحالية إلى هذا الرابط
+    # لا يُقرأ الجدول كاملًا: فقط ما عُدّل حتى الحد الأعلى بعد آخر رقم تعديل فُحص، ثم ما بعد الحد الأعلى
+    # scanned (اختياري): قاموس يُحدَّث فيه "last_id" بآخر معرف تمت قراءته و "change_seq" برقم التعديل الذي فُحص حتى
+    high_water, change_mark = assessment_store.push_marks(endpoint)
+    if not new_only:
+        # يُقرأ قبل الفحص: التعديلات التي تحدث أثناء التشغيل تبقى للتشغيل التالي
+        current_seq = assessment_store.change_seq()
+        changed = _iter_pages(
+            endpoint,
+            lambda after_id: assessment_store.fetch_changed_rows(change_mark, high_water, after_id or 0, page_size),
+            check_digests=True,
+        )
+        for record, digest in changed:
+            yield record, digest, False
+        if scanned is not None:
+            scanned["change_seq"] = current_seq
+
+    # بعد الحد الأعلى قد توجد تقييمات وصلت في تشغيل سابق فشلت فيه دفعة قبلها، فالبصمة هي الحكم
+    fresh = _iter_pages(
+        endpoint,
+        lambda after_id: assessment_store.fetch_assessment_rows(high_water if after_id is None else after_id, page_size),
+        check_digests=not new_only,
+        scanned=scanned,
+    )
+    for record, digest in fresh:
+        yield record, digest, True
+
+
+def iter_batches(items, batch_size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# ======================= #
+#     إرسال دفعة واحدة
+# ======================= #
+def send_batch(session, url, batch_no, body, fmt, timeout):
+    import requests
+
+    start = time.perf_counter()
+    error = None
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            response = session.post(url, data=body, headers={"Content-Type": CONTENT_TYPES[fmt]}, timeout=timeout)
+            if 200 <= response.status_code < 300:
+                return {"batch": batch_no, "ok": True, "attempts": attempt, "error": None,
+                        "seconds": time.perf_counter() - start}
+            error = f"HTTP {response.status_code}"
+            if response.status_code < 500 and response.status_code != 429:
+                break
+        except requests.RequestException as e:
+            error = f"{type(e).__name__}: {e}"
+        if attempt < MAX_ATTEMPTS:
+            time.sleep(webhook_outbox.backoff_delay(attempt))
+    return {"batch": batch_no, "ok": False, "attempts": attempt, "error": error,
+            "seconds": time.perf_counter() - start}
+
+
+# ======================= #
+#        التشغيل
+# ======================= #
+def run_push(url, fmt="ndjson", batch_size=500, concurrency=4, new_only=False, dry_run=False,
+             timeout=(webhook_outbox.CONNECT_TIMEOUT, webhook_outbox.READ_TIMEOUT), report=print):
+    high_water = assessment_store.push_high_water(url)
+    max_in_flight = concurrency * 2     # حد أقصى للدفعات الجاهزة في الذاكرة
+    stats = {"records": 0, "new": 0, "changed": 0, "bytes": 0, "batches": 0, "failed_batches": 0, "failed_records": 0}
+    max_sent_id = high_water
+    scanned = {"last_id": high_water, "change_seq": None}
+    first_failed_new_id = None
+    failed_changed = False
+    pending = []
+    start = time.perf_counter()
+
+    def collect(limit):
+        nonlocal first_failed_new_id, failed_changed
+        while len(pending) > limit:
+            future, batch, size = pending.pop(0)
+            result = future.result()
+            status = "✅" if result["ok"] else f"❌ {result['error']}"
+            report(f"  دفعة {result['batch']}: {len(batch)} سجل | {size / 1024:,.1f} KB | "
+                   f"{result['seconds']:.2f}s | محاولات {result['attempts']} | {status}")
+            if result["ok"]:
+                assessment_store.record_pushed(url, [(record["id"], digest) for record, digest, _ in batch])
+            else:
+                stats["failed_batches"] += 1
+                stats["failed_records"] += len(batch)
+                new_ids = [record["id"] for record, _, is_new in batch if is_new]
+                failed_changed = failed_changed or len(new_ids) < len(batch)
+                if new_ids:
+                    first = min(new_ids)
+                    first_failed_new_id = first if first_failed_new_id is None else min(first_failed_new_id, first)
+
+    session = webhook_outbox.make_session(concurrency)
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            changed = iter_changed(url, batch_size, new_only, scanned)
+            for batch_no, batch in enumerate(iter_batches(changed, batch_size), 1):
+                body = encode_batch([record for record, _, _ in batch], fmt)
+                stats["batches"] += 1
+                stats["records"] += len(batch)
+                stats["bytes"] += len(body)
+                for record, _, is_new in batch:
+                    stats["new" if is_new else "changed"] += 1
+                    max_sent_id = max(max_sent_id, record["id"])
+                if dry_run:
+                    continue
+                pending.append((pool.submit(send_batch, session, url, batch_no, body, fmt, timeout), batch, len(body)))
+                collect(max_in_flight)
+            collect(0)
+    finally:
+        session.close()
+
+    # الحد الأعلى يتقدم فقط حتى أول تقييم جديد فشل إرساله، فيُعاد إرساله في التشغيل التالي،
+    # وبدون فشل يصل إلى آخر تقييم تمت قراءته (ما لم يُرسل منه كان قد وصل بنسخته الحالية).
+    # رقم التعديل لا يتقدم إذا فشلت دفعة فيها تقييمات معدّلة، فتُفحص من جديد في التشغيل التالي
+    if not dry_run:
+        if first_failed_new_id is None:
+            new_high_water = max(max_sent_id, scanned["last_id"])
+        else:
+            new_high_water = max(high_water, first_failed_new_id - 1)
+        change_mark = None if failed_changed else scanned["change_seq"]
+        assessment_store.set_push_high_water(url, new_high_water, change_mark)
+        stats["high_water"] = new_high_water
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="دفع مجمّع للتقييمات إلى ERP/BI عبر Webhook")
+    parser.add_argument("url", help="رابط Webhook")
+    parser.add_argument("--format", choices=sorted(CONTENT_TYPES), default="ndjson")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--new-only", action="store_true", help="إرسال ما بعد الحد الأعلى فقط")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    stats = run_push(args.url, args.format, args.batch_size, args.concurrency, args.new_only, args.dry_run)
+    seconds = stats["seconds"] or 1e-9
+    icon = "🔎" if args.dry_run else ("⚠️" if stats["failed_batches"] else "✅")
+    print(f"{icon} {stats['records']:,} تقييم ({stats['new']:,} جديد، {stats['changed']:,} معدّل) "
+          f"في {stats['batches']:,} دفعة | {stats['bytes'] / 1024 / 1024:,.2f} MB | {seconds:.2f} ثانية "
+          f"({stats['records'] / seconds:,.0f} سجل/ثانية، {stats['bytes'] / 1024 / 1024 / seconds:,.2f} MB/ثانية)")
+    if "high_water" in stats:
+        print(f"   الحد الأعلى الجديد: {stats['high_water']}")
+    if stats["failed_batches"]:
+        print(f"❌ فشلت {stats['failed_batches']} دفعة ({stats['failed_records']:,} تقييم) وستُعاد في التشغيل التالي",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
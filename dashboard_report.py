@@ -0,0 +1,64 @@
+# تقرير PDF للوحة التحكم الرئيسية (reportlab) - يُنشأ عند الطلب فقط
+# التقرير يُبنى في الذاكرة ويُخزَّن في كاش LRU مفتاحه بصمة مدخلات التقرير،
+# فلا يُكتب ملف مشترك على القرص تتسابق عليه الجلسات المتزامنة.
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+import font_service
+
+MAX_CACHED_REPORTS = 32
+
+_lock = threading.Lock()
+_cache = OrderedDict()
+
+
+def report_key(company, country, sector, results, iot_avg, cpm_score):
+    payload = json.dumps(
+        [company, country, sector, results, iot_avg, cpm_score],
+        ensure_ascii=False, sort_keys=True, default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def build_dashboard_pdf(company, country, sector, results, iot_avg, cpm_score):
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import A4
+
+    scor_avg = round(sum(results.values()) / len(results), 2) if results else 0
+
+    buffer = BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4)
+    y = 800
+    # Helvetica لا يحتوي على الحروف العربية: Amiri مسجل مرة واحدة لكل عملية
+    c.setFont(font_service.register_reportlab_font(), 14)
+    for bidi_text in font_service.pdf_texts([
+        f"📄 تقرير الشركة: {company}",
+        f"الدولة: {country}",
+        f"القطاع: {sector}",
+        f"متوسط SCOR: {scor_avg}",
+        f"متوسط IoT: {iot_avg}",
+        f"نتيجة CPM: {cpm_score}"
+    ]):
+        c.drawRightString(550, y, bidi_text)
+        y -= 30
+    c.save()
+    return buffer.getvalue()
+
+
+def get_dashboard_pdf(company, country, sector, results, iot_avg, cpm_score):
+    key = report_key(company, country, sector, results, iot_avg, cpm_score)
+    with _lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+    pdf_bytes = build_dashboard_pdf(company, country, sector, results, iot_avg, cpm_score)
+    with _lock:
+        _cache[key] = pdf_bytes
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_CACHED_REPORTS:
+            _cache.popitem(last=False)
+    return pdf_bytes
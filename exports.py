@@ -0,0 +1,253 @@
+# بناء ملفات التصدير (JSON / Excel) عند الطلب فقط
+# الصفحات تمرر لزر التحميل دالة مؤجلة بدل البيانات الجاهزة، فلا تُبنى الملفات إلا عند الضغط،
+# وتُحفظ آخر نسخة لكل نوع في كاش الجلسة حسب بصمة البيانات.
+
+import csv
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+import threading
+import time
+from io import BytesIO
+
+EXPORT_CHUNK_ROWS = 10_000
+XLSX_MAX_ROWS = 1_048_575      # حد Excel لعدد الصفوف في الورقة (بدون صف العناوين)
+
+# الصيغ المتاحة للتصدير المتدفق: (الامتداد، نوع MIME)
+EXPORT_FORMATS = {
+    "Excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+_stats_lock = threading.Lock()
+_export_stats = {}
+
+
+def payload_key(data):
+    encoded = json.dumps(data, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+# ======================= #
+#        البناة
+# ======================= #
+def build_json(data):
+    # بيانات الصفحة صغيرة (قاموس واحد): تُرمَّز مرة واحدة عند الطلب
+    return json.dumps(data, ensure_ascii=False, indent=2, default=str).encode("utf-8")
+
+
+def write_excel(data, fp, sheet_name):
+    import pandas as pd
+
+    with pd.ExcelWriter(fp, engine="xlsxwriter") as writer:
+        pd.DataFrame([data]).to_excel(writer, sheet_name=sheet_name, index=False)
+
+
+def build_excel(data, sheet_name="Dashboard"):
+    buffer = BytesIO()
+    write_excel(data, buffer, sheet_name)
+    return buffer.getvalue()
+
+
+# ======================= #
+#   تصدير متدفق للجداول الكبيرة
+# ======================= #
+# الصفوف تصل على دفعات (قائمة صفوف لكل دفعة) وتُكتب مباشرة إلى ملف مؤقت:
+# xlsxwriter في وضع constant_memory يكتب كل صف ويحرره، و CSV و Parquet يُكتبان دفعةً دفعة.
+def export_formats():
+    # Parquet يحتاج pyarrow، ويُخفى من الخيارات إذا لم تكن مثبتة
+    return [fmt for fmt in EXPORT_FORMATS if fmt != "Parquet" or importlib.util.find_spec("pyarrow")]
+
+
+def write_xlsx_stream(path, sheets):
+    # sheets: [(اسم الورقة، العناوين، دفعات الصفوف)] - ما يتجاوز حد Excel يُكمل في ورقة تالية
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+    rows = 0
+    for sheet_name, header, chunks in sheets:
+        part = 1
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, header)
+        row_no = 1
+        for chunk in chunks:
+            for row in chunk:
+                if row_no > XLSX_MAX_ROWS:
+                    part += 1
+                    worksheet = workbook.add_worksheet(f"{sheet_name} ({part})")
+                    worksheet.write_row(0, 0, header)
+                    row_no = 1
+                worksheet.write_row(row_no, 0, row)
+                row_no += 1
+                rows += 1
+    workbook.close()
+    return rows
+
+
+def write_csv_stream(path, header, chunks):
+    # utf-8-sig حتى يفتح Excel الملف بالعربية بشكل صحيح
+    rows = 0
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for chunk in chunks:
+            writer.writerows(chunk)
+            rows += len(chunk)
+    return rows
+
+
+def write_parquet_stream(path, header, chunks, numeric=()):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(col, pa.float64() if col in numeric else pa.string()) for col in header])
+    rows = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for chunk in chunks:
+            columns = list(zip(*chunk))
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(columns, schema)], schema=schema
+            ))
+            rows += len(chunk)
+    return rows
+
+
+def _rss():
+    # ذاكرة العملية الحالية (RSS) بالبايت - متاحة على Linux فقط
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class PeakMemory:
+    # يأخذ عينة من RSS كل بضع أجزاء من الثانية في خيط جانبي ويحتفظ بالذروة
+    # (tracemalloc أدق لكنه يبطئ كتابة Excel عدة مرات)
+    def __init__(self, interval=0.02):
+        self.interval = interval
+        self.start = self.peak = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, _rss())
+
+    def __enter__(self):
+        self.start = self.peak = _rss()
+        if self.start is not None:
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self.peak = max(self.peak, _rss())
+
+    @property
+    def growth(self):
+        return None if self.start is None else self.peak - self.start
+
+
+def temp_export(suffix, write):
+    # write(path) يكتب الملف في ملف مؤقت، ويُعاد (نتيجة write، قارئ BufferedReader للملف) دون تحميله في الذاكرة.
+    # الملف يُحذف من القرص عند إغلاق القارئ (أو عند تحريره)، و st.download_button يقبل القارئ مباشرة
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    try:
+        result = write(path)
+        flags = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_TEMPORARY", 0)
+        reader = os.fdopen(os.open(path, flags), "rb")
+    except BaseException:
+        os.remove(path)
+        raise
+    if not hasattr(os, "O_TEMPORARY"):
+        # على POSIX يبقى المحتوى متاحًا للقارئ المفتوح بعد حذف الاسم
+        os.remove(path)
+    return result, reader
+
+
+def stream_export(fmt, header, chunks, kind, numeric=(), sheet_name="Sheet1"):
+    # يكتب الملف في ملف مؤقت ويعيد قارئًا له، ويسجل عدد الصفوف والحجم والزمن وذروة الذاكرة
+    def write(path):
+        if fmt == "Excel":
+            return write_xlsx_stream(path, [(sheet_name, header, chunks)])
+        if fmt == "CSV":
+            return write_csv_stream(path, header, chunks)
+        return write_parquet_stream(path, header, chunks, numeric)
+
+    start = time.perf_counter()
+    with PeakMemory() as memory:
+        rows, reader = temp_export(f".{EXPORT_FORMATS[fmt][0]}", write)
+    record_stats(kind, {
+        "format": fmt, "rows": rows, "bytes": os.fstat(reader.fileno()).st_size,
+        "seconds": time.perf_counter() - start,
+        # الزيادة في ذاكرة العملية أثناء كتابة الملف (المحتوى نفسه يبقى على القرص)
+        "peak_bytes": memory.growth, "rss_bytes": memory.peak,
+    })
+    return reader
+
+
+def record_stats(kind, stats):
+    with _stats_lock:
+        _export_stats[kind] = stats
+
+
+def export_stats(kind):
+    with _stats_lock:
+        return _export_stats.get(kind)
+
+
+def export_log(fmt, kind="log", chunk_size=EXPORT_CHUNK_ROWS, **filters):
+    # تصدير سجل العمليات مباشرة من المخزن (company / sector / country اختيارية)
+    import assessment_store
+
+    header = assessment_store.log_export_header()
+    numeric = {"متوسط IoT", "نتيجة CPM"} | {col for col in header if col.startswith("SCOR - ")}
+    chunks = assessment_store.iter_log_chunks(chunk_size, **filters)
+    return stream_export(fmt, header, chunks, kind, numeric=numeric, sheet_name="Log")
+
+
+def frame_chunks(df, chunk_size=EXPORT_CHUNK_ROWS):
+    # DataFrame صغير إلى دفعات صفوف، مع تحويل القيم الفارغة (NaN) إلى None
+    for start in range(0, len(df), chunk_size):
+        part = df.iloc[start:start + chunk_size].astype(object)
+        yield part.where(part.notna(), None).values.tolist()
+
+
+def build_sheets_excel(sheets):
+    # عدة أوراق من DataFrames صغيرة في ملف واحد (constant_memory أيضًا)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "export.xlsx")
+        write_xlsx_stream(path, [(name, [str(c) for c in df.columns], frame_chunks(df)) for name, df in sheets])
+        with open(path, "rb") as f:
+            return f.read()
+
+
+def format_stats(stats):
+    memory = ("غير متاحة" if stats["peak_bytes"] is None
+              else f"+{stats['peak_bytes'] / 1024 / 1024:,.1f} MB (الذروة {stats['rss_bytes'] / 1024 / 1024:,.0f} MB)")
+    return (f"📦 آخر تصدير ({stats['format']}): {stats['rows']:,} صف | {stats['bytes'] / 1024 / 1024:,.2f} MB | "
+            f"{stats['seconds']:.2f} ثانية | ذاكرة التصدير {memory}")
+
+
+def lazy_export(session_cache, kind, builder, data, **kwargs):
+    # تعيد دالة بدون معاملات تُستدعى عند الضغط على زر التحميل فقط
+    # session_cache قاموس من st.session_state يحتفظ بآخر ملف لكل نوع (kind)
+    # البصمة تُحسب عند الضغط أيضًا وليس مع كل إعادة تشغيل للصفحة
+    def produce():
+        key = payload_key(data)
+        cached = session_cache.get(kind)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        payload = builder(data, **kwargs)
+        session_cache[kind] = (key, payload)
+        return payload
+
+    return produce
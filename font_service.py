@@ -0,0 +1,113 @@
+# خدمة الخطوط لتقارير PDF (FPDF / reportlab / xhtml2pdf)
+# ملف Amiri-Regular.ttf يُحلَّل مرة واحدة: مقاييس FPDF تُحفظ في مجلد ذاكرة مؤقتة (FONT_CACHE_DIR) عبر add_font
+# نفسها دون كتابة ملف .pkl بجانب الخط، والخط يُسجَّل في reportlab مرة واحدة لكل عملية.
+# كلتا المكتبتين تضمّن في ملف PDF الحروف المستخدمة فقط (subset) وليس الخط كاملًا.
+
+import os
+import threading
+import warnings
+from contextlib import contextmanager
+from functools import lru_cache
+
+import arabic_text
+
+# ======================= #
+#        الإعدادات
+# ======================= #
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FONT_NAME = "Amiri"
+FONT_PATH = os.path.join(BASE_DIR, "Amiri-Regular.ttf")
+FONT_CACHE_DIR = os.environ.get("SCOR_FONT_CACHE_DIR", ".font_cache")
+
+_lock = threading.Lock()
+_reportlab_registered = False
+
+
+def _bmp_only(text):
+    # خط Amiri لا يحتوي على الرموز التعبيرية (خارج BMP) و FPDF يفشل عند مصادفتها
+    return "".join(ch for ch in str(text) if ord(ch) <= 0xFFFF).strip()
+
+
+def pdf_text(text):
+    # نص جاهز للرسم بخط Amiri: بدون رموز تعبيرية ومشكَّل من اليمين إلى اليسار
+    return arabic_text.shape(_bmp_only(text))
+
+
+def pdf_texts(texts):
+    return arabic_text.shape_many(_bmp_only(t) for t in texts)
+
+
+# ======================= #
+#          FPDF
+# ======================= #
+@contextmanager
+def _quiet_cmap():
+    # جدول cmap في Amiri يحتوي على إزاحات سالبة يتجاهلها FPDF أصلًا، فلا داعي لتحذير مع كل تقرير.
+    # التجاهل محصور في تحليل الخط وإخراجه فقط، وباقي العملية ترى التحذيرات كما هي
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="cmap value too big/small", module="fpdf.ttfonts")
+        yield
+
+
+def _use_fpdf_cache():
+    # add_font يحفظ المقاييس المحللة (ومعها عروض الحروف) في FONT_CACHE_DIR بأسماء مشتقة من مسار الخط
+    # ويقرؤها منه بعد ذلك، بدل ملف .pkl بجانب الخط (FPDF_CACHE_MODE=0) أو التحليل مع كل تقرير
+    import fpdf
+
+    os.makedirs(FONT_CACHE_DIR, exist_ok=True)
+    fpdf.set_global("FPDF_CACHE_MODE", 2)
+    fpdf.set_global("FPDF_CACHE_DIR", FONT_CACHE_DIR)
+
+
+@lru_cache(maxsize=None)
+def report_fpdf_class():
+    # FPDF كما هو (add_font و output العامّتان)، مع حصر تجاهل تحذير cmap فيهما.
+    # FPDF يضمّن بنفسه الحروف المستخدمة فقط (subset) عند الإخراج
+    import fpdf
+
+    class ReportFPDF(fpdf.FPDF):
+        def add_font(self, family, style="", fname="", uni=False):
+            with _quiet_cmap():
+                return super().add_font(family, style, fname, uni)
+
+        def output(self, name="", dest=""):
+            with _quiet_cmap():
+                return super().output(name, dest)
+
+    return ReportFPDF
+
+
+def new_fpdf(size=14):
+    _use_fpdf_cache()
+    pdf = report_fpdf_class()()
+    pdf.add_font(FONT_NAME, "", FONT_PATH, uni=True)
+    pdf.set_font(FONT_NAME, "", size)
+    return pdf
+
+
+# ======================= #
+#   reportlab / xhtml2pdf
+# ======================= #
+def register_reportlab_font():
+    # تسجيل TTF مرة واحدة لكل عملية، ثم يُستخدم الاسم "Amiri" في canvas.setFont و CSS
+    global _reportlab_registered
+    with _lock:
+        if _reportlab_registered:
+            return FONT_NAME
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+
+        pdfmetrics.registerFont(TTFont(FONT_NAME, FONT_PATH))
+        # لا يوجد Amiri عريض في المشروع: العناوين و<strong> تُرسم بالخط نفسه
+        pdfmetrics.registerFontFamily(FONT_NAME, normal=FONT_NAME, bold=FONT_NAME,
+                                      italic=FONT_NAME, boldItalic=FONT_NAME)
+        _reportlab_registered = True
+        return FONT_NAME
+
+
+def register_xhtml2pdf_font():
+    from xhtml2pdf import default
+
+    register_reportlab_font()
+    default.DEFAULT_FONT[FONT_NAME.lower()] = FONT_NAME
+    return FONT_NAME
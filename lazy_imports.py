@@ -0,0 +1,28 @@
+# استيراد مؤجل للمكتبات الثقيلة (pandas, plotly, fpdf, ...)
+# الوحدة لا تُحمَّل فعليًا إلا عند أول استخدام لإحدى خصائصها،
+# فلا تدفع الصفحات ولا بدء التشغيل ثمن مكتبات لا تحتاجها.
+
+import importlib.util
+import sys
+import threading
+
+_lock = threading.Lock()
+
+
+def lazy_import(name):
+    with _lock:
+        if name in sys.modules:
+            return sys.modules[name]
+        # الوحدة الأم تُستورد مباشرة (مثل plotly لـ plotly.express) ثم يُؤجَّل تنفيذ الوحدة المطلوبة
+        parent = name.rpartition(".")[0]
+        if parent:
+            importlib.import_module(parent)
+        spec = importlib.util.find_spec(name)
+        if spec is None:
+            raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+        loader = importlib.util.LazyLoader(spec.loader)
+        spec.loader = loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        loader.exec_module(module)
+        return module
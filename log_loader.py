@@ -0,0 +1,47 @@
+# محمّل مشترك لسجل العمليات مع كاش على مستوى العملية (مشترك بين كل الجلسات)
+# يُقرأ السجل ويُحوَّل مرة واحدة، ولا يُعاد تحميله إلا عند تغيّر عداد إصدار السجل.
+
+import threading
+
+import assessment_store
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+NUMERIC_COLUMNS = ["متوسط IoT", "نتيجة CPM"] + [f"SCOR - {p}" for p in assessment_store.SCOR_PHASES]
+
+_lock = threading.Lock()
+_cache = {"version": None, "df": None}
+_stats = {"hits": 0, "misses": 0}
+
+
+def _parse(df):
+    # تحويل الأنواع مرة واحدة: التاريخ إلى datetime والدرجات إلى أرقام
+    df["التاريخ"] = pd.to_datetime(df["التاريخ"], errors="coerce")
+    for col in NUMERIC_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df
+
+
+def load_log():
+    # يعيد DataFrame مشتركًا بين الجلسات: لا تعدّل عليه مباشرة (استخدم copy أو فلترة)
+    version = assessment_store.log_version()
+    with _lock:
+        if _cache["df"] is not None and _cache["version"] == version:
+            _stats["hits"] += 1
+            return _cache["df"]
+        _stats["misses"] += 1
+    df = _parse(assessment_store.load_log())
+    with _lock:
+        _cache.update(version=version, df=df)
+    return df
+
+
+def cache_stats():
+    with _lock:
+        return dict(_stats)
+
+
+def clear_cache():
+    with _lock:
+        _cache.update(version=None, df=None)
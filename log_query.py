@@ -0,0 +1,76 @@
+# طبقة استعلام لسجل العمليات (لوحة تحكم المشرف)
+# أعمدة التصفية تُرمَّز كفئات (Categorical) ويُبنى لكل قيمة فهرس صفوفها مرة واحدة لكل إصدار من السجل،
+# فتصبح التصفية تقاطع فهارس جاهزة بدل أقنعة منطقية على السجل كاملًا، ويُعرض الجدول صفحةً صفحة.
+
+import threading
+
+import numpy as np
+
+import assessment_store
+import log_loader
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+FILTER_COLUMNS = ("الشركة", "القطاع", "الدولة")
+
+_lock = threading.Lock()
+_cache = {"version": None, "index": None}
+
+
+class LogIndex:
+    def __init__(self, df):
+        self.df = df
+        self.codes = {}
+        self.categories = {}
+        self._rows = {}
+        for col in FILTER_COLUMNS:
+            cat = pd.Categorical(df[col])
+            codes = np.asarray(cat.codes)
+            # ترتيب الصفوف حسب الرمز ثم تقسيمها: فهرس كل قيمة شريحة متجاورة من order
+            order = np.argsort(codes, kind="stable")
+            bounds = np.searchsorted(codes[order], np.arange(len(cat.categories) + 1))
+            self.codes[col] = codes
+            self.categories[col] = list(cat.categories)
+            self._rows[col] = {
+                value: order[bounds[i]:bounds[i + 1]] for i, value in enumerate(cat.categories)
+            }
+
+    def __len__(self):
+        return len(self.df)
+
+    def values(self, column):
+        return self.categories[column]
+
+    def select(self, **filters):
+        # filters: {العمود: القيمة} والقيمة None تعني بدون تصفية - يعيد مواقع الصفوف مرتبة
+        selected = [self._rows[col].get(value, np.empty(0, dtype=np.int64))
+                    for col, value in filters.items() if value is not None]
+        if not selected:
+            return np.arange(len(self.df))
+        # التقاطع يبدأ بأصغر فهرس فتقل المقارنات
+        selected.sort(key=len)
+        rows = selected[0]
+        for other in selected[1:]:
+            rows = np.intersect1d(rows, other, assume_unique=True)
+        return np.sort(rows)
+
+    def frame(self, rows, columns=None):
+        df = self.df if columns is None else self.df[columns]
+        return df.iloc[rows]
+
+    def page(self, rows, page_no, page_size):
+        # page_no يبدأ من 1 - يعيد صفوف الصفحة فقط
+        start = (page_no - 1) * page_size
+        return self.frame(rows[start:start + page_size])
+
+
+def log_index():
+    version = assessment_store.log_version()
+    with _lock:
+        if _cache["index"] is not None and _cache["version"] == version:
+            return _cache["index"]
+    index = LogIndex(log_loader.load_log())
+    with _lock:
+        _cache.update(version=version, index=index)
+    return index
@@ -0,0 +1,218 @@
+# تقرير PDF لسجل العمليات يُرسم صفحةً صفحة بـ reportlab من مكرر صفوف
+# الصفوف تُقرأ من المخزن دفعةً دفعة، وكل صفحة تُغلق بـ showPage فور امتلائها. reportlab يضمّن خط Amiri
+# مقتطعًا للحروف المستخدمة فقط، والنص العربي يُشكَّل قبل الرسم (font_service.pdf_text).
+# التقرير يُنشأ عند الضغط على زر التحميل فقط، مع حد أقصى لعدد الصفوف وفترة زمنية اختيارية،
+# ويُكتب إلى ملف مؤقت يُعاد قارئًا له (exports.temp_export) فلا يُحمَّل الملف الناتج في الذاكرة.
+
+import os
+import time
+from datetime import datetime
+
+import assessment_store
+import exports
+import font_service
+
+# ======================= #
+#        الإعدادات
+# ======================= #
+PAGE_WIDTH, PAGE_HEIGHT = 842, 595      # A4 أفقي (نقطة)
+MARGIN = 28
+FONT_SIZE = 8
+TITLE_SIZE = 13
+ROW_HEIGHT = 14
+CELL_PADDING = 3
+DEFAULT_MAX_ROWS = 10_000
+MAX_ROWS_LIMIT = 100_000
+CHUNK_ROWS = 2_000
+_CELL_CACHE_SIZE = 4096        # القيم المتكررة (الشركات، الحالات) فقط تستفيد منه
+
+# الأعمدة من اليمين إلى اليسار: (عنوان العمود، الوزن النسبي للعرض، رقمي؟)
+# بنفس ترتيب assessment_store.log_export_header
+COLUMNS = [
+    ("الاسم", 1.5, False),
+    ("الشركة", 1.5, False),
+    ("القطاع", 1.1, False),
+    ("الدولة", 1.0, False),
+    ("التاريخ", 1.3, False),
+    ("IoT", 0.55, True),
+    ("CPM", 0.55, True),
+    ("الحالة", 0.8, False),
+    ("الطريقة", 0.8, False),
+] + [(phase, 0.6, True) for phase in assessment_store.SCOR_PHASES]
+
+
+def _number(value):
+    if value is None or value == "":
+        return ""
+    try:
+        return f"{float(value):.2f}".rstrip("0").rstrip(".")
+    except (TypeError, ValueError):
+        return str(value)
+
+
+# ======================= #
+#    جدول على reportlab
+# ======================= #
+class LogTableCanvas:
+    def __init__(self, fp, columns, title, subtitle=""):
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+        from reportlab.pdfgen import canvas
+
+        self._font = font_service.register_reportlab_font()
+        self._string_width = stringWidth
+        self._canvas = canvas.Canvas(fp, pagesize=(PAGE_WIDTH, PAGE_HEIGHT), pageCompression=1)
+        self._canvas.setTitle(title)
+        self._cell_cache = {}
+        self._y = None
+        self._top = None
+        self.rows = 0
+        self.pages = 0
+
+        usable = PAGE_WIDTH - 2 * MARGIN
+        total = sum(weight for _, weight, _ in columns)
+        self._columns = []
+        right = PAGE_WIDTH - MARGIN
+        for label, weight, numeric in columns:
+            width = usable * weight / total
+            self._columns.append((label, right - width, width, numeric))
+            right -= width
+        self._edges = [PAGE_WIDTH - MARGIN] + [left for _, left, _, _ in self._columns]
+        self._title = title
+        self._subtitle = subtitle
+
+    # --- النص ---
+    def _fit(self, text, max_width, size=FONT_SIZE):
+        # النص بعد التشكيل وعرضه، ويُختصر بـ "…" إن تجاوز عرض الخلية
+        key = (text, max_width, size)
+        cached = self._cell_cache.get(key)
+        if cached is not None:
+            return cached
+        shaped = font_service.pdf_text(text)
+        width = self._string_width(shaped, self._font, size)
+        logical = text
+        while width > max_width and logical:
+            logical = logical[:-1]
+            shaped = font_service.pdf_text(logical + "…")
+            width = self._string_width(shaped, self._font, size)
+        if len(self._cell_cache) >= _CELL_CACHE_SIZE:
+            self._cell_cache.clear()
+        self._cell_cache[key] = result = (shaped, width)
+        return result
+
+    def _cell_text(self, text, left, width, y, numeric):
+        if not text:
+            return
+        shaped, text_width = self._fit(text, width - 2 * CELL_PADDING)
+        if numeric:
+            self._canvas.drawString(left + (width - text_width) / 2, y, shaped)
+        else:
+            self._canvas.drawString(left + width - CELL_PADDING - text_width, y, shaped)
+
+    # --- الصفحات ---
+    def _start_page(self):
+        c = self._canvas
+        top = PAGE_HEIGHT - MARGIN
+        if self.pages == 0:
+            shaped, _ = self._fit(self._title, PAGE_WIDTH - 2 * MARGIN, TITLE_SIZE)
+            c.setFont(self._font, TITLE_SIZE)
+            c.drawRightString(PAGE_WIDTH - MARGIN, top - TITLE_SIZE, shaped)
+            top -= TITLE_SIZE + 6
+            if self._subtitle:
+                shaped, _ = self._fit(self._subtitle, PAGE_WIDTH - 2 * MARGIN)
+                c.setFont(self._font, FONT_SIZE)
+                c.drawRightString(PAGE_WIDTH - MARGIN, top - FONT_SIZE - 2, shaped)
+                top -= FONT_SIZE + 8
+        c.setFont(self._font, FONT_SIZE)
+        # صف العناوين
+        self._top = top
+        self._y = top - ROW_HEIGHT
+        c.setFillColorRGB(0.82, 0.88, 0.95)
+        c.rect(MARGIN, self._y, PAGE_WIDTH - 2 * MARGIN, ROW_HEIGHT, stroke=0, fill=1)
+        c.setFillGray(0)
+        for label, left, width, numeric in self._columns:
+            self._cell_text(label, left, width, self._y + 4, numeric)
+        # رقم الصفحة في التذييل
+        c.drawCentredString(PAGE_WIDTH / 2, MARGIN / 2, self._fit(f"صفحة {self.pages + 1}", PAGE_WIDTH)[0])
+
+    def _finish_page(self):
+        # خطوط الجدول ثم إغلاق الصفحة
+        c = self._canvas
+        rows = round((self._top - self._y) / ROW_HEIGHT)
+        c.setStrokeGray(0.6)
+        c.setLineWidth(0.4)
+        c.grid(self._edges, [self._top - i * ROW_HEIGHT for i in range(rows + 1)])
+        c.showPage()
+        self.pages += 1
+        self._y = None
+
+    def add_row(self, values):
+        if self._y is None:
+            self._start_page()
+        elif self._y - ROW_HEIGHT < MARGIN + 10:
+            self._finish_page()
+            self._start_page()
+        self._y -= ROW_HEIGHT
+        c = self._canvas
+        if round((self._top - self._y) / ROW_HEIGHT) % 2 == 1:
+            c.setFillGray(0.96)
+            c.rect(MARGIN, self._y, PAGE_WIDTH - 2 * MARGIN, ROW_HEIGHT, stroke=0, fill=1)
+            c.setFillGray(0)
+        for (_, left, width, numeric), value in zip(self._columns, values):
+            text = _number(value) if numeric else ("" if value is None else str(value))
+            self._cell_text(text, left, width, self._y + 4, numeric)
+        self.rows += 1
+
+    def close(self):
+        if self._y is None:
+            self._start_page()
+        self._finish_page()
+        self._canvas.save()
+        return self.pages
+
+
+# ======================= #
+#     تقرير السجل
+# ======================= #
+def iter_log_rows(max_rows=DEFAULT_MAX_ROWS, chunk_size=CHUNK_ROWS, **filters):
+    # صفوف السجل من المخزن دفعةً دفعة حتى الحد الأقصى (filters: company / sector / country / date_from / date_to)
+    remaining = max_rows
+    for chunk in assessment_store.iter_log_chunks(min(chunk_size, max_rows), **filters):
+        for row in chunk[:remaining]:
+            yield row
+        remaining -= len(chunk)
+        if remaining <= 0:
+            return
+
+
+def describe_filters(max_rows, company=None, date_from=None, date_to=None, **_):
+    parts = [f"الشركة: {company or 'كل الشركات'}"]
+    if date_from or date_to:
+        parts.append(f"الفترة: {date_from or '...'} - {date_to or '...'}")
+    parts.append(f"الحد الأقصى: {max_rows:,} صف")
+    parts.append(f"تاريخ الإنشاء: {datetime.now():%Y-%m-%d %H:%M}")
+    return " | ".join(parts)
+
+
+def write_log_pdf(fp, rows, title="سجل التقييمات والعمليات", subtitle=""):
+    # fp: مسار أو ملف ثنائي مفتوح للكتابة - يعيد (عدد الصفوف، عدد الصفحات)
+    writer = LogTableCanvas(fp, COLUMNS, title, subtitle)
+    for row in rows:
+        writer.add_row(row)
+    pages = writer.close()
+    return writer.rows, pages
+
+
+def export_log_pdf(max_rows=DEFAULT_MAX_ROWS, kind="log_pdf", **filters):
+    # يُستدعى من زر التحميل فقط - يكتب إلى ملف مؤقت ويعيد قارئًا له ويسجل الإحصاءات كباقي صيغ التصدير
+    max_rows = max(1, min(int(max_rows), MAX_ROWS_LIMIT))
+    filters = {key: value for key, value in filters.items() if value is not None}
+    start = time.perf_counter()
+    with exports.PeakMemory() as memory:
+        (rows, pages), reader = exports.temp_export(".pdf", lambda path: write_log_pdf(
+            path, iter_log_rows(max_rows, **filters), subtitle=describe_filters(max_rows, **filters)))
+    exports.record_stats(kind, {
+        "format": "PDF", "rows": rows, "pages": pages, "bytes": os.fstat(reader.fileno()).st_size,
+        "seconds": time.perf_counter() - start,
+        "peak_bytes": memory.growth, "rss_bytes": memory.peak,
+    })
+    return reader
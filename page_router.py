@@ -0,0 +1,103 @@
+# موجّه الصفحات - سجل يربط عنوان كل صفحة بالدالة التي ترسمها
+# لا يُستورد ولا يُنفَّذ إلا كود الصفحة المختارة، ويُقاس زمن تنفيذ كل صفحة في كل إعادة تشغيل.
+
+import threading
+import time
+from importlib import import_module
+
+import streamlit as st
+
+NAV_KEY = "page"
+
+_registry = {}
+_lock = threading.Lock()
+_timings = {}
+_current = threading.local()
+
+
+def register(title, target):
+    # target بصيغة "module:function" ولا يُستورد إلا عند فتح الصفحة
+    _registry[title] = target
+
+
+def page_titles():
+    return list(_registry)
+
+
+def go_to(title):
+    # تُستخدم كـ on_click لأزرار التنقل داخل الصفحات
+    st.session_state[NAV_KEY] = title
+
+
+def _stats_for(title):
+    return _timings.setdefault(title, {"runs": 0, "total": 0.0, "last": 0.0, "max": 0.0, "payload": None})
+
+
+def record_payload(nbytes):
+    # تستدعيها الصفحة لتسجيل حجم البيانات المرسلة للمتصفح (مثل JSON الرسوم البيانية)
+    title = getattr(_current, "title", None)
+    if title is None:
+        return
+    with _lock:
+        _stats_for(title)["payload"] = nbytes
+
+
+def _record(title, elapsed):
+    with _lock:
+        stats = _stats_for(title)
+        stats["runs"] += 1
+        stats["total"] += elapsed
+        stats["last"] = elapsed
+        stats["max"] = max(stats["max"], elapsed)
+
+
+def run(title):
+    module_name, func_name = _registry[title].split(":")
+    start = time.perf_counter()
+    _current.title = title
+    try:
+        getattr(import_module(module_name), func_name)()
+    finally:
+        # st.stop() داخل الصفحة يمر من هنا أيضًا فيُحسب زمنها
+        _current.title = None
+        _record(title, time.perf_counter() - start)
+
+
+def timing_report():
+    with _lock:
+        return [
+            {
+                "الصفحة": title,
+                "مرات التشغيل": s["runs"],
+                "آخر زمن (ms)": round(s["last"] * 1000, 1),
+                "متوسط (ms)": round(s["total"] / s["runs"] * 1000, 1),
+                "أقصى زمن (ms)": round(s["max"] * 1000, 1),
+                "حجم البيانات (KB)": round(s["payload"] / 1024, 1) if s["payload"] is not None else None,
+            }
+            for title, s in _timings.items()
+        ]
+
+
+def render_timing_report():
+    with st.sidebar.expander("⏱️ زمن تنفيذ الصفحات"):
+        report = timing_report()
+        if report:
+            st.dataframe(report, use_container_width=True, hide_index=True)
+        else:
+            st.caption("لا توجد قياسات بعد.")
+
+
+# ======================= #
+#      تسجيل الصفحات
+# ======================= #
+register("🏠 الصفحة الرئيسية", "scor_pages.home:render")
+register("📊 لوحة التحكم الرئيسية", "scor_pages.dashboard:render")
+register("📝 التقييم", "scor_pages.assessment:render")
+register("📊 النتائج والتحليل", "scor_pages.results:render")
+register("🤖 التوصيات الذكية", "scor_pages.recommendations:render")
+register("🏢 مقارنة الشركات", "scor_pages.cpm:render")
+register("🧾 سجل التقييمات", "scor_pages.log:render")
+register("📆 تحليل الأداء الزمني", "scor_pages.timeline:render")
+register("📈 تحليل الأداء حسب القطاع", "scor_pages.sector:render")
+register("🛠️ لوحة تحكم المشرف", "scor_pages.admin:render")
+register("📄 معلومات مشروع التخرج", "scor_pages.about:render")
@@ -0,0 +1,23 @@
+# توليد رموز QR في الذاكرة (PNG bytes) مع كاش LRU مفتاحه الرابط والحجم
+# لا ملف مشترك على القرص تتسابق عليه الجلسات، ونفس الرابط لا يُعاد توليده في كل إعادة تشغيل.
+
+from functools import lru_cache
+from io import BytesIO
+
+QR_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=QR_CACHE_SIZE)
+def qr_png(url, box_size=10, border=4):
+    import qrcode
+
+    qr = qrcode.QRCode(box_size=box_size, border=border)
+    qr.add_data(url)
+    qr.make(fit=True)
+    buffer = BytesIO()
+    qr.make_image().save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def cache_info():
+    return qr_png.cache_info()
@@ -0,0 +1,82 @@
+# بنك الأسئلة - يُقرأ ملف SCOR_AI_Questions.xlsx مرة واحدة ويُحوَّل إلى بنية ثابتة مجمّعة حسب المرحلة
+# البنية مشتركة على مستوى العملية ومفتاحها بصمة (hash) محتوى الملف،
+# فلا تتكرر قراءة Excel ولا فلترة df[df['SCOR Phase'] == phase] مع كل تحريك للمنزلق.
+
+import hashlib
+import os
+import threading
+from dataclasses import dataclass
+from io import BytesIO
+from types import MappingProxyType
+
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+QUESTIONS_XLSX = "SCOR_AI_Questions.xlsx"
+
+
+@dataclass(frozen=True)
+class Question:
+    id: int        # رقم الصف في ملف Excel
+    phase: str     # مرحلة SCOR (Plan, Source, ...)
+    text: str      # نص السؤال بالعربية
+    key: str       # مفتاح المنزلق في Streamlit
+
+
+@dataclass(frozen=True)
+class QuestionBank:
+    digest: str
+    phases: tuple
+    questions: tuple
+    by_phase: MappingProxyType
+
+    def phase_questions(self, phase):
+        return self.by_phase.get(phase, ())
+
+    def phase_of_questions(self):
+        # مرحلة كل سؤال بالترتيب - تُستخدم في التقييم المجمّع
+        return tuple(q.phase for q in self.questions)
+
+
+def _parse(content, digest):
+    df = pd.read_excel(BytesIO(content))
+    questions = []
+    grouped = {}
+    for idx, phase, text in zip(df.index, df["SCOR Phase"], df["Question (AR)"]):
+        q = Question(id=int(idx), phase=phase, text=text, key=f"{phase}_{idx}")
+        questions.append(q)
+        grouped.setdefault(phase, []).append(q)
+    return QuestionBank(
+        digest=digest,
+        phases=tuple(grouped),
+        questions=tuple(questions),
+        by_phase=MappingProxyType({phase: tuple(qs) for phase, qs in grouped.items()}),
+    )
+
+
+_lock = threading.Lock()
+_banks = {}          # digest -> QuestionBank
+_last_stat = {}      # path -> ((mtime, size), digest)
+
+
+def load_question_bank(path=QUESTIONS_XLSX):
+    # لا يُعاد قراءة الملف إلا إذا تغيّر تاريخ تعديله أو حجمه، ولا يُعاد تحليله إلا إذا تغيّر محتواه
+    st_ = os.stat(path)
+    stat_key = (st_.st_mtime_ns, st_.st_size)
+    with _lock:
+        cached = _last_stat.get(path)
+        if cached and cached[0] == stat_key:
+            return _banks[cached[1]]
+
+    with open(path, "rb") as f:
+        content = f.read()
+    digest = hashlib.sha256(content).hexdigest()
+    with _lock:
+        bank = _banks.get(digest)
+    if bank is None:
+        bank = _parse(content, digest)
+    with _lock:
+        _banks[digest] = bank
+        _last_stat[path] = (stat_key, digest)
+    return bank
@@ -0,0 +1,217 @@
+# طبقة الوصول إلى بيانات app.py (ai_readiness.db)
+# اتصال واحد طويل العمر لكل عملية (WAL)، وترحيلات المخطط تُنفَّذ مرة واحدة عند أول اتصال،
+# واستعلامات المقارنة (المتوسطات والمئينات والصفحات) تُحسب داخل SQLite فلا يُسحب الجدول كاملًا إلى الذاكرة.
+
+import os
+import sqlite3
+import threading
+
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+# ======================= #
+#        الإعدادات
+# ======================= #
+DB_PATH = os.environ.get("AI_READINESS_DB_PATH", "ai_readiness.db")
+PHASE_COLUMNS = {
+    "الخطة": "plan",
+    "المصدر": "source",
+    "الصنع": "make",
+    "التوصيل": "deliver",
+    "الإرجاع": "return_score",
+    "الإجمالي": "total",
+}
+# الدرجات الخمس أعداد صحيحة (0-100)، أما الإجمالي فمتوسط حقيقي (REAL) قيمه شبه فريدة
+CONTINUOUS_COLUMNS = {"total"}
+PERCENTILES = (0.25, 0.5, 0.75, 0.9)
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",      # ~16MB
+    "PRAGMA mmap_size=134217728",    # 128MB
+)
+
+# كل ترحيل يُنفَّذ مرة واحدة ويُسجَّل رقمه في PRAGMA user_version
+# الترحيل الأول يطابق الجدول الذي كان ينشئه save_to_db، فقواعد البيانات القديمة تبقى صالحة.
+MIGRATIONS = (
+    """
+    CREATE TABLE IF NOT EXISTS assessments (
+        company TEXT, date TEXT, plan INTEGER, source INTEGER, make INTEGER,
+        deliver INTEGER, return_score INTEGER, total REAL
+    );
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_assessments_company ON assessments (company, date);
+    CREATE INDEX IF NOT EXISTS idx_assessments_date ON assessments (date);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_assessments_total ON assessments (total);
+    """,
+)
+
+_INSERT_SQL = (
+    "INSERT INTO assessments (company, date, plan, source, make, deliver, return_score, total) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+_lock = threading.Lock()
+_conn = None
+_conn_path = None
+
+
+# ======================= #
+#     الاتصال والترحيلات
+# ======================= #
+def _migrate(conn):
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    for number, script in enumerate(MIGRATIONS[version:], start=version + 1):
+        with conn:
+            conn.executescript(script)
+            conn.execute(f"PRAGMA user_version = {number}")
+
+
+def get_connection():
+    global _conn, _conn_path
+    with _lock:
+        if _conn is None or _conn_path != DB_PATH:
+            conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+            for pragma in _PRAGMAS:
+                conn.execute(pragma)
+            _migrate(conn)
+            _conn, _conn_path = conn, DB_PATH
+        return _conn
+
+
+# ======================= #
+#        الكتابة
+# ======================= #
+def _to_row(company, date, scores, total):
+    return (company, date, *scores, total)
+
+
+def save_assessment(company, date, scores, total):
+    conn = get_connection()
+    with _lock:
+        with conn:
+            conn.execute(_INSERT_SQL, _to_row(company, date, scores, total))
+
+
+def save_assessments(rows):
+    # إضافة مجمّعة في معاملة واحدة: rows عبارة عن (company, date, scores, total)
+    conn = get_connection()
+    prepared = [_to_row(*row) for row in rows]
+    with _lock:
+        with conn:
+            conn.executemany(_INSERT_SQL, prepared)
+    return len(prepared)
+
+
+# ======================= #
+#     استعلامات المقارنة
+# ======================= #
+def count_assessments(company=None):
+    conn = get_connection()
+    with _lock:
+        if company is None:
+            return conn.execute("SELECT COUNT(*) FROM assessments").fetchone()[0]
+        return conn.execute("SELECT COUNT(*) FROM assessments WHERE company = ?", (company,)).fetchone()[0]
+
+
+def page_assessments(page_no=1, page_size=50, company=None):
+    # صفحة واحدة من التقييمات الأحدث أولًا (LIMIT/OFFSET على فهرس التاريخ)
+    where = "WHERE company = ?" if company is not None else ""
+    params = ([company] if company is not None else []) + [page_size, (page_no - 1) * page_size]
+    conn = get_connection()
+    with _lock:
+        return pd.read_sql_query(
+            f"SELECT company, date, plan, source, make, deliver, return_score, total FROM assessments {where} "
+            "ORDER BY date DESC, rowid DESC LIMIT ? OFFSET ?",
+            conn, params=params,
+        )
+
+
+def _percentile_rank(count, p):
+    # المئين بأقرب رتبة: الصف رقم floor(p * (n - 1)) + 1 بعد الترتيب
+    return int(p * (count - 1)) + 1
+
+
+def _percentile_from_histogram(histogram, count, p):
+    rank = _percentile_rank(count, p)
+    seen = 0
+    for value, freq in histogram:
+        seen += freq
+        if seen >= rank:
+            return value
+    return None
+
+
+def _continuous_summary(conn, col):
+    # عمود حقيقي: الإحصاءات بدالات SQL، وكل مئين صف واحد بالترتيب (ORDER BY ... LIMIT 1 OFFSET)
+    # على فهرس العمود فلا يُرتَّب الجدول ولا يُسحب إلى الذاكرة
+    count, mean, low, high = conn.execute(
+        f"SELECT COUNT({col}), AVG({col}), MIN({col}), MAX({col}) FROM assessments"
+    ).fetchone()
+    if not count:
+        return None
+    row = {"المتوسط": mean, "الأدنى": low, "الأعلى": high}
+    for p in PERCENTILES:
+        row[f"P{int(p * 100)}"] = conn.execute(
+            f"SELECT {col} FROM assessments WHERE {col} IS NOT NULL ORDER BY {col} LIMIT 1 OFFSET ?",
+            (_percentile_rank(count, p) - 1,),
+        ).fetchone()[0]
+    return row
+
+
+def phase_summary():
+    # لكل مرحلة: المتوسط والأدنى والأعلى والمئينات
+    # الدرجات قيم منفصلة قليلة، فيُعاد من SQLite مدرّج تكراري (قيمة، عدد) بدل صفوف الجدول
+    # وتُحسب منه كل الإحصاءات بدقة؛ الإجمالي (REAL) يُحسب بـ _continuous_summary
+    conn = get_connection()
+    rows = []
+    with _lock:
+        for label, col in PHASE_COLUMNS.items():
+            if col in CONTINUOUS_COLUMNS:
+                row = _continuous_summary(conn, col)
+                if row is not None:
+                    rows.append({"المرحلة": label, **row})
+                continue
+            histogram = conn.execute(
+                f"SELECT {col}, COUNT(*) FROM assessments WHERE {col} IS NOT NULL GROUP BY {col} ORDER BY {col}"
+            ).fetchall()
+            if not histogram:
+                continue
+            count = sum(freq for _, freq in histogram)
+            row = {
+                "المرحلة": label,
+                "المتوسط": sum(value * freq for value, freq in histogram) / count,
+                "الأدنى": histogram[0][0],
+                "الأعلى": histogram[-1][0],
+            }
+            for p in PERCENTILES:
+                row[f"P{int(p * 100)}"] = _percentile_from_histogram(histogram, count, p)
+            rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def company_summary(page_no=1, page_size=20):
+    # متوسطات كل شركة وعدد تقييماتها وآخر تاريخ، صفحةً صفحة مرتبة بالمتوسط الإجمالي
+    conn = get_connection()
+    with _lock:
+        return pd.read_sql_query(
+            "SELECT company AS 'الشركة', COUNT(*) AS 'عدد التقييمات', MAX(date) AS 'آخر تقييم', "
+            "ROUND(AVG(plan), 1) AS 'الخطة', ROUND(AVG(source), 1) AS 'المصدر', ROUND(AVG(make), 1) AS 'الصنع', "
+            "ROUND(AVG(deliver), 1) AS 'التوصيل', ROUND(AVG(return_score), 1) AS 'الإرجاع', "
+            "ROUND(AVG(total), 1) AS 'الإجمالي' "
+            "FROM assessments GROUP BY company ORDER BY AVG(total) DESC LIMIT ? OFFSET ?",
+            conn, params=(page_size, (page_no - 1) * page_size),
+        )
+
+
+def count_companies():
+    conn = get_connection()
+    with _lock:
+        return conn.execute("SELECT COUNT(DISTINCT company) FROM assessments").fetchone()[0]
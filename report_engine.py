@@ -0,0 +1,176 @@
+# محرك تقارير report_template.html (Jinja2 → HTML → PDF عبر xhtml2pdf)
+# القالب يُترجم مرة واحدة لكل عملية، وخط Amiri-Regular.ttf يُسجَّل مرة واحدة لكل عملية (font_service)
+# - أو لكل عامل في وضع الدفعات - بدل أن يُحلَّل ملف الخط مع كل تقرير.
+# وضع الدفعات يوزّع آلاف التقييمات على عدة عمليات ويكتب تقريرًا لكل تقييم ويعرض عدد الصفحات في الثانية.
+#
+# الاستخدام:
+#   python report_engine.py reports_out [--limit 1000] [--workers 4] [--chunk-size 16]
+
+import argparse
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+
+import font_service
+import scoring_engine
+
+# ======================= #
+#        الإعدادات
+# ======================= #
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_NAME = "report_template.html"
+BATCH_WORKERS = int(os.environ.get("SCOR_BATCH_WORKERS", os.cpu_count() or 1))
+BATCH_CHUNK_SIZE = 16
+
+
+# ======================= #
+#     القالب والخط
+# ======================= #
+@lru_cache(maxsize=None)
+def get_template(name=TEMPLATE_NAME):
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+    env = Environment(
+        loader=FileSystemLoader(BASE_DIR),
+        autoescape=select_autoescape(["html"]),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+    return env.get_template(name)
+
+
+def register_fonts():
+    # اسم "Amiri" يصبح متاحًا في CSS لكل التقارير
+    font_service.register_xhtml2pdf_font()
+
+
+def init_worker():
+    # مُهيّئ عمال الدفعات: الخط والقالب جاهزان قبل أول تقرير
+    register_fonts()
+    get_template()
+
+
+# ======================= #
+#   تقرير واحد
+# ======================= #
+def render_html(user, scores, swot):
+    return get_template().render(user=user, scores=scores, swot=swot)
+
+
+def html_to_pdf(html):
+    from xhtml2pdf import pisa
+
+    register_fonts()
+    buffer = BytesIO()
+    status = pisa.CreatePDF(html, dest=buffer, encoding="utf-8")
+    if status.err:
+        raise RuntimeError(f"xhtml2pdf: {status.err} error(s)")
+    return buffer.getvalue()
+
+
+def render_pdf(user, scores, swot):
+    return html_to_pdf(render_html(user, scores, swot))
+
+
+def page_count(pdf_bytes):
+    return len(re.findall(rb"/Type\s*/Page(?!s)", pdf_bytes))
+
+
+def build_swot(scores):
+    swot = {"قوة": [], "ضعف": [], "فرصة": [], "تهديد": []}
+    for phase, avg in scores.items():
+        swot[scoring_engine.swot_buckets(avg)].append(f"{phase} ({avg:.1f}/5)")
+    return swot
+
+
+def assessment_context(row):
+    # صف من assessment_store.fetch_assessment_rows → متغيرات القالب
+    import assessment_store
+
+    scores = {phase: row[col] for phase, col in assessment_store.PHASE_COLUMNS.items() if row[col] is not None}
+    return {
+        "user": {key: row[key] for key in ("name", "company", "sector", "country")},
+        "scores": scores,
+        "swot": build_swot(scores),
+    }
+
+
+# ======================= #
+#        الدفعات
+# ======================= #
+def _render_to_file(job):
+    # يُنفَّذ داخل العامل: يعيد (عدد الصفحات، الحجم) فقط حتى لا تعود بايتات PDF إلى العملية الرئيسية
+    path, context = job
+    data = render_pdf(context["user"], context["scores"], context["swot"])
+    with open(path, "wb") as f:
+        f.write(data)
+    return page_count(data), len(data)
+
+
+def render_batch(contexts, out_dir, workers=BATCH_WORKERS, chunk_size=BATCH_CHUNK_SIZE, report=None):
+    # contexts: متغيرات القالب لكل تقييم، مع "id" اختياري لاسم الملف
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [
+        (os.path.join(out_dir, f"report_{context.get('id', i)}.pdf"), context)
+        for i, context in enumerate(contexts, 1)
+    ]
+    stats = {"reports": 0, "pages": 0, "bytes": 0}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=init_worker) as pool:
+        for pages, size in pool.map(_render_to_file, jobs, chunksize=chunk_size):
+            stats["reports"] += 1
+            stats["pages"] += pages
+            stats["bytes"] += size
+            if report and stats["reports"] % 100 == 0:
+                elapsed = time.perf_counter() - start
+                report(f"  {stats['reports']:,}/{len(jobs):,} تقرير | {stats['pages'] / elapsed:,.1f} صفحة/ثانية")
+    stats["seconds"] = time.perf_counter() - start
+    stats["pages_per_sec"] = stats["pages"] / (stats["seconds"] or 1e-9)
+    return stats
+
+
+def stored_contexts(limit=None, page_size=1000):
+    import assessment_store
+
+    after_id = 0
+    count = 0
+    while limit is None or count < limit:
+        rows = assessment_store.fetch_assessment_rows(after_id, page_size)
+        if not rows:
+            return
+        for row in rows:
+            context = assessment_context(row)
+            context["id"] = row["id"]
+            yield context
+            count += 1
+            if limit is not None and count >= limit:
+                return
+        after_id = rows[-1]["id"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="إنشاء تقارير PDF من report_template.html لكل التقييمات المخزنة")
+    parser.add_argument("out_dir")
+    parser.add_argument("--limit", type=int)
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS)
+    parser.add_argument("--chunk-size", type=int, default=BATCH_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    contexts = list(stored_contexts(args.limit))
+    if not contexts:
+        print("لا توجد تقييمات مخزنة.", file=sys.stderr)
+        return 1
+    stats = render_batch(contexts, args.out_dir, args.workers, args.chunk_size, report=print)
+    print(f"✅ {stats['reports']:,} تقرير ({stats['pages']:,} صفحة، {stats['bytes'] / 1024 / 1024:,.1f} MB) "
+          f"في {stats['seconds']:.1f} ثانية | {stats['pages_per_sec']:,.1f} صفحة/ثانية | {args.workers} عامل")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
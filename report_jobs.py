@@ -0,0 +1,204 @@
+# طابور تقارير PDF في الخلفية (app.py)
+# زر الحساب يرسل HTML التقرير إلى مجموعة عمليات صغيرة ويعود فورًا برقم المهمة، ولا ينتظر المستخدم
+# تخطيط الصفحة ومعالجة الخطوط. رقم المهمة هو بصمة محتوى HTML (sha256)، فالتقرير نفسه لا يُرسم مرتين:
+# الملفات الجاهزة تُحفظ في مجلد ذاكرة مؤقتة حسب المحتوى، وآخر التقارير تبقى في الذاكرة أيضًا.
+
+import atexit
+import hashlib
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+# ======================= #
+#        الإعدادات
+# ======================= #
+REPORT_WORKERS = int(os.environ.get("SCOR_REPORT_WORKERS", min(2, os.cpu_count() or 1)))
+CACHE_DIR = os.environ.get("SCOR_REPORT_CACHE_DIR", ".report_cache")
+MEMORY_ITEMS = 32       # عدد التقارير الأخيرة المحفوظة في الذاكرة
+
+STATUS_LABELS = {
+    "pending": "⏳ في الانتظار",
+    "running": "🖨️ جارٍ الإنشاء",
+    "done": "✅ جاهز",
+    "failed": "❌ فشل",
+}
+
+
+def job_key(html):
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+# ======================= #
+#   الرسم (داخل العامل)
+# ======================= #
+def render_pdf(html):
+    # تُنفَّذ في عملية منفصلة: xhtml2pdf وخط Amiri يُحمَّلان مرة واحدة لكل عامل (report_engine)
+    import report_engine
+
+    return report_engine.html_to_pdf(html)
+
+
+_started = None
+
+
+def init_worker(started=None):
+    # started: طابور يُبلغ فيه العامل العملية الرئيسية برقم المهمة لحظة بدء رسمها
+    global _started
+    import report_engine
+
+    _started = started
+    report_engine.register_fonts()
+
+
+def run_job(render, key, html):
+    if _started is not None:
+        _started.put(key)
+    return render(html)
+
+
+# ======================= #
+#        الطابور
+# ======================= #
+class ReportQueue:
+    def __init__(self, workers=REPORT_WORKERS, cache_dir=CACHE_DIR, memory_items=MEMORY_ITEMS, render=render_pdf):
+        # spawn بدل fork: خادم Streamlit متعدد الخيوط ونسخ أقفاله إلى العامل غير آمن
+        context = multiprocessing.get_context("spawn")
+        self._started = context.SimpleQueue()
+        self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                             initializer=init_worker, initargs=(self._started,))
+        self._cache_dir = cache_dir
+        self._memory_items = memory_items
+        self._render = render
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._memory = OrderedDict()
+        self._closed = False
+        self._watcher = threading.Thread(target=self._watch_started, name="scor-report-started", daemon=True)
+        self._watcher.start()
+
+    # --- واجهة الاستخدام ---
+    def submit(self, html):
+        if self._closed:
+            raise RuntimeError("ReportQueue is closed")
+        key = job_key(html)
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job["status"] != "failed":
+                return key
+            if key in self._memory or os.path.exists(self._path(key)):
+                self._jobs[key] = {"status": "done", "error": None}
+                return key
+            # تبقى المهمة "في الانتظار" حتى يبدأ عامل رسمها فعلًا (_watch_started)
+            self._jobs[key] = {"status": "pending", "error": None}
+        future = self._executor.submit(run_job, self._render, key, html)
+        future.add_done_callback(lambda f, key=key: self._finish(key, f))
+        return key
+
+    def status(self, key):
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None:
+                return job["status"]
+        return "done" if os.path.exists(self._path(key)) else None
+
+    def error(self, key):
+        with self._lock:
+            job = self._jobs.get(key)
+            return job["error"] if job else None
+
+    def result(self, key):
+        # يعيد بايتات PDF إن كان التقرير جاهزًا، من الذاكرة أولًا ثم من مجلد الذاكرة المؤقتة
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        try:
+            with open(self._path(key), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        self._remember(key, data)
+        return data
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._started.put(None)
+        self._watcher.join()
+
+    # --- داخلي ---
+    def _path(self, key):
+        return os.path.join(self._cache_dir, key[:2], f"{key}.pdf")
+
+    def _remember(self, key, data):
+        with self._lock:
+            self._memory[key] = data
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._memory_items:
+                self._memory.popitem(last=False)
+
+    def _store(self, key, data):
+        # كتابة ذرية: ملف مؤقت ثم إعادة تسمية، فلا يُقرأ تقرير نصف مكتوب
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _watch_started(self):
+        # يقرأ إشعارات البدء من العمال؛ المهمة التي انتهت قبل وصول إشعارها لا تعود إلى "جارٍ"
+        while (key := self._started.get()) is not None:
+            with self._lock:
+                job = self._jobs.get(key)
+                if job is not None and job["status"] == "pending":
+                    job["status"] = "running"
+
+    def _finish(self, key, future):
+        try:
+            data = future.result()
+            self._remember(key, data)
+            try:
+                self._store(key, data)
+            except OSError as e:
+                print(f"⚠️ تعذر حفظ التقرير في الذاكرة المؤقتة: {e}", file=sys.stderr)
+            status, error = "done", None
+        except Exception as e:
+            status, error = "failed", f"{type(e).__name__}: {e}"
+        with self._lock:
+            self._jobs[key] = {"status": status, "error": error}
+
+
+# ======================= #
+#   طابور واحد لكل عملية
+# ======================= #
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_queue():
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = ReportQueue()
+            atexit.register(_queue.close)
+        return _queue
+
+
+def submit(html):
+    # إضافة التقرير إلى الطابور والعودة فورًا برقم المهمة
+    return get_queue().submit(html)
+
+
+def status(key):
+    return get_queue().status(key)
+
+
+def result(key):
+    return get_queue().result(key)
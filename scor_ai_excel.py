@@ -1,7 +1,8 @@
 import streamlit as st
-import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime
+import question_bank
+import scoring_engine
 
 # Page config
 st.set_page_config(page_title="منصة SCOR للذكاء الاصطناعي", layout="centered")
@@ -30,7 +31,10 @@ with st.sidebar.form("user_form"):
     save_results = st.checkbox("أوافق على حفظ نتائجي للمقارنة لاحقًا")
     submitted = st.form_submit_button("ابدأ التقييم")
 
-if not submitted:
+# الجلسة تتذكر بدء التقييم، فلا تتوقف الصفحة عند إعادة التشغيل بعد الإرسال
+if submitted:
+    st.session_state.started = True
+if not st.session_state.get("started"):
     st.stop()
 
 # ====== MAIN PAGE HEADER ======
@@ -48,12 +52,12 @@ st.markdown(f"""
 
 # ====== LOAD QUESTIONS ======
 try:
-    df = pd.read_excel("SCOR_AI_Questions.xlsx")
+    bank = question_bank.load_question_bank()
 except:
     st.error("❌ تأكد من وجود ملف SCOR_AI_Questions.xlsx في نفس مجلد الكود.")
     st.stop()
 
-scor_phases = df['SCOR Phase'].unique()
+scor_phases = bank.phases
 phase_labels = {
     "Plan": "📘 التخطيط",
     "Source": "📗 التوريد",
@@ -62,66 +66,85 @@ phase_labels = {
     "Return": "📒 المرتجعات"
 }
 
-results = {}
-colors = []
-swot = {"قوة": [], "ضعف": [], "فرصة": [], "تهديد": []}
-
 # ====== QUESTIONS & AI RECOMMENDATIONS ======
-for phase in scor_phases:
+# كل مرحلة جزء (fragment) مستقل: تحريك شريط يعيد حساب متوسط مرحلته وشارتها فقط
+phase_scores = st.session_state.setdefault("phase_scores", {})
+
+
+@st.fragment
+def phase_block(phase):
     with st.expander(f"🔹 مرحلة: {phase_labels.get(phase, phase)}", expanded=True):
-        phase_df = df[df['SCOR Phase'] == phase]
+        phase_questions = bank.phase_questions(phase)
         total = 0
-        for _, row in phase_df.iterrows():
-            score = st.slider(f"🔘 {row['Question (AR)']}", 1, 5, 3, key=row['Question (AR)'])
-            total += score
-        avg = total / len(phase_df)
-        results[phase] = avg
+        for q in phase_questions:
+            total += st.slider(f"🔘 {q.text}", 1, 5, 3, key=q.text)
+        avg = total / len(phase_questions)
+        phase_scores[phase] = avg
+        bucket = scoring_engine.swot_buckets(avg)
 
-        if avg >= 4:
+        if bucket == "قوة":
             st.success("🔵 ممتاز: تستخدم الذكاء الاصطناعي بكفاءة عالية في هذه المرحلة.")
+        elif bucket == "فرصة":
+            st.warning("🟠 جيد: يوجد تطبيق جزئي ويُنصح بتطويره.")
+        else:
+            st.error("🔴 ضعيف: تحتاج إلى خطة تحول رقمي.")
+
+
+for phase in scor_phases:
+    phase_block(phase)
+
+# ====== SUMMARY DASHBOARD ======
+# التقييم العام يُبنى من المتوسطات المحفوظة عند الضغط على الزر فقط
+if st.button("📊 عرض التقييم العام", type="primary"):
+    results = {p: phase_scores[p] for p in scor_phases}
+    colors = []
+    swot = {"قوة": [], "ضعف": [], "فرصة": [], "تهديد": []}
+    for phase, avg in results.items():
+        bucket = scoring_engine.swot_buckets(avg)
+        if bucket == "قوة":
             colors.append("#3498DB")
             swot["قوة"].append(phase_labels[phase])
-        elif avg >= 2.5:
-            st.warning("🟠 جيد: يوجد تطبيق جزئي ويُنصح بتطويره.")
+        elif bucket == "فرصة":
             colors.append("#F39C12")
             swot["فرصة"].append(phase_labels[phase])
         else:
-            st.error("🔴 ضعيف: تحتاج إلى خطة تحول رقمي.")
             colors.append("#E74C3C")
             swot["ضعف"].append(phase_labels[phase])
-
-# ====== SUMMARY DASHBOARD ======
-st.markdown("""
-<hr style='margin-top: 30px; margin-bottom: 20px;'>
-<h3 style='text-align:center;'>📊 التقييم العام</h3>
-""", unsafe_allow_html=True)
-
-labels = [phase_labels[p].split()[-1] for p in scor_phases]
-values = [results[p] for p in scor_phases]
-
-fig = go.Figure(data=[
-    go.Bar(x=labels, y=values, marker_color=colors, text=[f"{v:.1f}/5" for v in values], textfont_size=18, textposition='outside')
-])
-fig.update_layout(
-    xaxis_title="مرحلة SCOR",
-    yaxis_title="درجة الجاهزية",
-    yaxis=dict(range=[0, 5]),
-    template="plotly_white",
-    font=dict(family="Tajawal", size=16),
-    height=450
-)
-st.plotly_chart(fig)
-
-# ====== SWOT MATRIX OUTPUT ======
-st.markdown("""
-<h4 style='margin-top: 30px;'>🧠 مصفوفة SWOT الذكية</h4>
-<ul style='font-size:17px;'>
-<li><strong>نقاط القوة:</strong> {}</li>
-<li><strong>نقاط الضعف:</strong> {}</li>
-<li><strong>الفرص:</strong> {}</li>
-<li><strong>التهديدات:</strong> سيتم تحليلها لاحقًا بناءً على السوق.</li>
-</ul>
-""".format(', '.join(swot['قوة']) or 'لا توجد', ', '.join(swot['ضعف']) or 'لا توجد', ', '.join(swot['فرصة']) or 'لا توجد'), unsafe_allow_html=True)
+    st.session_state.summary = (results, colors, swot)
+
+if "summary" in st.session_state:
+    results, colors, swot = st.session_state.summary
+    st.markdown("""
+    <hr style='margin-top: 30px; margin-bottom: 20px;'>
+    <h3 style='text-align:center;'>📊 التقييم العام</h3>
+    """, unsafe_allow_html=True)
+
+    labels = [phase_labels[p].split()[-1] for p in scor_phases]
+    values = [results[p] for p in scor_phases]
+
+    fig = go.Figure(data=[
+        go.Bar(x=labels, y=values, marker_color=colors, text=[f"{v:.1f}/5" for v in values], textfont_size=18, textposition='outside')
+    ])
+    fig.update_layout(
+        xaxis_title="مرحلة SCOR",
+        yaxis_title="درجة الجاهزية",
+        yaxis=dict(range=[0, 5]),
+        template="plotly_white",
+        font=dict(family="Tajawal", size=16),
+        height=450
+    )
+    st.plotly_chart(fig)
+
+    # ====== SWOT MATRIX OUTPUT ======
+    st.markdown("""
+    <h4 style='margin-top: 30px;'>🧠 مصفوفة SWOT الذكية</h4>
+    <ul style='font-size:17px;'>
+    <li><strong>نقاط القوة:</strong> {}</li>
+    <li><strong>نقاط الضعف:</strong> {}</li>
+    <li><strong>الفرص:</strong> {}</li>
+    <li><strong>التهديدات:</strong> سيتم تحليلها لاحقًا بناءً على السوق.</li>
+    </ul>
+    """.format(', '.join(swot['قوة']) or 'لا توجد', ', '.join(swot['ضعف']) or 'لا توجد', ', '.join(swot['فرصة']) or 'لا توجد'), unsafe_allow_html=True)
 
 # ====== SIGNATURE & FOOTER ======
 st.markdown("""
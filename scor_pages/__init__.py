@@ -0,0 +1 @@
+# صفحات منصة SCOR - كل صفحة في وحدة مستقلة تعرّف render() وتُسجَّل في page_router
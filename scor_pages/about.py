@@ -0,0 +1,13 @@
+# صفحة: 📄 معلومات مشروع التخرج
+
+import streamlit as st
+
+
+def render():
+    st.header("📄 معلومات مشروع التخرج")
+    st.markdown("""
+    - 🎓 **مشروع تخرج 2025**
+    - 📌 **إعداد:** سُها ناصر سعيد عماره
+    - 📘 **إشراف:** أ.د. عماد قمحاوي – كلية التجارة
+    - 🧠 **المراحل التي يتم تقييمها:** التخطيط (Plan)، التوريد (Source)، التصنيع (Make)، التوزيع (Deliver)، المرتجعات (Return)
+    """)
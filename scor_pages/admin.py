@@ -0,0 +1,69 @@
+# صفحة: 🛠️ لوحة تحكم المشرف
+
+from functools import partial
+
+import streamlit as st
+
+import exports
+import log_loader
+import log_query
+from lazy_imports import lazy_import
+
+px = lazy_import("plotly.express")
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+def render():
+    st.header("🛠️ لوحة تحكم المشرف - System Admin")
+
+    index = log_query.log_index()
+
+    if len(index):
+
+        # --- تصفية حسب الشركة / الدولة / القطاع ---
+        col1, col2, col3 = st.columns(3)
+        selected_company = col1.selectbox("🏢 اختر شركة:", ["كل الشركات"] + index.values("الشركة"))
+        selected_sector = col2.selectbox("🏭 اختر قطاع:", ["كل القطاعات"] + index.values("القطاع"))
+        selected_country = col3.selectbox("🌍 اختر دولة:", ["كل الدول"] + index.values("الدولة"))
+
+        filters = {
+            "company": None if selected_company == "كل الشركات" else selected_company,
+            "sector": None if selected_sector == "كل القطاعات" else selected_sector,
+            "country": None if selected_country == "كل الدول" else selected_country,
+        }
+        # التصفية تقاطع فهارس القيم المختارة
+        rows = index.select(**{
+            "الشركة": filters["company"],
+            "القطاع": filters["sector"],
+            "الدولة": filters["country"],
+        })
+
+        st.success(f"✅ عدد النتائج المعروضة: {len(rows)}")
+        stats = log_loader.cache_stats()
+        st.caption(f"🗄️ كاش السجل: {stats['hits']} hit / {stats['misses']} miss")
+
+        # --- عرض الجدول صفحةً صفحة ---
+        col_size, col_page = st.columns(2)
+        page_size = col_size.selectbox("📄 عدد الصفوف في الصفحة", PAGE_SIZES, index=1)
+        page_count = max(1, -(-len(rows) // page_size))
+        page_no = col_page.number_input(f"الصفحة (من {page_count})", min_value=1, max_value=page_count, value=1)
+        st.dataframe(index.page(rows, page_no, page_size), use_container_width=True)
+
+        # --- تحميل النتائج المصفاة: تصدير متدفق من المخزن يُبنى عند الضغط فقط ---
+        fmt = st.selectbox("🗂️ صيغة التصدير", exports.export_formats(), key="admin_export_format")
+        ext, mime = exports.EXPORT_FORMATS[fmt]
+        st.download_button(f"⬇️ تحميل {fmt} للتقرير الحالي", data=partial(exports.export_log, fmt, "admin", **filters),
+                           file_name=f"admin_filtered_data.{ext}", mime=mime)
+        stats = exports.export_stats("admin")
+        if stats:
+            st.caption(exports.format_stats(stats))
+
+        # --- رسم بياني: CPM حسب الشركة
+        st.subheader("📊 مقارنة CPM بين الشركات")
+        chart_df = index.frame(rows, ["الشركة", "القطاع", "نتيجة CPM"])
+        fig = px.bar(chart_df, x="الشركة", y="نتيجة CPM", color="القطاع", text="نتيجة CPM", height=400)
+        st.plotly_chart(fig)
+
+    else:
+        st.warning("⚠️ لا يوجد ملف سجل بيانات حتى الآن.")
@@ -0,0 +1,144 @@
+# صفحة: 📝 التقييم
+
+import streamlit as st
+
+import assessment_store
+import question_bank
+import scoring_engine
+from scor_pages.common import phase_labels
+
+
+PHASE_SCORES_KEY = "phase_scores"
+IOT_SCORE_KEY = "iot_score"
+IOT_QUESTIONS = [
+    "هل تستخدم أجهزة استشعار؟",
+    "هل لديك لوحات تحكم لحظية؟",
+    "هل تحلل البيانات لحظيًا؟",
+    "هل تتكامل البيانات مع ERP؟",
+]
+
+
+def save_results_to_store(user_info, iot_avg, results, answers):
+    # إضافة صف واحد إلى مخزن SQLite بدلًا من إعادة كتابة benchmark_data.xlsx بالكامل
+    # الصف مفتاحه بصمة (المستخدم، الإجابات)، فإعادة إرسال الإجابات نفسها لا تضيف صفًا جديدًا
+    key = assessment_store.submission_hash(user_info, answers)
+    if st.session_state.get("last_submission") == key:
+        st.info("ℹ️ هذا التقييم محفوظ مسبقًا.")
+        return
+    if assessment_store.append_assessment(user_info, iot_avg, results, submission_key=key) is None:
+        st.info("ℹ️ هذا التقييم محفوظ مسبقًا.")
+    else:
+        st.success("✅ تم حفظ نتائج التقييم للمقارنة المستقبلية.")
+    st.session_state.last_submission = key
+
+
+# ======================= #
+#   أجزاء الاستبيان (Fragments)
+# ======================= #
+# كل مرحلة وكتلة IoT وحدة إعادة تشغيل مستقلة: تحريك أي شريط يعيد تشغيل جزئه فقط
+# (متوسط المرحلة وشارة حالتها) دون إعادة تحميل الأسئلة أو رسم باقي المراحل.
+@st.fragment
+def phase_block(bank, phase):
+    with st.expander(f"🔹 مرحلة: {phase_labels.get(phase, phase)}", expanded=True):
+        phase_questions = bank.phase_questions(phase)
+        total = 0
+        for q in phase_questions:
+            total += st.slider(f"🔘 {q.text}", 1, 5, 3, key=q.key)
+        avg = total / len(phase_questions)
+        st.session_state[PHASE_SCORES_KEY][phase] = avg
+        bucket = scoring_engine.swot_buckets(avg)
+        if bucket == "قوة":
+            st.success(f"🔵 ممتاز ({avg:.1f}/5)")
+        elif bucket == "فرصة":
+            st.warning(f"🟠 جيد ({avg:.1f}/5)")
+        else:
+            st.error(f"🔴 ضعيف ({avg:.1f}/5)")
+
+
+@st.fragment
+def iot_block():
+    with st.expander("📡 تقييم جاهزية IoT والتتبع اللحظي"):
+        scores = [st.slider(text, 1, 5, 3, key=f"iot_{i}") for i, text in enumerate(IOT_QUESTIONS, 1)]
+        iot_avg = sum(scores) / len(scores)
+        st.session_state[IOT_SCORE_KEY] = iot_avg
+        st.markdown(f"**متوسط جاهزية IoT: {iot_avg:.1f}/5**")
+
+
+def submit_assessment(bank):
+    # النتائج العامة تُبنى من المتوسطات المحفوظة لكل مرحلة، مرة واحدة عند الإرسال
+    phase_scores = st.session_state[PHASE_SCORES_KEY]
+    results = {phase: phase_scores[phase] for phase in bank.phases}
+    iot_avg = st.session_state[IOT_SCORE_KEY]
+
+    swot = {"قوة": [], "ضعف": [], "فرصة": [], "تهديد": []}
+    for phase, avg in results.items():
+        bucket = scoring_engine.swot_buckets(avg)
+        label = phase_labels.get(phase, phase)
+        if bucket == "قوة":
+            swot["قوة"].append(f"{label}: تعمل بكفاءة عالية (متوسط: {avg:.1f}/5).")
+        elif bucket == "فرصة":
+            swot["فرصة"].append(f"{label}: مقبول ويوجد فرصة للتحسين (متوسط: {avg:.1f}/5).")
+        else:
+            swot["ضعف"].append(f"{label}: جاهزية منخفضة (متوسط: {avg:.1f}/5).")
+
+    st.session_state.results = results
+    st.session_state.iot_avg = iot_avg
+    st.session_state.swot = swot
+    st.success("✅ تم حساب النتائج. يمكنك الآن الانتقال إلى صفحة النتائج والتحليل.")
+
+    if st.session_state.user_info.get("save_results"):
+        answers = {q.key: st.session_state[q.key] for q in bank.questions}
+        answers.update({f"iot_{i}": st.session_state[f"iot_{i}"] for i in range(1, len(IOT_QUESTIONS) + 1)})
+        save_results_to_store(st.session_state.user_info, iot_avg, results, answers)
+
+
+def render():
+    st.header("📝 التقييم العام")
+    st.markdown("""
+    <div style="background-color:#fff9db; padding:15px; border-radius:10px; border:1px solid #ffe58f; margin-bottom:20px;">
+        <h4 style="color:#8a6d3b;">📌 قبل أن تبدأ التقييم:</h4>
+        <ul style="color:#856404; font-size:15px;">
+            <li>اقرأ كل سؤال بعناية.</li>
+            <li>اختر تقييم من 1 إلى 5 حسب واقع شركتك.</li>
+            <li>اضغط على السهم لإظهار كل مرحلة من مراحل SCOR.</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    if not st.session_state.started:
+        with st.form("user_form"):
+            user_name = st.text_input("الاسم الكامل")
+            company_name = st.text_input("اسم الشركة أو المؤسسة")
+            sector = st.selectbox("القطاع", ["الرعاية الصحية", "التصنيع", "اللوجستيات", "الخدمات", "أخرى"])
+            country = st.text_input("الدولة")
+            save_results = st.checkbox("أوافق على حفظ نتائجي للمقارنة لاحقًا")
+            submitted = st.form_submit_button("ابدأ التقييم")
+
+        if not submitted:
+            st.stop()
+
+        st.session_state.user_info = {
+            "name": user_name,
+            "company": company_name,
+            "sector": sector,
+            "country": country,
+            "save_results": save_results
+        }
+        st.session_state.started = True
+
+    try:
+        bank = question_bank.load_question_bank()
+    except:
+        st.error("❌ تأكد من وجود ملف SCOR_AI_Questions.xlsx في نفس مجلد التطبيق.")
+        st.stop()
+
+    # متوسطات المراحل تُحسب داخل كل جزء (fragment) وتُحفظ في الجلسة، ولا تُجمَّع إلا عند الإرسال
+    st.session_state.setdefault(PHASE_SCORES_KEY, {})
+    for phase in bank.phases:
+        phase_block(bank, phase)
+    iot_block()
+
+    if st.button("📊 احسب النتائج", type="primary", key="submit_assessment"):
+        submit_assessment(bank)
+    elif not st.session_state.results:
+        st.info("ℹ️ بعد الإجابة على جميع الأسئلة اضغط \"احسب النتائج\" لعرض التحليل في باقي الصفحات.")
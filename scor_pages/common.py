@@ -0,0 +1,12 @@
+# ثوابت مشتركة بين الصفحات
+
+# ======================= #
+#     تسميات مراحل SCOR
+# ======================= #
+phase_labels = {
+    "Plan": "📘 التخطيط",
+    "Source": "📗 التوريد",
+    "Make": "📙 التصنيع",
+    "Deliver": "📕 التوزيع",
+    "Return": "📒 المرتجعات"
+}
@@ -0,0 +1,149 @@
+# صفحة: 🏢 مقارنة الشركات
+
+import json
+from datetime import datetime
+
+import streamlit as st
+
+import qr_codes
+import webhook_outbox
+from lazy_imports import lazy_import
+from scor_pages.common import phase_labels
+
+pd = lazy_import("pandas")
+go = lazy_import("plotly.graph_objects")
+
+
+@st.fragment(run_every=3)
+def delivery_status_panel():
+    # يتحدث كل بضع ثوانٍ دون إعادة تشغيل الصفحة
+    rows = webhook_outbox.status(st.session_state.webhook_deliveries[-10:])
+    st.dataframe([
+        {
+            "رقم الإرسال": row["id"],
+            "الرابط": row["url"],
+            "الحالة": webhook_outbox.STATUS_LABELS.get(row["status"], row["status"]),
+            "المحاولات": row["attempts"],
+            "آخر خطأ": row["last_error"] or "",
+        }
+        for row in rows
+    ], use_container_width=True, hide_index=True)
+
+
+def render():
+    st.header("🏢 مقارنة الشركات - مصفوفة CPM")
+
+    st.markdown("""
+    - قارن شركتك مع المنافسين باستخدام **مصفوفة الملف التعريفي التنافسي (CPM)**.
+    - أدخل التقييم لكل عامل SCOR، واحصل على تحليلك الاستراتيجي الكامل.
+    """)
+
+    # --- إعداد الشركات ---
+    company_names = [st.session_state.user_info.get("company", "شركتي")]
+    competitor_1 = st.text_input("🆚 اسم المنافس 1", "منافس A")
+    competitor_2 = st.text_input("🆚 اسم المنافس 2 (اختياري)", "منافس B")
+    company_names.append(competitor_1)
+    if competitor_2.strip():
+        company_names.append(competitor_2)
+
+    # --- عوامل SCOR ---
+    st.markdown("### ⚖️ الأوزان النسبية لعوامل SCOR")
+    factors = ["Plan", "Source", "Make", "Deliver", "Return"]
+    phase_weights = {f: st.slider(f"{phase_labels[f]}", 0.0, 1.0, 0.2, step=0.05) for f in factors}
+    total_weight = sum(phase_weights.values())
+    if not 0.95 <= total_weight <= 1.05:
+        st.warning(f"⚠️ مجموع الأوزان = {total_weight:.2f}. يجب أن يساوي 1 تقريبًا.")
+        st.stop()
+
+    # --- التقييمات لكل شركة ---
+    st.markdown("### ✍️ أدخل التقييمات لكل شركة (من 1 إلى 5)")
+    scores = {name: {} for name in company_names}
+    for f in factors:
+        cols = st.columns(len(company_names) + 1)
+        cols[0].markdown(f"**{phase_labels[f]}** ({phase_weights[f]})")
+        for i, name in enumerate(company_names):
+            scores[name][f] = cols[i+1].slider(f"{name} - {f}", 1.0, 5.0, 3.0, step=0.1, key=f"{name}_{f}")
+
+    # --- حساب النتائج النهائية ---
+    st.markdown("### ✅ النتائج النهائية")
+    final_results = {name: round(sum(phase_weights[f] * scores[name][f] for f in factors), 2) for name in company_names}
+    result_df = pd.DataFrame({
+        "الشركة": list(final_results.keys()),
+        "النتيجة النهائية (CPM)": list(final_results.values())
+    })
+    st.dataframe(result_df, use_container_width=True)
+
+    # --- رسم بياني للمقارنة ---
+    st.subheader("📊 مقارنة بصرية بين الشركات")
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=list(final_results.keys()),
+        y=list(final_results.values()),
+        marker_color=["green" if name == company_names[0] else "orange" for name in final_results],
+        text=[f"{v:.2f}" for v in final_results.values()],
+        textposition="auto"
+    ))
+    fig.update_layout(title="تحليل تنافسي باستخدام CPM", xaxis_title="الشركة", yaxis_title="النتيجة النهائية", yaxis=dict(range=[0, 5]))
+    st.plotly_chart(fig)
+
+    # --- توصيات ذكية حسب النتائج ---
+    st.subheader("🧠 توصيات ذكية حسب الأداء التنافسي")
+    for name, score in final_results.items():
+        if score >= 4:
+            st.success(f"✅ {name}: أداء قوي. يُوصى بالاستمرار وتوسيع التكامل الذكي.")
+        elif score >= 3:
+            st.warning(f"🟡 {name}: أداء جيد نسبيًا. يُوصى بتحسين الجاهزية التشغيلية والتحليل اللحظي.")
+        else:
+            st.error(f"🔴 {name}: أداء ضعيف. يُنصح بإعادة بناء العمليات وتكامل RPA وAutoML.")
+
+    # --- تسجيل العمليات في السجل ---
+    def company_log_entry(status, method):
+        now = datetime.now().strftime("%Y-%m-%d %H:%M")
+        user = st.session_state.user_info
+        log_entry = {
+            "الاسم": user.get("name", ""),
+            "الشركة": user.get("company", ""),
+            "القطاع": user.get("sector", ""),
+            "الدولة": user.get("country", ""),
+            "التاريخ": now,
+            "متوسط IoT": st.session_state.get("iot_avg", 0),
+            "نتيجة CPM": final_results.get(user.get("company", "شركتي"), 0),
+            "حالة العملية": status,
+            "الطريقة": method
+        }
+        for phase, score in st.session_state.results.items():
+            log_entry[f"SCOR - {phase}"] = score
+        return log_entry
+
+    # --- تصدير JSON ---
+    st.subheader("📤 تحميل ملف JSON للتكامل")
+    export_data = {
+        "user": st.session_state.user_info,
+        "SCOR_scores": st.session_state.results,
+        "IoT_score": st.session_state.iot_avg,
+        "SWOT": st.session_state.swot,
+        "CPM_Results": final_results
+    }
+    json_str = json.dumps(export_data, ensure_ascii=False, indent=2)
+    st.code(json_str, language='json')
+    st.download_button("⬇️ تحميل JSON", data=json_str, file_name="scor_ai_export.json", mime="application/json")
+
+    # --- Webhook إرسال ---
+    st.subheader("📡 إرسال النتائج إلى نظام خارجي (Webhook)")
+    webhook_url = st.text_input("🔗 رابط Webhook (ERP/Odoo)", placeholder="https://example.com/webhook")
+    if st.button("📨 إرسال البيانات"):
+        if webhook_url:
+            # الإرسال يتم في الخلفية عبر صندوق الصادر، وحالته النهائية تُسجَّل في سجل العمليات
+            delivery_id = webhook_outbox.send(webhook_url, export_data, company_log_entry("قيد الإرسال", "Webhook"))
+            st.session_state.setdefault("webhook_deliveries", []).append(delivery_id)
+            st.success("📬 تمت إضافة البيانات إلى قائمة الإرسال.")
+        else:
+            st.warning("يرجى إدخال رابط Webhook.")
+    if st.session_state.get("webhook_deliveries"):
+        delivery_status_panel()
+
+    # --- QR Code لفتح الرابط الخارجي (BI / ERP) ---
+    st.subheader("📱 فتح رابط Power BI أو ERP عبر QR")
+    qr_link = st.text_input("🔗 أدخل الرابط", placeholder="https://powerbi.com/report?id=123")
+    if qr_link:
+        st.image(qr_codes.qr_png(qr_link), caption="امسح QR لفتح الرابط", width=200)
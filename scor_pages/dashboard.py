@@ -0,0 +1,207 @@
+# صفحة: 📊 لوحة التحكم الرئيسية
+
+from functools import partial
+
+import streamlit as st
+
+import dashboard_report
+import exports
+import page_router
+import qr_codes
+from lazy_imports import lazy_import
+
+go = lazy_import("plotly.graph_objects")
+
+
+def render():
+    st.header("📊 لوحة التحكم الرئيسية")
+
+    # === استرجاع البيانات ===
+    user = st.session_state.get("user_info", {})
+    results = st.session_state.get("results", {})
+    iot_avg = st.session_state.get("iot_avg", 0)
+    swot = st.session_state.get("swot", {})
+    cpm_results = st.session_state.get("cpm_results", {})  # من صفحة CPM
+    company_name = user.get("company", "شركتي")
+
+    # حساب المتوسط العام لـ SCOR
+    scor_avg = round(sum(results.values()) / len(results), 2) if results else 0
+    cpm_score = cpm_results.get(company_name, "لم يتم التقييم")
+
+    # === KPIs الرئيسية ===
+    st.subheader("📈 مؤشرات الأداء الرئيسية (KPIs)")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("📦 متوسط SCOR", f"{scor_avg}/5")
+    col2.metric("🌐 جاهزية IoT", f"{iot_avg}/5")
+    col3.metric("🏁 نتيجة CPM", cpm_score if isinstance(cpm_score, str) else f"{cpm_score}/5")
+
+    st.subheader("🧠 تحليل SWOT - ملخص")
+    col4, col5, col6, col7 = st.columns(4)
+    col4.metric("✅ القوة", len(swot.get("قوة", [])))
+    col5.metric("⚠️ الضعف", len(swot.get("ضعف", [])))
+    col6.metric("🚀 الفرص", len(swot.get("فرصة", [])))
+    col7.metric("⛔ التهديدات", len(swot.get("تهديد", [])))
+
+    # === رسم بياني لأداء SCOR ===
+    st.subheader("📊 أداء شركتي حسب مراحل SCOR")
+
+    results = st.session_state.get("results", {})
+    phase_labels = {
+        "Plan": "📘 التخطيط",
+        "Source": "📦 التوريد",
+        "Make": "🏭 التصنيع",
+        "Deliver": "🚚 التوزيع",
+        "Return": "🔁 المرتجعات"
+    }
+
+    if results:
+        labels = list(results.keys())
+        values = list(results.values())
+
+        # تحويل أسماء SCOR إلى تسميات بالعربية
+        labels_arabic = [phase_labels.get(l, l) for l in labels]
+
+        fig = go.Figure([go.Bar(
+            x=labels_arabic,
+            y=values,
+            text=[f"{v:.1f}" for v in values],
+            textposition='auto',
+            marker_color='lightblue'
+        )])
+        fig.update_layout(
+            title="📊 تقييم الجاهزية الرقمية حسب مراحل SCOR",
+            xaxis_title="المرحلة",
+            yaxis_title="التقييم",
+            yaxis=dict(range=[0, 5]),
+            height=450
+        )
+        st.plotly_chart(fig)
+    else:
+        st.warning("⚠️ لم يتم تنفيذ تقييم SCOR بعد.")
+
+    # === رسم بياني لمقارنة CPM بين شركتي والمنافسين ===
+    st.subheader("🏁 مقارنة شركتي مع المنافسين - مصفوفة CPM")
+
+    cpm_results = st.session_state.get("cpm_results", {})
+    company_name = st.session_state.get("user_info", {}).get("company", "شركتي")
+
+    if cpm_results:
+        names = list(cpm_results.keys())
+        values = list(cpm_results.values())
+        colors = ["green" if name == company_name else "orange" for name in names]
+
+        fig = go.Figure([go.Bar(
+            x=names,
+            y=values,
+            text=[f"{v:.2f}" for v in values],
+            textposition='auto',
+            marker_color=colors
+        )])
+        fig.update_layout(
+            title="🔎 المقارنة التنافسية حسب CPM",
+            xaxis_title="الشركة",
+            yaxis_title="النتيجة النهائية",
+            yaxis=dict(range=[0, 5]),
+            height=450
+        )
+        st.plotly_chart(fig)
+
+        # ملاحظة حسب الموقع
+        top_company = max(cpm_results, key=cpm_results.get)
+        if top_company == company_name:
+            st.success("👏 شركتك في المركز الأول مقارنة بالمنافسين!")
+        else:
+            st.info(f"👀 الشركة الأفضل حاليًا: **{top_company}**. يُوصى بتحليل الفجوات وتحسين جاهزية SCOR.")
+    else:
+        st.warning("⚠️ لم يتم تسجيل نتائج CPM بعد. الرجاء إدخالها من صفحة '🏢 مقارنة الشركات'.")
+    # ✅ تأكد من جلب البيانات من الـ session قبل أي استخدام
+    user = st.session_state.get("user_info", {})
+    company_name = user.get("company", "شركتي")
+    iot_avg = st.session_state.get("iot_avg", 0)
+    cpm_results = st.session_state.get("cpm_results", {})
+
+    # === تجهيز البيانات للتصدير ===
+    export_data = {
+        "اسم المستخدم": "غير متاح",
+        "الدولة": user.get("country", ""),
+        "القطاع": user.get("sector", ""),
+        "SCOR": st.session_state.get("results", {}),
+        "IoT": iot_avg,
+        "SWOT": st.session_state.get("swot", {}),
+        "CPM": cpm_results
+    }
+
+    # ملفات JSON و Excel تُبنى فقط عند الضغط على زر التحميل وتُحفظ في كاش الجلسة
+    export_cache = st.session_state.setdefault("export_cache", {})
+    json_export = exports.lazy_export(export_cache, "dashboard_json", exports.build_json, export_data)
+    excel_export = exports.lazy_export(export_cache, "dashboard_excel", exports.build_excel, export_data,
+                                       sheet_name="Dashboard")
+
+    # --- تصدير PDF يدعم اللغة العربية ---
+    # يُنشأ التقرير فقط عند الضغط على زر التحميل، ويُخزَّن في كاش حسب بصمة البيانات
+    dashboard_pdf = partial(
+        dashboard_report.get_dashboard_pdf,
+        user.get("company", "شركتي"),
+        user.get("country", ""),
+        user.get("sector", ""),
+        dict(st.session_state.get("results", {})),
+        st.session_state.get("iot_avg", 0),
+        cpm_results.get(company_name, "غير متاحة"),
+    )
+
+    # === زر تحميل PDF ===
+    st.download_button("⬇️ تحميل تقرير PDF", data=dashboard_pdf, file_name="dashboard_report.pdf", mime="application/pdf")
+
+    # === تصدير النتائج والتقارير ===
+    st.subheader("📤 تصدير النتائج والتقارير")
+
+    with st.expander("📁 تحميل البيانات"):
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.download_button(
+                label="⬇️ تحميل JSON",
+                data=json_export,
+                file_name="dashboard_data.json",
+                mime="application/json",
+                key="download_json"
+            )
+
+        with col2:
+            st.download_button(
+                label="⬇️ تحميل Excel",
+                data=excel_export,
+                file_name="dashboard_data.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                key="download_excel"
+            )
+
+        with col3:
+            st.download_button(
+                label="⬇️ تحميل تقرير PDF",
+                data=dashboard_pdf,
+                file_name="dashboard_report.pdf",
+                mime="application/pdf",
+                key="download_pdf"
+            )
+
+    # === روابط تنقل ذكية داخل المنصة ===
+    st.subheader("🔗 روابط سريعة")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.button("🔄 إعادة التقييم", on_click=page_router.go_to, args=("📝 التقييم",))
+    with col2:
+        st.button("📊 تحليل النتائج", on_click=page_router.go_to, args=("📊 النتائج والتحليل",))
+    with col3:
+        st.button("🏢 مقارنة الشركات", on_click=page_router.go_to, args=("🏢 مقارنة الشركات",))
+
+    st.markdown("---")
+
+    # === QR Code لفتح لوحة خارجية مثل Power BI أو ERP ===
+    st.subheader("📱 فتح النتائج على الجوال - QR Code")
+
+    qr_link = st.text_input("🔗 أدخل رابط لوحة خارجية (مثل Power BI أو ERP)", placeholder="https://example.com/dashboard")
+
+    if qr_link:
+        st.image(qr_codes.qr_png(qr_link), caption="امسح QR لفتح الرابط", width=200)
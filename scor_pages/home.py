@@ -0,0 +1,91 @@
+# صفحة: 🏠 الصفحة الرئيسية
+
+import streamlit as st
+
+
+def render():
+    st.image("https://cdn-icons-png.flaticon.com/512/3135/3135715.png", width=100)
+    
+    # عنوان المشروع الرئيسي بخط أكبر
+    st.markdown("""
+    <div style='
+        background-color:#e0f7fa;
+        padding: 25px;
+        border-radius: 15px;
+        margin-bottom: 30px;
+        box-shadow: 2px 2px 10px rgba(0,0,0,0.05);
+    '>
+        <h1 style='text-align: center; color: #004d61;'>منصة التحليل الذكي لأداء سلاسل الإمداد</h1>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # بيانات الطالبة
+    st.markdown("""
+    <div style='
+        background-color: #fefefe;
+        padding: 20px;
+        border-left: 6px solid #4db6ac;
+        border-radius: 10px;
+        margin-bottom: 20px;
+    '>
+        <h3 style='color:#00796b;'>🧑‍🎓 بيانات الطالبة</h3>
+        <ul style='font-size:18px; line-height:1.8; color:#333;'>
+            <li><strong>الاسم:</strong> سها ناصر سعيد عماره</li>
+            <li><strong>الكلية:</strong> كلية التجارة – جامعة القاهرة</li>
+            <li><strong>الفرقة:</strong> ماجستير مهني – رعاية صحية</li>
+            <li><strong>مشرف المشروع:</strong> أ.د. عماد قمحاوي</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # عنوان المشروع
+    st.markdown("""
+    <div style='
+        background-color: #fff3e0;
+        padding: 20px;
+        border-left: 6px solid #ffa726;
+        border-radius: 10px;
+        margin-bottom: 20px;
+    '>
+        <h3 style='color:#ef6c00;'>📘 عنوان مشروع التخرج</h3>
+        <p style='font-size:18px; color:#444;'>
+        <strong>Smart AI Benchmarking Platform for Supply Chain Excellence using SCOR Model</strong><br>
+        منصة ذكية لتقييم وتحليل أداء سلاسل الإمداد باستخدام نموذج SCOR والذكاء الاصطناعي.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # فكرة المشروع
+    st.markdown("""
+    <div style='
+        background-color: #e8f5e9;
+        padding: 20px;
+        border-left: 6px solid #66bb6a;
+        border-radius: 10px;
+        margin-bottom: 20px;
+    '>
+        <h3 style='color:#388e3c;'>🎯 فكرة المشروع</h3>
+        <p style='font-size:18px; color:#333; line-height:1.8;'>
+        يقوم المشروع بتحليل جاهزية الشركات عبر مراحل SCOR (التخطيط، التوريد، التصنيع، التوزيع، المرتجعات)، 
+        مع إدماج تقنيات الذكاء الاصطناعي وإنترنت الأشياء، وتقديم توصيات ذكية، مقارنة تنافسية، ولوحات تحكم تفاعلية، 
+        بالإضافة إلى التكامل مع أنظمة مثل <strong>Odoo</strong> و<strong>Power BI</strong>.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # وسيلة التواصل
+    st.markdown("""
+    <div style='
+        background-color: #f3e5f5;
+        padding: 20px;
+        border-left: 6px solid #ab47bc;
+        border-radius: 10px;
+        margin-bottom: 30px;
+    '>
+        <h3 style='color:#8e24aa;'>📬 تواصل معي</h3>
+        <p style='font-size:18px; color:#333;'>📧 البريد الإلكتروني: <strong>sohaemara22@gmail.com</strong></p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # إشعار جاهزية المنصة
+    st.success("✨ المنصة جاهزة للعرض 💪")
@@ -0,0 +1,88 @@
+# صفحة: 🧾 سجل التقييمات
+
+from functools import partial
+
+import streamlit as st
+
+import exports
+import log_loader
+import log_report
+from lazy_imports import lazy_import
+
+go = lazy_import("plotly.graph_objects")
+
+
+def render():
+    st.header("🧾 سجل التقييمات والعمليات السابقة")
+
+    df_log = log_loader.load_log()
+
+    if not df_log.empty:
+
+        st.success(f"✅ تم تحميل السجل. عدد العمليات: {len(df_log)}")
+
+        # --- تصفية حسب الشركة ---
+        companies = df_log["الشركة"].dropna().unique().tolist()
+        selected_company = st.selectbox("🔍 اختر شركة لعرض سجلها:", ["كل الشركات"] + companies)
+
+        if selected_company != "كل الشركات":
+            df_log = df_log[df_log["الشركة"] == selected_company]
+
+        st.dataframe(df_log, use_container_width=True)
+
+        # --- تصدير متدفق من المخزن (يُبنى عند الضغط فقط) ---
+        fmt = st.selectbox("🗂️ صيغة التصدير", exports.export_formats(), key="log_export_format")
+        ext, mime = exports.EXPORT_FORMATS[fmt]
+        company_filter = None if selected_company == "كل الشركات" else selected_company
+        st.download_button(f"⬇️ تحميل {fmt}", data=partial(exports.export_log, fmt, "log", company=company_filter),
+                           file_name=f"data_log_export.{ext}", mime=mime)
+        stats = exports.export_stats("log")
+        if stats:
+            st.caption(exports.format_stats(stats))
+
+        # --- تقرير PDF متدفق (يُكتب صفحةً صفحة من المخزن عند الضغط فقط) ---
+        st.markdown("**📄 تقرير PDF للسجل**")
+        col1, col2, col3 = st.columns(3)
+        max_rows = col1.number_input("الحد الأقصى للصفوف", min_value=100, max_value=log_report.MAX_ROWS_LIMIT,
+                                     value=log_report.DEFAULT_MAX_ROWS, step=1000, key="log_pdf_rows")
+        date_from = col2.date_input("من تاريخ", value=None, key="log_pdf_from")
+        date_to = col3.date_input("إلى تاريخ", value=None, key="log_pdf_to")
+        st.download_button("⬇️ تحميل PDF", data=partial(log_report.export_log_pdf, max_rows, company=company_filter,
+                                                       date_from=date_from, date_to=date_to),
+                           file_name="data_log_report.pdf", mime="application/pdf")
+        pdf_stats = exports.export_stats("log_pdf")
+        if pdf_stats:
+            st.caption(f"{exports.format_stats(pdf_stats)} | {pdf_stats['pages']:,} صفحة")
+
+        # ✅ ✅ ✅ تحليل إحصائي هنا جوا نفس الشرط
+        st.subheader("📊 تحليل بصري للسجل")
+
+        if not df_log.empty:
+            # --- عدد التقييمات لكل شركة ---
+            company_counts = df_log["الشركة"].value_counts().reset_index()
+            company_counts.columns = ["الشركة", "عدد التقييمات"]
+
+            fig1 = go.Figure([go.Bar(
+                x=company_counts["الشركة"],
+                y=company_counts["عدد التقييمات"],
+                text=company_counts["عدد التقييمات"],
+                textposition="auto",
+                marker_color='teal'
+            )])
+            fig1.update_layout(title="📦 عدد التقييمات حسب الشركة", height=400)
+            st.plotly_chart(fig1)
+
+            # --- حالات العمليات ---
+            status_counts = df_log["حالة العملية"].value_counts().reset_index()
+            status_counts.columns = ["الحالة", "عدد العمليات"]
+
+            fig2 = go.Figure([go.Pie(
+                labels=status_counts["الحالة"],
+                values=status_counts["عدد العمليات"],
+                hole=0.4
+            )])
+            fig2.update_layout(title="🧮 توزيع حالات العمليات (نجاح / فشل / خطأ)", height=400)
+            st.plotly_chart(fig2)
+
+    else:
+        st.warning("⚠️ لا يوجد سجل حتى الآن. سيتم إنشاء السجل تلقائيًا عند تصدير أو إرسال نتائج.")
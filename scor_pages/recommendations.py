@@ -0,0 +1,104 @@
+# صفحة: 🤖 التوصيات الذكية
+
+import streamlit as st
+
+import scoring_engine
+from lazy_imports import lazy_import
+from scor_pages.common import phase_labels
+
+pd = lazy_import("pandas")
+px = lazy_import("plotly.express")
+
+
+def render():
+    st.header("🤖 التوصيات الذكية المدعومة بالذكاء الاصطناعي")
+
+    results = st.session_state.get("results", {})
+    iot_avg = st.session_state.get("iot_avg", 0)
+    swot = st.session_state.get("swot", {})
+
+    if not results:
+        st.warning("⚠️ يرجى تنفيذ التقييم أولًا.")
+        st.stop()
+
+    # --- توصيات SCOR ---
+    st.subheader("✨ توصيات حسب الجاهزية في مراحل SCOR")
+
+    categories = []
+    for phase, score in results.items():
+        label = phase_labels.get(phase, phase)
+        bucket = scoring_engine.swot_buckets(score)
+        if bucket == "ضعف":
+            categories.append("منخفضة")
+            st.markdown(f"🔴 **{label}:** منخفض الجاهزية. يُوصى باستخدام RPA، والتنبؤ الآلي بالطلب (AutoML)، وتبسيط العمليات.")
+        elif bucket == "فرصة":
+            categories.append("متوسطة")
+            st.markdown(f"🟠 **{label}:** متوسط الجاهزية. يُوصى بتوسيع التكامل مع أنظمة ERP، وتفعيل لوحات تحكم ذكية، وتحليل بيانات الموردين باستخدام ML.")
+        else:
+            categories.append("مرتفعة")
+            st.markdown(f"🟢 **{label}:** جاهزية عالية. يُوصى بتفعيل التعلم الآلي والتنبؤات الذكية، مثل الصيانة التنبؤية وتحسين توجيه الشحنات.")
+
+    st.divider()
+
+    # --- Dashboard بصري للتوصيات ---
+    st.subheader("📊 ملخص التوصيات (Dashboard)")
+    from collections import Counter
+
+    summary = Counter(categories)
+    dash_df = pd.DataFrame({
+        "مستوى الجاهزية": list(summary.keys()),
+        "عدد المراحل": list(summary.values())
+    })
+
+    fig = px.pie(dash_df, names="مستوى الجاهزية", values="عدد المراحل",
+                 color_discrete_sequence=["#E74C3C", "#F1C40F", "#2ECC71"])
+    fig.update_traces(textinfo="label+percent", pull=[0.05, 0.05, 0.1])
+    st.plotly_chart(fig)
+
+    st.divider()
+
+    # --- توصيات IoT ---
+    st.subheader("🌐 توصيات إنترنت الأشياء (IoT)")
+    if iot_avg < 2:
+        st.error("جاهزية IoT منخفضة. يُنصح بتركيب حساسات وربطها بالأنظمة الرقمية وبدء تجميع البيانات.")
+    elif iot_avg < 4:
+        st.warning("جاهزية متوسطة. يُنصح بتحسين الاتصالات وتحليل البيانات باستخدام أنظمة Edge AI.")
+    else:
+        st.success("جاهزية ممتازة لإنترنت الأشياء. يُوصى بالانتقال إلى Digital Twin ونماذج محاكاة ذكية.")
+    st.divider()
+
+    # --- توصيات استراتيجية حسب SWOT ---
+    st.subheader("🏁 توصيات استراتيجية ذكية")
+    if swot.get("ضعف"):
+        st.markdown("- 📉 **نقاط الضعف:** " + ", ".join(swot["ضعف"]))
+        st.markdown("  - 🛠️ **حلول:** أتمتة المعالجة اليدوية، بناء نظام DSS، تدريب الموظفين.")
+    if swot.get("فرصة"):
+        st.markdown("- 🚀 **الفرص:** " + ", ".join(swot["فرصة"]))
+        st.markdown("  - 🌟 **استغلال:** تطوير خدمات مدعومة بالذكاء الاصطناعي وتحقيق ميزة تنافسية.")
+    if swot.get("قوة"):
+        st.markdown("- 🛡️ **نقاط القوة:** " + ", ".join(swot["قوة"]))
+        st.markdown("  - ✅ **تعظيم:** استغلال الموارد الحالية لتوسيع التحول الرقمي واستخدام AI.")
+    st.divider()
+
+    # --- إعادة تصميم الخدمة ---
+    st.subheader("🔧 حلول متقدمة لإعادة تصميم الخدمة")
+    st.markdown("""
+    - 🧩 **تحليل As-Is:** حصر نقاط الضعف والعمليات اليدوية.
+    - 🔄 **إعادة تصميم:**
+        - أتمتة العمليات بـ RPA وPython.
+        - التكامل مع أنظمة ERP و DSS.
+        - استخدام AutoML للتنبؤ وتحسين الأداء.
+    - 🎯 **التحسين المستمر:** عبر لوحات تحكم تفاعلية وتحليلات الوقت الحقيقي.
+    """)
+    st.divider()
+
+    # --- أدوات دعم القرار وروابط مفيدة ---
+    st.subheader("📚 أدوات وتقنيات مقترحة")
+    st.markdown("""
+    - 🔗 [Google AutoML](https://cloud.google.com/automl) – بناء نماذج ذكاء صناعي تلقائيًا.
+    - 🔗 [Azure Machine Learning](https://azure.microsoft.com/en-us/services/machine-learning/) – منصة مايكروسوفت للذكاء الاصطناعي المؤسسي.
+    - 🔗 [Power BI](https://powerbi.microsoft.com/ar-sa/) – لوحات تحكم تفاعلية وتحليل بيانات بصري.
+    - 🔗 [Digital Twin Technology](https://www.ibm.com/topics/digital-twin) – لإنشاء نماذج رقمية لمحاكاة العمليات.
+    - 🔗 [Edge AI Concepts](https://www.edge-ai-vision.com/) – التحليل على الأجهزة الطرفية دون إرسال البيانات للسحابة.
+    """)
+    st.success("✅ شكراً لاستخدامك المنصة. يمكنك تحميل التوصيات أو الرجوع للنتائج.")
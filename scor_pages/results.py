@@ -0,0 +1,174 @@
+# صفحة: 📊 النتائج والتحليل
+
+import base64
+from functools import partial
+from io import BytesIO
+
+import streamlit as st
+
+import exports
+import font_service
+import scoring_engine
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+go = lazy_import("plotly.graph_objects")
+
+
+def render():
+    st.header("📊 النتائج ومصفوفات التحليل")
+
+    if not st.session_state.results:
+        st.warning("⚠️ يرجى تنفيذ التقييم أولًا.")
+        st.stop()
+
+    results = st.session_state.results
+    swot = st.session_state.swot
+    iot_avg = st.session_state.iot_avg
+    user = st.session_state.user_info
+
+    # --- تقييم مراحل SCOR ---
+    st.subheader("📈 تقييم مراحل SCOR")
+    labels = list(results.keys())
+    values = list(results.values())
+    fig = go.Figure([go.Bar(x=labels, y=values, text=[f"{v:.1f}" for v in values], textposition='auto')])
+    fig.update_layout(title="مستوى الجاهزية في مراحل SCOR", yaxis_range=[0, 5], height=400)
+    st.plotly_chart(fig)
+    st.divider()
+
+    # --- تحليل SWOT ---
+    st.subheader("🧠 تحليل SWOT")
+    for key, title in {"قوة": "✅ نقاط القوة", "ضعف": "⚠️ نقاط الضعف", "فرصة": "🚀 الفرص", "تهديد": "⛔ التهديدات"}.items():
+        st.markdown(f"### {title}")
+        if swot.get(key):
+            for i, item in enumerate(swot[key], 1):
+                st.markdown(f"**{i}.** {item}")
+        else:
+            st.markdown("- لا توجد بيانات.")
+    st.divider()
+
+    # --- تقييم IFE و EFE ---
+    st.subheader("📌 تقييم IFE و EFE")
+    ife_inputs, efe_inputs = [], []
+    for i, item in enumerate(swot["قوة"] + swot["ضعف"]):
+        weight = st.number_input(f"📌 {item} (الوزن الداخلي)", 0.0, 1.0, 0.1, step=0.05, key=f"ife_weight_{i}")
+        rating = st.slider(f"التقييم لـ {item}", 1, 4, 3, key=f"ife_rating_{i}")
+        ife_inputs.append(weight * rating)
+    for i, item in enumerate(swot["فرصة"] + swot["تهديد"]):
+        weight = st.number_input(f"🌐 {item} (الوزن الخارجي)", 0.0, 1.0, 0.1, step=0.05, key=f"efe_weight_{i}")
+        rating = st.slider(f"التقييم لـ {item}", 1, 4, 3, key=f"efe_rating_{i}")
+        efe_inputs.append(weight * rating)
+    ife_total = sum(ife_inputs)
+    efe_total = sum(efe_inputs)
+    st.success(f"✅ مجموع IFE: {ife_total:.2f} | مجموع EFE: {efe_total:.2f}")
+    st.divider()
+
+    # --- الاستراتيجية المقترحة ---
+    st.subheader("🧭 الاستراتيجية المقترحة")
+    if ife_total >= 3 and efe_total >= 3:
+        strategy = "💼 استراتيجية النمو والفرص (Growth Strategy)"
+    elif ife_total < 3 and efe_total >= 3:
+        strategy = "🔄 استراتيجية التحول والتحسين (Turnaround Strategy)"
+    elif ife_total >= 3 and efe_total < 3:
+        strategy = "🛡️ استراتيجية الدفاع (Defensive Strategy)"
+    else:
+        strategy = "⚠️ استراتيجية البقاء والنجاة (Survival Strategy)"
+    st.markdown(f"**الاستراتيجية المقترحة:** {strategy}")
+    st.divider()
+
+    # --- مصفوفة BCG ---
+    st.subheader("📊 BCG Matrix – Strategic Positioning of SCOR Phases")
+    bcg_x = [round(score, 2) for score in results.values()]
+    bcg_y = round(iot_avg, 2)
+    quadrants = scoring_engine.bcg_quadrants(bcg_x, bcg_y)
+    bcg_data = [{"SCOR Phase": phase, "IFE (X)": x, "EFE (Y)": bcg_y, "Quadrant": quadrant}
+                for phase, x, quadrant in zip(results, bcg_x, quadrants)]
+    bcg_df = pd.DataFrame(bcg_data)
+    st.dataframe(bcg_df, use_container_width=True)
+
+    fig = go.Figure()
+    for row in bcg_data:
+        fig.add_trace(go.Scatter(x=[row["IFE (X)"]], y=[row["EFE (Y)"]],
+                                 mode="markers+text",
+                                 marker=dict(size=20, color="blue"),
+                                 text=[row["SCOR Phase"]],
+                                 textposition="middle center"))
+    fig.add_shape(type="line", x0=3, y0=0, x1=3, y1=5, line=dict(color="gray", width=2, dash="dash"))
+    fig.add_shape(type="line", x0=0, y0=3, x1=5, y1=3, line=dict(color="gray", width=2, dash="dash"))
+    fig.update_layout(title="BCG Matrix", xaxis_title="IFE", yaxis_title="EFE (IoT)",
+                      xaxis=dict(range=[1, 5]), yaxis=dict(range=[1, 5]),
+                      height=600, showlegend=False)
+    st.plotly_chart(fig)
+    st.divider()
+
+    # --- مصفوفة IE ---
+    st.subheader("📊 IE Matrix – Strategic Positioning")
+    region = scoring_engine.ie_regions(ife_total, efe_total)
+    st.markdown(f"📍 **IFE Score:** {ife_total:.2f} | **EFE Score:** {efe_total:.2f}")
+    st.markdown(f"🧭 **Strategic Region:** {region}")
+    fig = go.Figure()
+    strategies = [("I (Grow)", "green"), ("II (Grow)", "green"), ("III (Hold)", "yellow"),
+                  ("IV (Grow)", "green"), ("V (Hold)", "yellow"), ("VI (Harvest)", "orange"),
+                  ("VII (Hold)", "yellow"), ("VIII (Harvest)", "orange"), ("IX (Exit)", "red")]
+    idx = 0
+    for y in reversed(range(3)):
+        for x in range(3):
+            fig.add_shape(type="rect", x0=x, y0=y, x1=x + 1, y1=y + 1,
+                          line=dict(color="black", width=1),
+                          fillcolor=strategies[idx][1], opacity=0.3)
+            fig.add_annotation(x=x + 0.5, y=y + 0.5, text=strategies[idx][0],
+                               showarrow=False, font=dict(size=13))
+            idx += 1
+    fig.add_trace(go.Scatter(x=[min(max((ife_total - 1), 0), 3)],
+                             y=[min(max((efe_total - 1), 0), 3)],
+                             mode="markers+text",
+                             marker=dict(color="black", size=14, symbol="x"),
+                             text=["Your Position"],
+                             textposition="top center"))
+    fig.update_layout(title="IE Matrix",
+                      xaxis=dict(title="IFE", range=[0, 3], tickvals=[0.5, 1.5, 2.5], ticktext=["Weak", "Average", "Strong"]),
+                      yaxis=dict(title="EFE", range=[0, 3], tickvals=[0.5, 1.5, 2.5], ticktext=["Low", "Medium", "High"]),
+                      width=600, height=600, showlegend=False)
+    st.plotly_chart(fig)
+    st.divider()
+
+    # --- تصدير شامل PDF ---
+    st.subheader("📤 تحميل تقرير PDF شامل")
+    # الخط يُحلَّل مرة واحدة لكل عملية (font_service) ويُضمَّن منه الحروف المستخدمة فقط
+    pdf = font_service.new_fpdf(14)
+    pdf.add_page()
+    title, user_line, scores_line, strategy_line, region_line = font_service.pdf_texts([
+        "📄 تقرير الاستراتيجية الكاملة",
+        f"المستخدم: {user.get('name', '')}",
+        f"IFE: {ife_total:.2f} | EFE: {efe_total:.2f}",
+        f"BCG Region: {strategy}",
+        f"IE Matrix Region: {region}",
+    ])
+    pdf.cell(200, 10, txt=title, ln=True, align="C")
+    pdf.cell(200, 10, txt=user_line, ln=True)
+    pdf.cell(200, 10, txt=scores_line, ln=True)
+    pdf.cell(200, 10, txt=strategy_line, ln=True)
+    pdf.cell(200, 10, txt=region_line, ln=True)
+    buffer = BytesIO()
+    pdf_output = pdf.output(dest='S').encode('latin-1')
+    buffer.write(pdf_output)
+    b64_pdf = base64.b64encode(buffer.getvalue()).decode()
+    st.markdown(f'<a href="data:application/pdf;base64,{b64_pdf}" download="Strategic_Report.pdf">📄 تحميل التقرير PDF</a>', unsafe_allow_html=True)
+
+    # --- تصدير Excel ---
+    st.subheader("📥 تحميل ملفات Excel")
+    export_df = pd.DataFrame({
+        "IFE Scores": ife_inputs + [None] * (len(efe_inputs) - len(ife_inputs)),
+        "EFE Scores": efe_inputs + [None] * (len(ife_inputs) - len(efe_inputs))
+    })
+    ie_df = pd.DataFrame({
+        "IFE Total": [round(ife_total, 2)],
+        "EFE Total": [round(efe_total, 2)],
+        "IE Region": [region],
+        "Strategy": [
+            "Grow" if "Grow" in region else "Hold" if "Hold" in region else "Harvest/Exit"
+        ]
+    })
+    # الملف يُبنى في الذاكرة عند الضغط فقط، بدل strategic_outputs.xlsx مشترك على القرص
+    sheets = [("IFE_EFE", export_df), ("BCG", bcg_df), ("IE", ie_df)]
+    st.download_button("⬇️ تحميل النتائج Excel", data=partial(exports.build_sheets_excel, sheets), file_name="strategic_outputs.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
@@ -0,0 +1,51 @@
+# صفحة: 📈 تحليل الأداء حسب القطاع
+
+import streamlit as st
+
+import assessment_store
+from lazy_imports import lazy_import
+
+px = lazy_import("plotly.express")
+
+
+def render():
+    st.header("📈 تحليل الأداء حسب القطاع أو الدولة")
+
+    if assessment_store.count_log_entries():
+
+        # اختيار نوع التحليل
+        filter_by = st.radio("🔍 تحليل حسب:", ["القطاع", "الدولة"])
+        filter_column = "القطاع" if filter_by == "القطاع" else "الدولة"
+
+        # المتوسطات محسوبة مسبقًا (مجموع/عدد) لكل قطاع/دولة ويتم تحديثها مع كل قيد في السجل
+        dimension = "sector" if filter_by == "القطاع" else "country"
+        avg_scores = assessment_store.load_aggregates(dimension).reset_index()
+
+        avg_scores.rename(columns={
+            "key": filter_column,
+            "cpm_score": "متوسط CPM",
+            "iot_avg": "متوسط IoT",
+            "plan": "📘 التخطيط",
+            "source": "📦 التوريد",
+            "make": "🏭 التصنيع",
+            "deliver": "🚚 التوزيع",
+            "return_score": "🔁 المرتجعات"
+        }, inplace=True)
+
+        # عرض الجدول
+        st.dataframe(avg_scores, use_container_width=True)
+
+        # رسم بياني تفاعلي
+        st.subheader("📊 المقارنة البصرية")
+        fig = px.bar(
+            avg_scores,
+            x=filter_column,
+            y=["متوسط CPM", "متوسط IoT"],
+            barmode="group",
+            title=f"متوسط الأداء حسب {filter_column}",
+            height=450
+        )
+        st.plotly_chart(fig)
+
+    else:
+        st.warning("⚠️ لا يوجد سجل بيانات حتى الآن.")
@@ -0,0 +1,41 @@
+# صفحة: 📆 تحليل الأداء الزمني
+
+import streamlit as st
+
+import page_router
+import timeseries
+
+
+def render():
+    st.header("📆 تحليل تطور الأداء عبر الزمن")
+
+    # فهرس الشركات مبني مسبقًا ومخزن حسب إصدار السجل
+    index = timeseries.company_index()
+
+    if index:
+
+        # اختيار الشركة للتحليل
+        selected_company = st.selectbox("🏢 اختر شركة:", list(index))
+        entry = index[selected_company]
+
+        if not len(entry["x"]):
+            st.warning("⚠️ لا توجد تقييمات سابقة لهذه الشركة.")
+            st.stop()
+
+        target = st.select_slider("🎯 أقصى عدد نقاط لكل سلسلة", [100, 250, 500, 1000, 2000],
+                                  value=timeseries.DEFAULT_TARGET_POINTS)
+
+        # --- كل السلاسل (CPM و IoT ومراحل SCOR) في شكل واحد بعد التقليص ---
+        st.subheader("📈 تطور CPM و IoT ومراحل SCOR بمرور الوقت")
+        series = timeseries.downsample(entry, target)
+        fig = timeseries.build_figure(series, title=f"📉 {selected_company}")
+        st.plotly_chart(fig, use_container_width=True)
+
+        payload = timeseries.payload_size(fig)
+        page_router.record_payload(payload)
+        raw_points = len(entry["x"])
+        shown_points = max((len(x) for x, _ in series.values()), default=0)
+        st.caption(f"📦 {raw_points:,} تقييم ← {shown_points:,} نقطة لكل سلسلة | حجم الرسم: {payload / 1024:,.1f} KB")
+
+    else:
+        st.warning("⚠️ لا يوجد سجل بيانات.")
@@ -0,0 +1,97 @@
+# محرك التقييم - حسابات SCOR و SWOT و BCG و IE بشكل متجه (NumPy) دون أي اعتماد على Streamlit
+# يعمل على تقييم واحد (الواجهة) أو على مئات الآلاف من التقييمات دفعة واحدة (إعادة تقييم السجل التاريخي).
+# دوال التصنيف تعيد مصفوفة تسميات للمدخلات المتجهة، وتسمية واحدة (str) للمدخلات المفردة.
+
+import numpy as np
+
+# ======================= #
+#        العتبات
+# ======================= #
+STRENGTH_THRESHOLD = 4.0      # متوسط المرحلة >= 4 → قوة
+OPPORTUNITY_THRESHOLD = 2.5   # متوسط المرحلة >= 2.5 → فرصة، وأقل من ذلك → ضعف
+BCG_THRESHOLD = 3.0
+IE_HIGH, IE_MEDIUM = 3.0, 2.0
+
+SWOT_LABELS = np.array(["ضعف", "فرصة", "قوة"], dtype=object)
+BCG_LABELS = np.array(["🐶 Dog", "💰 Cash Cow", "❓ Question Mark", "🌟 Star"], dtype=object)
+IE_LABELS = np.array([
+    "I (Grow)", "II (Grow)", "III (Hold)",
+    "IV (Grow)", "V (Hold)", "VI (Harvest)",
+    "VII (Hold)", "VIII (Harvest)", "IX (Exit)",
+], dtype=object)
+
+
+# ======================= #
+#     متوسطات المراحل
+# ======================= #
+def phase_matrix(question_phases, phases=None):
+    # مصفوفة انتماء (عدد الأسئلة × عدد المراحل) من 0 و 1 وعدد أسئلة كل مرحلة:
+    # الضرب المصفوفي يعطي مجموع كل مرحلة، والقسمة على العدد تعطي sum/len نفسه الذي تحسبه الواجهة
+    question_phases = list(question_phases)
+    if phases is None:
+        phases = tuple(dict.fromkeys(question_phases))
+    index = {phase: i for i, phase in enumerate(phases)}
+    cols = np.array([index[p] for p in question_phases])
+    matrix = np.zeros((len(question_phases), len(phases)))
+    matrix[np.arange(len(question_phases)), cols] = 1.0
+    return tuple(phases), matrix, matrix.sum(axis=0)
+
+
+def phase_means(answers, question_phases, phases=None):
+    # answers: مصفوفة (عدد التقييمات × عدد الأسئلة)
+    # لا نضرب في 1/n مباشرة: ستة أسئلة كلها 4 تعطي 3.9999999999999996 فتصبح "قوة" "فرصة"
+    phases, matrix, counts = phase_matrix(question_phases, phases)
+    answers = np.atleast_2d(np.asarray(answers, dtype=float))
+    return phases, (answers @ matrix) / counts
+
+
+# ======================= #
+#        التصنيفات
+# ======================= #
+def swot_codes(means):
+    means = np.asarray(means, dtype=float)
+    return (means >= OPPORTUNITY_THRESHOLD).astype(np.int8) + (means >= STRENGTH_THRESHOLD)
+
+
+def swot_buckets(means):
+    return SWOT_LABELS[swot_codes(means)]
+
+
+def bcg_quadrants(phase_scores, iot):
+    # المحور X متوسط المرحلة، والمحور Y جاهزية IoT - يُقرَّبان لمنزلتين قبل المقارنة كما تعرضهما المصفوفة
+    x = np.round(np.asarray(phase_scores, dtype=float), 2)
+    y = np.round(np.asarray(iot, dtype=float), 2)
+    if x.ndim == 2 and y.ndim == 1:
+        y = y[:, None]
+    codes = (x >= BCG_THRESHOLD).astype(np.int8) + 2 * (y >= BCG_THRESHOLD)
+    return BCG_LABELS[codes]
+
+
+def _ie_level(values):
+    values = np.asarray(values, dtype=float)
+    return 2 - (values >= IE_MEDIUM).astype(np.int8) - (values >= IE_HIGH)
+
+
+def ie_regions(ife, efe):
+    # الصف حسب EFE (مرتفع/متوسط/منخفض) والعمود حسب IFE (قوي/متوسط/ضعيف)
+    return IE_LABELS[3 * _ie_level(efe) + _ie_level(ife)]
+
+
+# ======================= #
+#     تقييم مجمّع كامل
+# ======================= #
+def score_assessments(answers, question_phases, iot=None, phases=None):
+    phases, means = phase_means(answers, question_phases, phases)
+    scored = {
+        "phases": phases,
+        "means": means,
+        "swot": swot_buckets(means),
+    }
+    if iot is not None:
+        scored["bcg"] = bcg_quadrants(means, np.broadcast_to(np.asarray(iot, dtype=float), means.shape[:1]))
+    return scored
+
+
+def results_dict(phases, means_row):
+    # تحويل صف واحد إلى قاموس {المرحلة: المتوسط} بنفس شكل st.session_state.results
+    return {phase: float(v) for phase, v in zip(phases, means_row)}
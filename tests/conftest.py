@@ -0,0 +1,86 @@
+# إعدادات مشتركة للاختبارات: كل اختبار يعمل على قواعد بيانات SQLite مؤقتة خاصة به،
+# وخادم HTTP محلي بديل عن الأنظمة الخارجية (ERP / BI) لاختبارات الإرسال
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import assessment_store  # noqa: E402
+import log_loader  # noqa: E402
+import log_query  # noqa: E402
+import readiness_store  # noqa: E402
+import timeseries  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def temp_stores(tmp_path, monkeypatch):
+    # المخزنان يعيدان فتح الاتصال تلقائيًا عند تغيّر DB_PATH
+    monkeypatch.setattr(assessment_store, "DB_PATH", str(tmp_path / "scor_data.db"))
+    monkeypatch.setattr(readiness_store, "DB_PATH", str(tmp_path / "ai_readiness.db"))
+    monkeypatch.setattr(assessment_store, "LEGACY_BENCHMARK_XLSX", str(tmp_path / "benchmark_data.xlsx"))
+    monkeypatch.setattr(assessment_store, "LEGACY_LOG_XLSX", str(tmp_path / "data_log.xlsx"))
+    # الكاش مفتاحه log_version، وقد يتكرر رقم الإصدار نفسه في قاعدة بيانات الاختبار التالي
+    for module in (log_loader, log_query, timeseries):
+        monkeypatch.setattr(module, "_cache", {key: None for key in module._cache})
+    return tmp_path
+
+
+class Endpoint:
+    # خادم محلي يرد بالأكواد المحددة بالترتيب (ثم بآخر كود)، ويحسب أقصى عدد طلبات متزامنة
+    def __init__(self, codes, latency=0.0):
+        self.codes = list(codes)
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.bodies = []
+        self.active = 0
+        self.peak = 0
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with endpoint.lock:
+                    endpoint.bodies.append(body)
+                    code = endpoint.codes[min(endpoint.requests, len(endpoint.codes) - 1)]
+                    endpoint.requests += 1
+                    endpoint.active += 1
+                    endpoint.peak = max(endpoint.peak, endpoint.active)
+                try:
+                    time.sleep(endpoint.latency)
+                    self.send_response(code)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                finally:
+                    with endpoint.lock:
+                        endpoint.active -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/webhook"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def endpoints():
+    started = []
+
+    def start(codes, latency=0.0):
+        endpoint = Endpoint(codes, latency)
+        started.append(endpoint)
+        return endpoint
+
+    yield start
+    for endpoint in started:
+        endpoint.close()
@@ -0,0 +1,76 @@
+# اختبارات مخزن التقييمات (SQLite بدل إعادة كتابة benchmark_data.xlsx)
+import pandas as pd
+
+import assessment_store
+
+USER = {"name": "سها", "company": "شركة أ", "sector": "التصنيع", "country": "مصر"}
+RESULTS = {"Plan": 3.456, "Source": 2.0, "Make": 4.0, "Deliver": 3.0, "Return": 1.5}
+
+
+def test_append_assessment_adds_one_row_with_legacy_columns():
+    row_id = assessment_store.append_assessment(USER, 3.333, RESULTS, "2024-05-01 10:00")
+
+    df = assessment_store.load_assessments()
+    assert row_id == 1
+    assert list(df.columns) == list(assessment_store.EXPORT_COLUMNS.values()) + list(assessment_store.SCOR_PHASES)
+    record = df.iloc[0]
+    assert (record["الاسم"], record["الشركة"], record["التاريخ"]) == ("سها", "شركة أ", "2024-05-01 10:00")
+    assert record["متوسط IoT"] == 3.33
+    assert record["Plan"] == 3.46
+
+
+def test_missing_phases_are_stored_as_null():
+    assessment_store.append_assessment(USER, 3, {"Plan": 2.0, "Make": float("nan")})
+
+    record = assessment_store.load_assessments().iloc[0]
+    assert record["Plan"] == 2.0
+    assert pd.isna(record["Make"]) and pd.isna(record["Return"])
+
+
+def test_append_assessments_inserts_batch_in_one_version():
+    before = assessment_store.store_version()
+    rows = [({**USER, "name": f"مستخدم {i}"}, 3, RESULTS, f"2024-05-0{i + 1} 10:00") for i in range(5)]
+
+    assert assessment_store.append_assessments(rows) == 5
+    assert assessment_store.count_assessments() == 5
+    assert assessment_store.store_version() == before + 1
+    assert assessment_store.append_assessments([]) == 0
+    assert assessment_store.store_version() == before + 1
+
+
+def test_every_write_bumps_store_version():
+    versions = [assessment_store.store_version()]
+    assessment_store.append_assessment(USER, 3, RESULTS)
+    versions.append(assessment_store.store_version())
+    assessment_store.append_log_entries([{"الشركة": "شركة أ", "القطاع": "التصنيع"}])
+    versions.append(assessment_store.store_version())
+    assert versions == sorted(set(versions))
+
+
+def test_legacy_excel_is_imported_once(temp_stores, monkeypatch):
+    path = temp_stores / "legacy.xlsx"
+    pd.DataFrame([
+        {"الاسم": "قديم", "الشركة": "شركة ب", "القطاع": "التجزئة", "الدولة": "الأردن",
+         "التاريخ": "2023-01-01 09:00", "متوسط IoT": 2.5, "Plan": 3.0, "Source": 2.0},
+    ]).to_excel(path, index=False)
+    monkeypatch.setattr(assessment_store, "LEGACY_BENCHMARK_XLSX", str(path))
+    monkeypatch.setattr(assessment_store, "DB_PATH", str(temp_stores / "migrated.db"))
+
+    df = assessment_store.load_assessments()
+    assert df["الشركة"].tolist() == ["شركة ب"]
+    assert df.iloc[0]["Source"] == 2.0
+
+    # فتح المخزن من جديد لا يعيد الترحيل لأن الجدول لم يعد فارغًا
+    monkeypatch.setattr(assessment_store, "_conn", None)
+    assert assessment_store.count_assessments() == 1
+
+
+def test_export_to_excel_round_trips(temp_stores):
+    assessment_store.append_assessment(USER, 3, RESULTS, "2024-05-01 10:00")
+    path = temp_stores / "export.xlsx"
+
+    assessment_store.export_to_excel(str(path))
+
+    exported = pd.read_excel(path)
+    assert exported["الشركة"].tolist() == ["شركة أ"]
+    assert list(exported.columns) == list(assessment_store.load_assessments().columns)
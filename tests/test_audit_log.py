@@ -0,0 +1,143 @@
+# اختبارات كاتب السجل في الخلفية (audit_log.LogWriter)
+import threading
+import time
+
+import pytest
+
+import assessment_store
+import audit_log
+
+
+class Sink:
+    def __init__(self, fail_times=0):
+        self.batches = []
+        self.fail_times = fail_times
+        self.written = threading.Event()
+
+    def __call__(self, entries):
+        if self.fail_times:
+            self.fail_times -= 1
+            raise OSError("database is locked")
+        self.batches.append(list(entries))
+        self.written.set()
+
+
+@pytest.fixture
+def writer_factory():
+    writers = []
+
+    def create(sink, **kwargs):
+        writer = audit_log.LogWriter(sink=sink, **kwargs)
+        writers.append(writer)
+        return writer
+
+    yield create
+    for writer in writers:
+        writer.close()
+
+
+def test_enqueue_returns_before_write_and_flush_writes_batch(writer_factory):
+    sink = Sink()
+    writer = writer_factory(sink, flush_size=100, flush_interval=60)
+
+    for i in range(3):
+        writer.enqueue({"الشركة": f"شركة {i}"})
+    assert sink.batches == []
+
+    assert writer.flush(timeout=5)
+    assert [len(b) for b in sink.batches] == [3]
+
+
+def test_batch_written_when_flush_size_reached(writer_factory):
+    sink = Sink()
+    writer = writer_factory(sink, flush_size=5, flush_interval=60)
+
+    for i in range(5):
+        writer.enqueue({"i": i})
+
+    assert sink.written.wait(5)
+    assert [len(b) for b in sink.batches] == [5]
+
+
+def test_batch_written_after_flush_interval(writer_factory):
+    sink = Sink()
+    writer = writer_factory(sink, flush_size=100, flush_interval=0.05)
+
+    writer.enqueue({"i": 0})
+
+    assert sink.written.wait(5)
+
+
+def test_failed_write_is_retried_with_next_batch(writer_factory, capsys):
+    sink = Sink(fail_times=1)
+    writer = writer_factory(sink, flush_size=100, flush_interval=60)
+
+    writer.enqueue({"i": 0})
+    writer.flush(timeout=5)
+    writer.enqueue({"i": 1})
+    writer.flush(timeout=5)
+
+    assert sink.batches == [[{"i": 0}, {"i": 1}]]
+    assert "database is locked" in capsys.readouterr().err
+
+
+def test_close_writes_pending_and_rejects_new_entries(writer_factory):
+    sink = Sink()
+    writer = writer_factory(sink, flush_size=100, flush_interval=60)
+    writer.enqueue({"i": 0})
+
+    writer.close()
+
+    assert sink.batches == [[{"i": 0}]]
+    with pytest.raises(RuntimeError):
+        writer.enqueue({"i": 1})
+
+
+def test_flush_after_close_returns_immediately(writer_factory):
+    writer = writer_factory(Sink())
+    writer.close()
+
+    start = time.monotonic()
+    assert writer.flush() is True
+    assert time.monotonic() - start < 1
+
+
+def test_entries_reach_the_store():
+    writer = audit_log.LogWriter()
+    try:
+        writer.enqueue({"الشركة": "شركة أ", "القطاع": "التصنيع", "حالة العملية": "نجاح"})
+        assert writer.flush(timeout=5)
+    finally:
+        writer.close()
+
+    log = assessment_store.load_log()
+    assert log["الشركة"].tolist() == ["شركة أ"]
+    assert log["حالة العملية"].tolist() == ["نجاح"]
+
+
+def test_retry_buffer_is_bounded_and_drops_oldest(writer_factory, capsys):
+    sink = Sink(fail_times=2)
+    writer = writer_factory(sink, flush_size=100, flush_interval=60, max_pending=3)
+
+    for i in range(5):
+        writer.enqueue({"i": i})
+    writer.flush(timeout=5)
+    writer.enqueue({"i": 5})
+    writer.flush(timeout=5)
+    writer.flush(timeout=5)
+
+    assert writer.lost == 3
+    assert sink.batches == [[{"i": 3}, {"i": 4}, {"i": 5}]]
+    assert "فُقد 2 قيد" in capsys.readouterr().err
+
+
+def test_entries_lost_at_close_are_reported(writer_factory, capsys):
+    sink = Sink(fail_times=1)
+    writer = writer_factory(sink, flush_size=100, flush_interval=60)
+    writer.enqueue({"i": 0})
+    writer.enqueue({"i": 1})
+
+    writer.close()
+
+    assert writer.lost == 2 and sink.batches == []
+    assert "فُقد 2 قيد" in capsys.readouterr().err
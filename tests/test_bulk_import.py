@@ -0,0 +1,100 @@
+# اختبارات الاستيراد المجمّع (bulk_import)
+import pandas as pd
+import pytest
+
+import assessment_store
+import bulk_import
+import question_bank
+
+
+@pytest.fixture(scope="module")
+def bank():
+    return question_bank.load_question_bank()
+
+
+def answers_frame(bank, n=12):
+    rows = []
+    for i in range(n):
+        row = {"الاسم": f"مستخدم {i}", "الشركة": f"شركة {i % 3}", "القطاع": "التصنيع", "الدولة": "مصر",
+               "التاريخ": None if i % 4 == 0 else f"2024-03-{i + 1:02d} 09:00"}
+        row.update({q.key: (i + j) % 5 + 1 for j, q in enumerate(bank.questions)})
+        row.update({col: (i % 5) + 1 for col in bulk_import.IOT_COLUMNS})
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def test_import_scores_and_stores_every_row(bank, temp_stores):
+    path = temp_stores / "answers.csv"
+    answers_frame(bank).to_csv(path, index=False)
+
+    total, _ = bulk_import.run_import(str(path), chunk_size=5, workers=1)
+
+    df = assessment_store.load_assessments()
+    assert total == len(df) == 12
+    assert df["Plan"].between(1, 5).all()
+    assert df.loc[1, "متوسط IoT"] == 2.0
+
+
+def test_reimport_adds_nothing(bank, temp_stores):
+    path = temp_stores / "answers.csv"
+    answers_frame(bank).to_csv(path, index=False)
+
+    bulk_import.run_import(str(path), chunk_size=5, workers=1)
+    total, _ = bulk_import.run_import(str(path), chunk_size=5, workers=1)
+
+    assert total == 0
+    assert assessment_store.count_assessments() == 12
+
+
+def test_imported_key_matches_interactive_submission(bank, temp_stores):
+    frame = answers_frame(bank, n=2)
+    path = temp_stores / "answers.csv"
+    frame.to_csv(path, index=False)
+    bulk_import.run_import(str(path), chunk_size=5, workers=1)
+
+    # نفس قاموس الإجابات الذي تبنيه صفحة التقييم من المنزلقات
+    record = frame.iloc[1]
+    user = {key: record[label] for key, label in bulk_import.USER_COLUMNS.items()}
+    answers = {q.key: int(record[q.key]) for q in bank.questions}
+    answers.update({f"iot_{i}": int(record[col]) for i, col in enumerate(bulk_import.IOT_COLUMNS, 1)})
+    key = assessment_store.submission_hash(user, answers)
+
+    assert assessment_store.append_assessment(user, 2.0, {"Plan": 3.0}, submission_key=key) is None
+
+
+def test_missing_dates_use_import_time(bank, temp_stores):
+    path = temp_stores / "answers.csv"
+    answers_frame(bank, n=4).to_csv(path, index=False)
+
+    bulk_import.run_import(str(path), chunk_size=5, workers=1)
+
+    dates = assessment_store.load_assessments()["التاريخ"]
+    assert not dates.str.contains("nan").any()
+    assert dates.iloc[1] == "2024-03-02 09:00"
+
+
+def test_xlsx_with_question_text_and_iot_average(bank, temp_stores):
+    frame = answers_frame(bank, n=3)
+    frame = frame.rename(columns={q.key: q.text for q in bank.questions})
+    frame[bulk_import.IOT_AVG_COLUMN] = 4.5
+    frame = frame.drop(columns=bulk_import.IOT_COLUMNS)
+    path = temp_stores / "answers.xlsx"
+    frame.to_excel(path, index=False)
+
+    total, _ = bulk_import.run_import(str(path), chunk_size=2, workers=1)
+
+    assert total == 3
+    assert (assessment_store.load_assessments()["متوسط IoT"] == 4.5).all()
+
+
+def test_missing_columns_are_reported_before_import(bank, temp_stores, capsys):
+    frame = answers_frame(bank, n=2).drop(columns=[bank.questions[0].key, "IoT 2"])
+    path = temp_stores / "answers.csv"
+    frame.to_csv(path, index=False)
+
+    assert bulk_import.main([str(path), "--workers", "1"]) == 1
+
+    err = capsys.readouterr().err
+    assert bank.questions[0].key in err
+    assert "IoT 2" in err
+    assert assessment_store.count_assessments() == 0
@@ -0,0 +1,153 @@
+# اختبارات الدفع المجمّع (bulk_push): القراءة على صفحات، الحد الأعلى، وإعادة إرسال ما تغيّر فقط
+import json
+
+import assessment_store
+import bulk_push
+
+USER = {"name": "سها", "company": "شركة أ", "sector": "التصنيع", "country": "مصر"}
+
+
+def seed(n, start=0):
+    rows = [({**USER, "name": f"مستخدم {i}"}, 3, {"Plan": i % 5 + 1}, "2024-01-01 10:00")
+            for i in range(start, start + n)]
+    assessment_store.append_assessments(rows)
+
+
+def sent_ids(endpoint):
+    ids = []
+    for body in endpoint.bodies:
+        ids += [json.loads(line)["id"] for line in body.decode("utf-8").splitlines()]
+    return ids
+
+
+def quiet(*args):
+    pass
+
+
+def test_fetch_assessment_rows_pages_by_id():
+    seed(25)
+
+    pages, after_id = [], 0
+    while rows := assessment_store.fetch_assessment_rows(after_id, 10):
+        pages.append([row["id"] for row in rows])
+        after_id = rows[-1]["id"]
+
+    assert [len(p) for p in pages] == [10, 10, 5]
+    assert sum(pages, []) == list(range(1, 26))
+
+
+def test_push_sends_batches_and_advances_high_water(endpoints):
+    seed(7)
+    endpoint = endpoints([200])
+
+    stats = bulk_push.run_push(endpoint.url, batch_size=3, concurrency=2, report=quiet)
+
+    assert (stats["records"], stats["new"], stats["batches"], stats["failed_batches"]) == (7, 7, 3, 0)
+    assert sorted(sent_ids(endpoint)) == list(range(1, 8))
+    assert assessment_store.push_high_water(endpoint.url) == stats["high_water"] == 7
+
+
+def test_second_push_sends_only_new_and_changed(endpoints):
+    seed(5)
+    endpoint = endpoints([200])
+    bulk_push.run_push(endpoint.url, batch_size=10, report=quiet)
+    endpoint.bodies.clear()
+
+    seed(2, start=5)
+    conn = assessment_store.get_connection()
+    with conn:
+        conn.execute("UPDATE assessments SET plan = 1.0 WHERE id = 2")
+    stats = bulk_push.run_push(endpoint.url, batch_size=10, report=quiet)
+
+    assert (stats["new"], stats["changed"]) == (2, 1)
+    assert sorted(sent_ids(endpoint)) == [2, 6, 7]
+    assert bulk_push.run_push(endpoint.url, report=quiet)["records"] == 0
+
+
+def test_unchanged_rows_are_not_rescanned(endpoints, monkeypatch):
+    seed(50)
+    endpoint = endpoints([200])
+    bulk_push.run_push(endpoint.url, batch_size=20, report=quiet)
+    scanned = []
+    to_record = bulk_push.to_record
+    monkeypatch.setattr(bulk_push, "to_record", lambda row: scanned.append(row["id"]) or to_record(row))
+
+    assert bulk_push.run_push(endpoint.url, report=quiet)["records"] == 0
+    assert scanned == []
+
+    conn = assessment_store.get_connection()
+    with conn:
+        conn.execute("UPDATE assessments SET plan = 1.0 WHERE id IN (7, 30)")
+        conn.execute("UPDATE assessments SET make = make WHERE id = 12")     # بلا تغيير فعلي في المحتوى
+    stats = bulk_push.run_push(endpoint.url, report=quiet)
+
+    assert sorted(scanned) == [7, 12, 30]
+    assert (stats["changed"], stats["records"]) == (2, 2)
+
+
+def test_failed_changed_batch_is_rescanned(endpoints, monkeypatch):
+    monkeypatch.setattr(bulk_push.webhook_outbox, "backoff_delay", lambda attempt: 0.0)
+    seed(4)
+    endpoint = endpoints([200, 500, 500, 500, 200])
+    bulk_push.run_push(endpoint.url, report=quiet)
+    conn = assessment_store.get_connection()
+    with conn:
+        conn.execute("UPDATE assessments SET plan = 1.0 WHERE id = 3")
+
+    assert bulk_push.run_push(endpoint.url, report=quiet)["failed_batches"] == 1
+
+    endpoint.bodies.clear()
+    assert bulk_push.run_push(endpoint.url, report=quiet)["changed"] == 1
+    assert sent_ids(endpoint) == [3]
+
+
+def test_new_only_skips_change_detection(endpoints):
+    seed(3)
+    endpoint = endpoints([200])
+    bulk_push.run_push(endpoint.url, report=quiet)
+    conn = assessment_store.get_connection()
+    with conn:
+        conn.execute("UPDATE assessments SET plan = 1.0 WHERE id = 1")
+
+    assert bulk_push.run_push(endpoint.url, new_only=True, report=quiet)["records"] == 0
+
+
+def test_failed_batch_holds_back_high_water(endpoints):
+    seed(6)
+    endpoint = endpoints([200, 400, 200])
+
+    stats = bulk_push.run_push(endpoint.url, batch_size=2, concurrency=1, report=quiet)
+
+    # الدفعة الثانية (3، 4) رُفضت: الحد الأعلى يقف قبلها فتُعاد في التشغيل التالي
+    assert stats["failed_batches"] == 1
+    assert assessment_store.push_high_water(endpoint.url) == 2
+    assert set(assessment_store.load_push_digests(endpoint.url)) == {1, 2, 5, 6}
+
+    endpoint.bodies.clear()
+    retry = bulk_push.run_push(endpoint.url, batch_size=2, concurrency=1, report=quiet)
+    assert sorted(sent_ids(endpoint)) == [3, 4]
+    assert (retry["failed_batches"], retry["high_water"]) == (0, 6)
+
+
+def test_dry_run_sends_nothing(endpoints):
+    seed(4)
+    endpoint = endpoints([200])
+
+    stats = bulk_push.run_push(endpoint.url, dry_run=True, report=quiet)
+
+    assert stats["records"] == 4
+    assert endpoint.requests == 0
+    assert assessment_store.push_high_water(endpoint.url) == 0
+
+
+def test_json_format_sends_one_array_per_batch(endpoints):
+    seed(3)
+    endpoint = endpoints([200])
+
+    bulk_push.run_push(endpoint.url, fmt="json", batch_size=10, report=quiet)
+
+    [body] = endpoint.bodies
+    records = json.loads(body)
+    assert [r["id"] for r in records] == [1, 2, 3]
+    assert records[0]["user"]["company"] == "شركة أ"
+    assert records[0]["SCOR_scores"]["Plan"] == 1.0
@@ -0,0 +1,137 @@
+# اختبارات التصدير المتدفق لسجل العمليات (Excel / CSV / Parquet)
+import io
+import json
+import os
+from io import BytesIO
+
+import pandas as pd
+import pytest
+
+import assessment_store
+import exports
+
+HEADER = ["الشركة", "نتيجة CPM"]
+CHUNKS = [[("شركة أ", 3.5), ("شركة ب", None)], [("شركة ج", 1.0)]]
+
+
+def log_entries(n):
+    return [
+        {"الاسم": f"مستخدم {i}", "الشركة": f"شركة {i % 3}", "القطاع": "التصنيع" if i % 2 else "التجزئة",
+         "الدولة": "مصر", "التاريخ": f"2024-01-{i % 28 + 1:02d} 10:00", "نتيجة CPM": i % 5 + 0.5,
+         "حالة العملية": "نجاح", "SCOR - Plan": 3.0}
+        for i in range(n)
+    ]
+
+
+def read_export(fmt, reader):
+    with reader:
+        payload = BytesIO(reader.read())
+    if fmt == "Excel":
+        return pd.read_excel(payload)
+    if fmt == "CSV":
+        return pd.read_csv(payload, encoding="utf-8-sig")
+    return pd.read_parquet(payload)
+
+
+def test_csv_stream_has_bom_header_and_rows(tmp_path):
+    path = tmp_path / "out.csv"
+
+    assert exports.write_csv_stream(str(path), HEADER, CHUNKS) == 3
+
+    raw = path.read_bytes()
+    assert raw.startswith(b"\xef\xbb\xbf")
+    df = pd.read_csv(path, encoding="utf-8-sig")
+    assert list(df.columns) == HEADER
+    assert df["الشركة"].tolist() == ["شركة أ", "شركة ب", "شركة ج"]
+
+
+def test_parquet_stream_keeps_numeric_types(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "out.parquet"
+
+    assert exports.write_parquet_stream(str(path), HEADER, CHUNKS, numeric={"نتيجة CPM"}) == 3
+
+    df = pd.read_parquet(path)
+    assert df["نتيجة CPM"].dtype == "float64"
+    assert df["نتيجة CPM"].isna().tolist() == [False, True, False]
+
+
+def test_xlsx_stream_splits_sheets_at_row_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(exports, "XLSX_MAX_ROWS", 2)
+    path = tmp_path / "out.xlsx"
+
+    assert exports.write_xlsx_stream(str(path), [("Log", HEADER, CHUNKS)]) == 3
+
+    sheets = pd.read_excel(path, sheet_name=None)
+    assert list(sheets) == ["Log", "Log (2)"]
+    assert [len(df) for df in sheets.values()] == [2, 1]
+    assert list(sheets["Log (2)"].columns) == HEADER
+
+
+@pytest.mark.parametrize("fmt", exports.export_formats())
+def test_export_log_matches_store(fmt):
+    assessment_store.append_log_entries(log_entries(25))
+
+    reader = exports.export_log(fmt, kind=f"test-{fmt}", chunk_size=10)
+    size = os.fstat(reader.fileno()).st_size
+
+    df = read_export(fmt, reader)
+    expected = assessment_store.load_log()
+    assert list(df.columns) == assessment_store.log_export_header() == list(expected.columns)
+    assert df["الشركة"].tolist() == expected["الشركة"].tolist()
+    assert df["نتيجة CPM"].tolist() == pytest.approx(expected["نتيجة CPM"].tolist())
+    stats = exports.export_stats(f"test-{fmt}")
+    assert (stats["format"], stats["rows"], stats["bytes"]) == (fmt, 25, size)
+
+
+def test_export_is_a_reader_over_a_temp_file(tmp_path, monkeypatch):
+    spool = tmp_path / "spool"
+    spool.mkdir()
+    monkeypatch.setattr(exports.tempfile, "tempdir", str(spool))
+    assessment_store.append_log_entries(log_entries(5))
+
+    reader = exports.export_log("CSV")
+
+    assert isinstance(reader, io.BufferedReader)
+    assert len(read_export("CSV", reader)) == 5
+    # الملف المؤقت لا يبقى على القرص بعد إغلاق القارئ
+    assert list(spool.iterdir()) == []
+
+
+def test_export_log_filters_in_sql():
+    assessment_store.append_log_entries(log_entries(40))
+
+    df = read_export("CSV", exports.export_log("CSV", company="شركة 1", sector="التصنيع",
+                                               date_from="2024-01-05", date_to="2024-01-20"))
+
+    assert set(df["الشركة"]) == {"شركة 1"} and set(df["القطاع"]) == {"التصنيع"}
+    dates = df["التاريخ"].str[:10]
+    assert dates.between("2024-01-05", "2024-01-20").all()
+    expected = assessment_store.load_log()
+    expected = expected[(expected["الشركة"] == "شركة 1") & (expected["القطاع"] == "التصنيع")
+                        & expected["التاريخ"].str[:10].between("2024-01-05", "2024-01-20")]
+    assert len(df) == len(expected) > 0
+
+
+def test_build_sheets_excel_writes_frames_with_missing_values():
+    frame = pd.DataFrame({"الشركة": ["شركة أ", "شركة ب"], "CPM": [3.5, float("nan")]})
+
+    sheets = pd.read_excel(BytesIO(exports.build_sheets_excel([("Summary", frame), ("Copy", frame)])),
+                           sheet_name=None)
+
+    assert list(sheets) == ["Summary", "Copy"]
+    pd.testing.assert_frame_equal(sheets["Summary"], frame)
+
+
+def test_lazy_export_builds_only_when_called(monkeypatch):
+    calls = []
+    monkeypatch.setattr(exports, "payload_key", lambda data: calls.append("key") or json.dumps(data))
+    cache = {}
+
+    produce = exports.lazy_export(cache, "dashboard_json", exports.build_json, {"CPM": 3.5})
+    assert calls == []
+
+    payload = produce()
+    assert json.loads(payload) == {"CPM": 3.5}
+    assert produce() is payload
+    assert exports.lazy_export(cache, "dashboard_json", exports.build_json, {"CPM": 4.0})() != payload
@@ -0,0 +1,58 @@
+# اختبارات خدمة الخطوط: مقاييس FPDF المحفوظة عبر add_font، والخط المقتطع، وحصر تجاهل تحذير cmap
+import os
+import warnings
+
+import fpdf.fpdf
+import pytest
+
+import font_service
+
+
+@pytest.fixture
+def font_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(font_service, "FONT_CACHE_DIR", str(tmp_path / "fonts"))
+    # set_global يغيّر إعدادات fpdf للعملية كلها، فتُعاد بعد الاختبار
+    monkeypatch.setattr(fpdf.fpdf, "FPDF_CACHE_MODE", fpdf.fpdf.FPDF_CACHE_MODE)
+    monkeypatch.setattr(fpdf.fpdf, "FPDF_CACHE_DIR", fpdf.fpdf.FPDF_CACHE_DIR)
+    return tmp_path / "fonts"
+
+
+def build_report(lines):
+    pdf = font_service.new_fpdf(14)
+    pdf.add_page()
+    for line in font_service.pdf_texts(lines):
+        pdf.cell(200, 10, txt=line, ln=True)
+    return pdf.output(dest="S").encode("latin-1")
+
+
+def test_metrics_are_parsed_once_into_the_cache_dir(font_cache, monkeypatch):
+    parsed = []
+    get_metrics = fpdf.fpdf.TTFontFile.getMetrics
+    monkeypatch.setattr(fpdf.fpdf.TTFontFile, "getMetrics",
+                        lambda self, path: parsed.append(path) or get_metrics(self, path))
+
+    first = build_report(["تقرير سها"])
+    second = build_report(["تقرير سها"])
+
+    assert parsed == [font_service.FONT_PATH]
+    assert any(font_cache.glob("*.pkl"))
+    assert first.startswith(b"%PDF") and len(first) == len(second)
+
+
+def test_only_used_glyphs_are_embedded(font_cache):
+    payload = build_report(["📄 تقرير الاستراتيجية الكاملة", "المستخدم: سها"])
+
+    assert b"/FontFile2" in payload
+    assert len(payload) < 0.1 * os.path.getsize(font_service.FONT_PATH)
+
+
+def test_cmap_warnings_are_silenced_only_inside_fpdf(font_cache):
+    filters = list(warnings.filters)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        build_report(["سلام"])
+
+    assert not [w for w in caught if "cmap value" in str(w.message)]
+    assert warnings.filters == filters
+    with pytest.warns(UserWarning, match="cmap value"):
+        warnings.warn_explicit("cmap value too big/small: 1", UserWarning, "ttfonts.py", 1, module="fpdf.ttfonts")
@@ -0,0 +1,80 @@
+# اختبارات مجاميع القطاع/الدولة التراكمية المحدَّثة مع كل قيد في السجل
+import pandas as pd
+import pytest
+
+import assessment_store
+
+
+def entry(sector, country, cpm, iot=3.0, plan=None):
+    return {"الشركة": "شركة", "القطاع": sector, "الدولة": country, "نتيجة CPM": cpm,
+            "متوسط IoT": iot, "SCOR - Plan": plan}
+
+
+ENTRIES = [
+    entry("التصنيع", "مصر", 3.0, plan=2.0),
+    entry("التصنيع", "الأردن", 5.0, iot=4.0, plan=4.0),
+    entry("التجزئة", "مصر", 1.0),
+    entry("التجزئة", None, 2.0),
+    entry("التصنيع", "مصر", None, plan=5.0),     # بلا نتيجة CPM: لا يدخل في المجاميع
+]
+
+
+def pandas_means(dimension_label, metric_label):
+    # المرجع: نفس حساب صفحة القطاع القديم على السجل كاملًا
+    log = assessment_store.load_log().dropna(subset=[dimension_label, "نتيجة CPM"])
+    return log.groupby(dimension_label)[metric_label].mean()
+
+
+def test_aggregates_follow_appends():
+    assessment_store.append_log_entries(ENTRIES[:2])
+    assessment_store.append_log_entries(ENTRIES[2:])
+
+    sectors = assessment_store.load_aggregates("sector")
+    countries = assessment_store.load_aggregates("country")
+
+    assert sectors.loc["التصنيع", "cpm_score"] == pytest.approx(4.0)
+    assert sectors.loc["التجزئة", "cpm_score"] == pytest.approx(1.5)
+    assert sectors.loc["التصنيع", "plan"] == pytest.approx(3.0)
+    assert pd.isna(sectors.loc["التجزئة", "plan"])
+    assert sorted(countries.index) == ["الأردن", "مصر"]
+    assert countries.loc["مصر", "cpm_score"] == pytest.approx(2.0)
+
+
+def test_aggregates_match_full_log_scan():
+    assessment_store.append_log_entries(ENTRIES)
+
+    for dimension, label in (("sector", "القطاع"), ("country", "الدولة")):
+        table = assessment_store.load_aggregates(dimension)
+        for metric, metric_label in (("cpm_score", "نتيجة CPM"), ("iot_avg", "متوسط IoT")):
+            expected = pandas_means(label, metric_label)
+            assert table[metric].to_dict() == pytest.approx(expected.to_dict())
+
+
+def test_rebuild_reports_and_repairs_drift():
+    assessment_store.append_log_entries(ENTRIES)
+    expected = assessment_store.load_aggregates("sector")
+    conn = assessment_store.get_connection()
+    with conn:
+        conn.execute("UPDATE log_aggregates SET total = total + 10 WHERE dimension = 'sector' AND key = 'التصنيع' "
+                     "AND metric = 'cpm_score'")
+        conn.execute("DELETE FROM log_aggregates WHERE dimension = 'country' AND key = 'الأردن'")
+
+    mismatches = assessment_store.rebuild_aggregates(verify=True)
+
+    groups = {group for group, _, _ in mismatches}
+    assert ("sector", "التصنيع", "cpm_score") in groups
+    assert ("country", "الأردن", "cpm_score") in groups
+    pd.testing.assert_frame_equal(assessment_store.load_aggregates("sector"), expected)
+    assert assessment_store.rebuild_aggregates(verify=True) == []
+
+
+def test_existing_log_without_aggregates_is_backfilled_on_open(temp_stores, monkeypatch):
+    assessment_store.append_log_entries(ENTRIES)
+    conn = assessment_store.get_connection()
+    with conn:
+        conn.execute("DELETE FROM log_aggregates")
+
+    # فتح المخزن من جديد (مثل قاعدة بيانات أقدم من جدول المجاميع)
+    monkeypatch.setattr(assessment_store, "_conn", None)
+
+    assert assessment_store.load_aggregates("sector").loc["التصنيع", "cpm_score"] == pytest.approx(4.0)
@@ -0,0 +1,36 @@
+# اختبارات كاش سجل العمليات المشترك (log_loader) ومفتاحه log_version
+import assessment_store
+import log_loader
+
+USER = {"name": "سها", "company": "شركة أ", "sector": "التصنيع", "country": "مصر"}
+
+
+def misses():
+    return log_loader.cache_stats()["misses"]
+
+
+def test_cache_hit_while_log_unchanged_and_miss_after_append():
+    assessment_store.append_log_entries([{"الشركة": "شركة أ", "نتيجة CPM": 3.0}])
+    df = log_loader.load_log()
+    before = misses()
+
+    assert log_loader.load_log() is df
+    assert misses() == before
+
+    assessment_store.append_log_entries([{"الشركة": "شركة ب", "نتيجة CPM": "4"}])
+    reloaded = log_loader.load_log()
+
+    assert misses() == before + 1
+    assert reloaded["الشركة"].tolist() == ["شركة أ", "شركة ب"]
+    assert reloaded["نتيجة CPM"].tolist() == [3.0, 4.0]
+
+
+def test_saving_an_assessment_keeps_the_log_cache():
+    assessment_store.append_log_entries([{"الشركة": "شركة أ"}])
+    df = log_loader.load_log()
+    log_version = assessment_store.log_version()
+
+    assessment_store.append_assessment(USER, 3, {"Plan": 2.0})
+
+    assert assessment_store.log_version() == log_version
+    assert log_loader.load_log() is df
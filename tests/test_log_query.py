@@ -0,0 +1,89 @@
+# اختبارات طبقة استعلام السجل (log_query.LogIndex) للوحة تحكم المشرف
+import numpy as np
+import pandas as pd
+import pytest
+
+import assessment_store
+import log_query
+
+
+@pytest.fixture(scope="module")
+def log_frame():
+    rng = np.random.default_rng(7)
+    n = 5_000
+    df = pd.DataFrame({
+        "الشركة": rng.choice([f"شركة {i}" for i in range(40)], n),
+        "القطاع": rng.choice(["التصنيع", "التجزئة", "الخدمات", None], n),
+        "الدولة": rng.choice(["مصر", "الأردن", "السعودية"], n),
+        "نتيجة CPM": rng.uniform(1, 5, n),
+    })
+    return df
+
+
+def mask_rows(df, **filters):
+    mask = np.ones(len(df), dtype=bool)
+    for col, value in filters.items():
+        if value is not None:
+            mask &= (df[col] == value).to_numpy()
+    return np.flatnonzero(mask)
+
+
+@pytest.mark.parametrize("filters", [
+    {},
+    {"الشركة": "شركة 3"},
+    {"القطاع": "التجزئة", "الدولة": "مصر"},
+    {"الشركة": "شركة 12", "القطاع": "الخدمات", "الدولة": "الأردن"},
+    {"الشركة": None, "القطاع": "التصنيع", "الدولة": None},
+])
+def test_select_matches_boolean_masks(log_frame, filters):
+    index = log_query.LogIndex(log_frame)
+
+    np.testing.assert_array_equal(index.select(**filters), mask_rows(log_frame, **filters))
+
+
+def test_unknown_value_selects_nothing(log_frame):
+    index = log_query.LogIndex(log_frame)
+
+    assert len(index.select(**{"الشركة": "غير موجودة"})) == 0
+    assert len(index.select(**{"الشركة": "شركة 1", "القطاع": "غير موجود"})) == 0
+
+
+def test_missing_values_are_not_a_category(log_frame):
+    index = log_query.LogIndex(log_frame)
+
+    assert index.values("القطاع") == ["التجزئة", "التصنيع", "الخدمات"]
+    assert len(index.select(**{"القطاع": None})) == len(log_frame)
+
+
+def test_pages_cover_selection_in_order(log_frame):
+    index = log_query.LogIndex(log_frame)
+    rows = index.select(**{"الدولة": "مصر"})
+    n_pages = -(-len(rows) // 100)
+
+    pages = [index.page(rows, page_no, 100) for page_no in range(1, n_pages + 1)]
+
+    assert all(len(page) == 100 for page in pages[:-1])
+    pd.testing.assert_frame_equal(pd.concat(pages), log_frame.iloc[rows])
+    assert index.page(rows, n_pages + 1, 100).empty
+
+
+def test_frame_selects_columns(log_frame):
+    index = log_query.LogIndex(log_frame)
+    rows = index.select(**{"الشركة": "شركة 5"})
+
+    frame = index.frame(rows, ["الشركة", "نتيجة CPM"])
+
+    assert list(frame.columns) == ["الشركة", "نتيجة CPM"]
+    assert (frame["الشركة"] == "شركة 5").all()
+
+
+def test_log_index_is_rebuilt_when_store_changes():
+    assessment_store.append_log_entries([{"الشركة": "شركة أ", "القطاع": "التصنيع", "الدولة": "مصر"}])
+    index = log_query.log_index()
+    assert log_query.log_index() is index
+
+    assessment_store.append_log_entries([{"الشركة": "شركة ب", "القطاع": "التصنيع", "الدولة": "مصر"}])
+    rebuilt = log_query.log_index()
+
+    assert rebuilt is not index
+    assert rebuilt.values("الشركة") == ["شركة أ", "شركة ب"]
@@ -0,0 +1,83 @@
+# اختبارات تقرير PDF لسجل العمليات (log_report): يُقرأ الملف الناتج بـ pypdf ويُقارن بالمخزن
+import io
+import unicodedata
+
+import pytest
+
+import assessment_store
+import exports
+import log_report
+
+pypdf = pytest.importorskip("pypdf")
+
+
+def seed(n):
+    assessment_store.append_log_entries([
+        {"الاسم": f"user-{i}", "الشركة": "شركة أ" if i % 2 else "شركة ب", "القطاع": "التصنيع",
+         "الدولة": "مصر", "التاريخ": f"2024-01-{i % 28 + 1:02d} 10:00", "نتيجة CPM": 3.5,
+         "حالة العملية": "نجاح", "SCOR - Plan": 2.0}
+        for i in range(n)
+    ])
+
+
+def read_pdf(reader):
+    with reader:
+        pdf = pypdf.PdfReader(io.BytesIO(reader.read()))
+    # الحروف العربية مرسومة بأشكالها المتصلة (presentation forms)، و NFKC يعيدها إلى الحروف الأصلية
+    return len(pdf.pages), [unicodedata.normalize("NFKC", page.extract_text()) for page in pdf.pages]
+
+
+def names(texts):
+    return sorted(word for text in texts for word in text.split() if word.startswith("user-"))
+
+
+def test_every_row_is_drawn_across_pages():
+    seed(120)
+
+    pages, texts = read_pdf(log_report.export_log_pdf(1000))
+
+    assert pages > 2
+    assert names(texts) == sorted(f"user-{i}" for i in range(120))
+    assert "سجل التقييمات والعمليات" in texts[0] and "شركة أ" in texts[0]
+    # كل صفحة تبدأ بصف العناوين وتنتهي برقمها
+    assert all("الشركة" in text and f"{n} صفحة" in text for n, text in enumerate(texts, 1))
+    stats = exports.export_stats("log_pdf")
+    assert (stats["format"], stats["rows"], stats["pages"]) == ("PDF", 120, pages)
+
+
+def test_row_limit_stops_reading():
+    seed(120)
+
+    pages, texts = read_pdf(log_report.export_log_pdf(50, kind="test-limit"))
+
+    assert names(texts) == sorted(f"user-{i}" for i in range(50))
+    assert exports.export_stats("test-limit")["pages"] == pages
+
+
+def test_company_and_date_filters():
+    seed(60)
+
+    _, texts = read_pdf(log_report.export_log_pdf(1000, company="شركة أ", date_from="2024-01-05",
+                                                  date_to="2024-01-20", sector=None))
+
+    expected = [f"user-{i}" for i in range(60) if i % 2 and 5 <= i % 28 + 1 <= 20]
+    assert names(texts) == sorted(expected)
+    assert "شركة ب" not in "".join(texts)
+
+
+def test_empty_log_still_has_one_page(tmp_path):
+    path = tmp_path / "empty.pdf"
+
+    assert log_report.write_log_pdf(str(path), iter([])) == (0, 1)
+    assert len(pypdf.PdfReader(path).pages) == 1
+
+
+def test_long_values_are_truncated_inside_their_cell(tmp_path):
+    path = tmp_path / "long.pdf"
+    row = ("سها " * 40, "شركة أ") + (None,) * (len(log_report.COLUMNS) - 2)
+
+    log_report.write_log_pdf(str(path), [row])
+
+    text = unicodedata.normalize("NFKC", pypdf.PdfReader(path).pages[0].extract_text())
+    # NFKC يحوّل "…" إلى "..."
+    assert "..." in text and 0 < text.count("سها") < 40
@@ -0,0 +1,120 @@
+# اختبارات طبقة بيانات app.py (readiness_store): الترحيلات والصفحات واستعلامات المقارنة في SQLite
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import readiness_store
+
+
+def sample_rows(n=60, seed=3):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(n):
+        scores = [int(v) for v in rng.integers(0, 101, 5)]
+        rows.append((f"شركة {i % 7}", f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}", scores, sum(scores) / 5))
+    return rows
+
+
+def frame(rows):
+    return pd.DataFrame(
+        [(c, d, *s, t) for c, d, s, t in rows],
+        columns=["company", "date", "plan", "source", "make", "deliver", "return_score", "total"],
+    )
+
+
+def test_save_single_and_batch():
+    readiness_store.save_assessment("شركة أ", "2024-05-01", [50, 60, 70, 80, 90], 70.0)
+
+    assert readiness_store.save_assessments(sample_rows(10)) == 10
+    assert readiness_store.count_assessments() == 11
+    assert readiness_store.count_assessments("شركة أ") == 1
+
+
+def test_legacy_database_is_migrated_in_place(temp_stores, monkeypatch):
+    path = temp_stores / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE assessments (company TEXT, date TEXT, plan INTEGER, source INTEGER, make INTEGER, "
+                 "deliver INTEGER, return_score INTEGER, total REAL)")
+    conn.execute("INSERT INTO assessments VALUES ('قديمة', '2023-01-01', 1, 2, 3, 4, 5, 3.0)")
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(readiness_store, "DB_PATH", str(path))
+
+    assert readiness_store.count_assessments() == 1
+    conn = readiness_store.get_connection()
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == len(readiness_store.MIGRATIONS)
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list(assessments)")}
+    assert {"idx_assessments_company", "idx_assessments_date"} <= indexes
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_pages_are_newest_first_and_cover_all_rows():
+    rows = sample_rows(45)
+    readiness_store.save_assessments(rows)
+
+    pages = [readiness_store.page_assessments(page_no, 20) for page_no in (1, 2, 3)]
+
+    assert [len(p) for p in pages] == [20, 20, 5]
+    combined = pd.concat(pages, ignore_index=True)
+    assert combined["date"].is_monotonic_decreasing
+    assert sorted(combined["total"]) == pytest.approx(sorted(frame(rows)["total"]))
+    assert readiness_store.page_assessments(4, 20).empty
+
+
+def test_company_page_filters_rows():
+    readiness_store.save_assessments(sample_rows(30))
+
+    page = readiness_store.page_assessments(1, 50, company="شركة 2")
+
+    assert set(page["company"]) == {"شركة 2"}
+    assert len(page) == readiness_store.count_assessments("شركة 2")
+
+
+def test_phase_summary_matches_pandas():
+    rows = sample_rows(101)
+    readiness_store.save_assessments(rows)
+    df = frame(rows)
+
+    summary = readiness_store.phase_summary().set_index("المرحلة")
+
+    for label, col in readiness_store.PHASE_COLUMNS.items():
+        values = df[col].to_numpy()
+        assert summary.loc[label, "المتوسط"] == pytest.approx(values.mean())
+        assert (summary.loc[label, "الأدنى"], summary.loc[label, "الأعلى"]) == pytest.approx((values.min(), values.max()))
+        for p in readiness_store.PERCENTILES:
+            assert summary.loc[label, f"P{int(p * 100)}"] == pytest.approx(np.quantile(values, p, method="lower"))
+
+
+def test_total_percentiles_use_the_index():
+    readiness_store.save_assessments(sample_rows(30))
+    conn = readiness_store.get_connection()
+
+    plan = " ".join(row[3] for row in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT total FROM assessments WHERE total IS NOT NULL ORDER BY total LIMIT 1 OFFSET 5"
+    ))
+
+    assert "idx_assessments_total" in plan and "TEMP B-TREE" not in plan
+
+
+def test_phase_summary_of_empty_store():
+    assert readiness_store.phase_summary().empty
+
+
+def test_company_summary_matches_pandas():
+    rows = sample_rows(80)
+    readiness_store.save_assessments(rows)
+    df = frame(rows)
+    expected = df.groupby("company").agg(n=("total", "size"), last=("date", "max"), total=("total", "mean"))
+    expected = expected.sort_values("total", ascending=False)
+
+    first = readiness_store.company_summary(1, 5)
+    second = readiness_store.company_summary(2, 5)
+    summary = pd.concat([first, second], ignore_index=True)
+
+    assert len(first) == 5 and len(summary) == readiness_store.count_companies() == 7
+    assert summary["الشركة"].tolist() == expected.index.tolist()
+    assert summary["عدد التقييمات"].tolist() == expected["n"].tolist()
+    assert summary["آخر تقييم"].tolist() == expected["last"].tolist()
+    assert summary["الإجمالي"].tolist() == pytest.approx(expected["total"].tolist(), abs=0.051)
@@ -0,0 +1,36 @@
+# اختبارات طابور تقارير PDF (report_jobs): الحالة تتبع العامل فعليًا
+import time
+
+import report_jobs
+
+
+def slow_render(html):
+    time.sleep(1.0)
+    return html.encode("utf-8")
+
+
+def wait_for(predicate, timeout=60):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+def test_job_stays_pending_until_a_worker_starts_it(tmp_path):
+    queue = report_jobs.ReportQueue(workers=1, cache_dir=str(tmp_path), render=slow_render)
+    try:
+        first = queue.submit("<p>1</p>")
+        second = queue.submit("<p>2</p>")
+        assert queue.status(second) == "pending"
+
+        assert wait_for(lambda: queue.status(first) == "running")
+        # العامل الوحيد مشغول بالأولى: الثانية لم تبدأ بعد
+        assert queue.status(second) == "pending"
+
+        assert wait_for(lambda: queue.status(second) == "done")
+        assert queue.result(first) == b"<p>1</p>"
+        assert queue.submit("<p>1</p>") == first and queue.status(first) == "done"
+    finally:
+        queue.close()
@@ -0,0 +1,79 @@
+# اختبارات محرك التقييم: تطابق المتوسطات مع sum/len في الواجهة، وحدود عتبات SWOT و BCG و IE
+import numpy as np
+import pytest
+
+import scoring_engine
+
+
+@pytest.mark.parametrize("size", [3, 5, 6, 7])
+@pytest.mark.parametrize("answer", [1, 2, 3, 4, 5])
+def test_uniform_answers_give_exact_means(size, answer):
+    _, means = scoring_engine.phase_means([[answer] * size], ["Plan"] * size)
+
+    assert means[0, 0] == answer
+    assert scoring_engine.swot_buckets(means)[0, 0] == scoring_engine.swot_buckets(float(answer))
+
+
+@pytest.mark.parametrize("size", [3, 5, 6, 7])
+def test_means_match_python_sum_over_len(size):
+    rng = np.random.default_rng(size)
+    answers = rng.integers(1, 6, (500, 2 * size))
+    question_phases = ["Plan"] * size + ["Make"] * size
+
+    phases, means = scoring_engine.phase_means(answers, question_phases)
+
+    assert phases == ("Plan", "Make")
+    for row, mean in zip(answers.tolist(), means.tolist()):
+        assert mean == [sum(row[:size]) / size, sum(row[size:]) / size]
+
+
+def test_six_questions_answered_four_are_a_strength():
+    scored = scoring_engine.score_assessments([[4] * 6 + [3, 2, 2, 3, 3, 2]], ["Plan"] * 6 + ["Make"] * 6)
+
+    assert scored["swot"].tolist() == [["قوة", "فرصة"]]
+
+
+@pytest.mark.parametrize("mean, label", [
+    (2.49, "ضعف"), (2.5, "فرصة"), (3.0, "فرصة"), (3.99, "فرصة"), (4.0, "قوة"),
+])
+def test_swot_thresholds(mean, label):
+    assert scoring_engine.swot_buckets(mean) == label
+    assert scoring_engine.swot_buckets(np.full((2, 3), mean)).tolist() == [[label] * 3] * 2
+
+
+@pytest.mark.parametrize("x, y, label", [
+    (3.0, 3.0, "🌟 Star"),
+    (2.99, 3.0, "❓ Question Mark"),
+    (3.0, 2.99, "💰 Cash Cow"),
+    (2.5, 2.5, "🐶 Dog"),
+    (4.0, 4.0, "🌟 Star"),
+    # القيم تُقرَّب لمنزلتين قبل المقارنة كما في مصفوفة BCG المعروضة
+    (2.996, 2.996, "🌟 Star"),
+    (2.994, 3.0, "❓ Question Mark"),
+])
+def test_bcg_thresholds_after_rounding(x, y, label):
+    assert scoring_engine.bcg_quadrants(x, y) == label
+    assert scoring_engine.bcg_quadrants([x, x], y).tolist() == [label] * 2
+    assert scoring_engine.bcg_quadrants(np.full((3, 2), x), np.full(3, y)).tolist() == [[label] * 2] * 3
+
+
+def test_score_assessments_rounds_before_bcg():
+    # متوسط Plan = 899/300 = 2.9967 يظهر 3.0 في مصفوفة BCG فيُصنَّف نجمًا كما في الواجهة
+    scored = scoring_engine.score_assessments([[3] * 299 + [2]], ["Plan"] * 300, iot=3.0)
+
+    assert scored["means"][0, 0] < 3.0
+    assert scored["bcg"].tolist() == [["🌟 Star"]]
+
+
+@pytest.mark.parametrize("ife, efe, label", [
+    (3.0, 3.0, "I (Grow)"),
+    (2.0, 3.0, "II (Grow)"),
+    (1.99, 3.0, "III (Hold)"),
+    (3.0, 2.0, "IV (Grow)"),
+    (2.5, 2.5, "V (Hold)"),
+    (2.99, 1.99, "VIII (Harvest)"),
+    (1.99, 1.99, "IX (Exit)"),
+])
+def test_ie_thresholds(ife, efe, label):
+    assert scoring_engine.ie_regions(ife, efe) == label
+    assert scoring_engine.ie_regions(np.full((2, 2), ife), np.full((2, 2), efe)).tolist() == [[label] * 2] * 2
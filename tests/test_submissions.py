@@ -0,0 +1,74 @@
+# اختبارات حفظ الإرسال مرة واحدة (بصمة المحتوى) وأداة ضغط التقييمات المكررة
+import assessment_store
+
+USER = {"name": "سها", "company": "شركة أ", "sector": "التصنيع", "country": "مصر"}
+ANSWERS = {"Plan_0": 3, "Plan_1": 4, "iot_1": 2}
+RESULTS = {"Plan": 3.5, "Source": 3.0}
+
+
+def test_submission_hash_depends_on_content_only():
+    key = assessment_store.submission_hash(USER, ANSWERS)
+
+    assert key == assessment_store.submission_hash(dict(reversed(list(USER.items()))), dict(reversed(list(ANSWERS.items()))))
+    assert key == assessment_store.submission_hash({**USER, "save_results": True}, ANSWERS)
+    assert key != assessment_store.submission_hash(USER, {**ANSWERS, "Plan_1": 5})
+    assert key != assessment_store.submission_hash({**USER, "company": "شركة ب"}, ANSWERS)
+
+
+def test_same_submission_is_stored_once():
+    key = assessment_store.submission_hash(USER, ANSWERS)
+
+    first = assessment_store.append_assessment(USER, 3, RESULTS, submission_key=key)
+    version = assessment_store.store_version()
+    second = assessment_store.append_assessment(USER, 3, RESULTS, submission_key=key)
+
+    assert first is not None and second is None
+    assert assessment_store.count_assessments() == 1
+    assert assessment_store.store_version() == version
+
+
+def test_changed_answers_are_a_new_submission():
+    assessment_store.append_assessment(USER, 3, RESULTS, submission_key=assessment_store.submission_hash(USER, ANSWERS))
+    changed = {**ANSWERS, "Plan_0": 1}
+
+    assert assessment_store.append_assessment(
+        USER, 3, RESULTS, submission_key=assessment_store.submission_hash(USER, changed)) is not None
+    assert assessment_store.count_assessments() == 2
+
+
+def test_batch_append_skips_stored_submissions():
+    key = assessment_store.submission_hash(USER, ANSWERS)
+    assessment_store.append_assessment(USER, 3, RESULTS, submission_key=key)
+    version = assessment_store.store_version()
+
+    rows = [(USER, 3, RESULTS, None, key), (USER, 3, RESULTS, None, key)]
+    assert assessment_store.append_assessments(rows) == 0
+    assert assessment_store.store_version() == version
+
+    other = assessment_store.submission_hash(USER, {**ANSWERS, "iot_1": 5})
+    assert assessment_store.append_assessments([(USER, 3, RESULTS, None, other), (USER, 3, RESULTS, None, other)]) == 1
+
+
+def test_compact_removes_duplicates_and_keeps_legacy_keys_null():
+    for created_at in ("2024-01-01 10:00", "2024-01-01 10:01", "2024-01-01 10:02"):
+        assessment_store.append_assessment(USER, 3, RESULTS, created_at)
+    assessment_store.append_assessment({**USER, "name": "أحمد"}, 3, RESULTS, "2024-01-02 10:00")
+    key = assessment_store.submission_hash(USER, ANSWERS)
+    assessment_store.append_assessment(USER, 3, RESULTS, "2024-01-03 10:00", submission_key=key)
+
+    removed, kept = assessment_store.compact_assessments()
+
+    assert (removed, kept) == (3, 2)
+    rows = assessment_store.fetch_assessment_rows()
+    assert [(r["name"], r["created_at"]) for r in rows] == [("سها", "2024-01-01 10:00"), ("أحمد", "2024-01-02 10:00")]
+    assert [r["submission_hash"] for r in rows] == [None, None]
+    # الصفوف القديمة بلا بصمة لا تمنع حفظ الإرسال نفسه من الواجهة
+    assert assessment_store.append_assessment(USER, 3, RESULTS, submission_key=key) is not None
+
+
+def test_compact_without_duplicates_keeps_version():
+    assessment_store.append_assessment(USER, 3, RESULTS)
+    version = assessment_store.store_version()
+
+    assert assessment_store.compact_assessments() == (0, 1)
+    assert assessment_store.store_version() == version
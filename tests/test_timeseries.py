@@ -0,0 +1,86 @@
+# اختبارات محرك السلاسل الزمنية: التقليص بخوارزمية LTTB والفهرسة حسب الشركة
+import numpy as np
+import pytest
+
+import assessment_store
+import timeseries
+
+
+def series(n, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.arange(n, dtype=np.int64) * 86_400_000_000_000
+    y = 3 + np.sin(np.linspace(0, 20, n)) + rng.normal(0, 0.1, n)
+    return x, y
+
+
+def test_lttb_keeps_short_series_unchanged():
+    x, y = series(50)
+
+    for threshold in (50, 500, 2):
+        out_x, out_y = timeseries.lttb(x, y, threshold)
+        assert out_x is x and out_y is y
+
+
+def test_lttb_returns_threshold_points_with_endpoints():
+    x, y = series(10_000)
+
+    out_x, out_y = timeseries.lttb(x, y, 300)
+
+    assert len(out_x) == len(out_y) == 300
+    assert (out_x[0], out_x[-1]) == (x[0], x[-1])
+    assert np.all(np.diff(out_x) > 0)
+    # كل نقطة مختارة نقطة حقيقية من السلسلة الأصلية
+    np.testing.assert_array_equal(out_y, y[np.searchsorted(x, out_x)])
+
+
+def test_lttb_keeps_peaks_and_troughs():
+    x, y = series(5_000)
+    y[1234], y[3210] = 5.0, 0.0
+
+    out_x, out_y = timeseries.lttb(x, y, 100)
+
+    assert x[1234] in out_x and x[3210] in out_x
+    assert out_y.max() == 5.0 and out_y.min() == 0.0
+
+
+def test_downsample_drops_missing_values():
+    x, y = series(1_000)
+    cpm = y.copy()
+    cpm[::2] = np.nan
+    entry = {"x": x, "series": {"نتيجة CPM": cpm, "متوسط IoT": y, "SCOR - Plan": np.full(1_000, np.nan)}}
+
+    out = timeseries.downsample(entry, target_points=100)
+
+    assert set(out) == {"نتيجة CPM", "متوسط IoT"}
+    assert len(out["متوسط IoT"][0]) == 100
+    assert not np.isnan(out["نتيجة CPM"][1]).any()
+
+
+def test_company_index_sorts_by_date_and_follows_store_version():
+    assessment_store.append_log_entries([
+        {"الشركة": "شركة أ", "التاريخ": "2024-03-02 10:00", "نتيجة CPM": 2.0},
+        {"الشركة": "شركة ب", "التاريخ": "2024-03-01 10:00", "نتيجة CPM": 4.0},
+        {"الشركة": "شركة أ", "التاريخ": "2024-03-01 10:00", "نتيجة CPM": 1.0},
+        {"الشركة": "شركة أ", "التاريخ": None, "نتيجة CPM": 5.0},
+    ])
+
+    index = timeseries.company_index()
+    assert timeseries.company_index() is index
+    assert sorted(index) == ["شركة أ", "شركة ب"]
+    assert index["شركة أ"]["series"]["نتيجة CPM"].tolist() == [1.0, 2.0]
+    assert np.all(np.diff(index["شركة أ"]["x"]) > 0)
+
+    assessment_store.append_log_entries([{"الشركة": "شركة ج", "التاريخ": "2024-03-03 10:00", "نتيجة CPM": 3.0}])
+    assert "شركة ج" in timeseries.company_index()
+
+
+@pytest.mark.parametrize("n", [50, 5_000])
+def test_build_figure_has_one_trace_per_series(n):
+    x, y = series(n)
+
+    fig = timeseries.build_figure({"نتيجة CPM": (x, y), "SCOR - Plan": (x, y)})
+
+    assert [trace.name for trace in fig.data] == ["CPM", "SCOR - Plan"]
+    assert fig.data[0].mode == ("lines+markers" if n <= 100 else "lines")
+    # كل السلاسل ظاهرة افتراضيًا، بما فيها مراحل SCOR
+    assert all(trace.visible in (None, True) for trace in fig.data)
@@ -0,0 +1,115 @@
+# اختبارات صندوق الصادر أمام خادم HTTP محلي (ThreadingHTTPServer) بدل النظام الخارجي
+import pytest
+
+import assessment_store
+import audit_log
+import webhook_outbox
+
+
+@pytest.fixture
+def dispatcher_factory():
+    started = []
+
+    def create(**kwargs):
+        kwargs.setdefault("poll_interval", 0.05)
+        dispatcher = webhook_outbox.WebhookDispatcher(**kwargs)
+        started.append(dispatcher)
+        return dispatcher
+
+    yield create
+    for dispatcher in started:
+        dispatcher.close()
+
+
+def test_retries_5xx_with_backoff_until_delivered(endpoints, dispatcher_factory):
+    endpoint = endpoints([503, 502, 200])
+    delays = []
+    results = []
+    dispatcher = dispatcher_factory(
+        backoff=lambda attempts: delays.append(attempts) or 0.0,
+        on_result=lambda delivery, status: results.append(status),
+    )
+
+    delivery_id = dispatcher.submit(endpoint.url, {"company": "شركة"})
+    assert dispatcher.drain(timeout=10)
+
+    [row] = webhook_outbox.status([delivery_id])
+    assert row["status"] == "delivered"
+    assert row["attempts"] == 3
+    assert delays == [1, 2]
+    assert results == ["delivered"]
+    assert endpoint.requests == 3
+
+
+def test_gives_up_after_max_attempts(endpoints, dispatcher_factory):
+    endpoint = endpoints([503])
+    dispatcher = dispatcher_factory(max_attempts=3, backoff=lambda attempts: 0.0, on_result=lambda d, s: None)
+
+    delivery_id = dispatcher.submit(endpoint.url, {"company": "شركة"})
+    assert dispatcher.drain(timeout=10)
+
+    [row] = webhook_outbox.status([delivery_id])
+    assert (row["status"], row["attempts"], row["last_error"]) == ("failed", 3, "HTTP 503")
+
+
+def test_4xx_fails_permanently_without_retry(endpoints, dispatcher_factory):
+    endpoint = endpoints([400])
+    delays = []
+    dispatcher = dispatcher_factory(backoff=lambda attempts: delays.append(attempts) or 0.0,
+                                    on_result=lambda d, s: None)
+
+    delivery_id = dispatcher.submit(endpoint.url, {"company": "شركة"})
+    assert dispatcher.drain(timeout=10)
+
+    [row] = webhook_outbox.status([delivery_id])
+    assert (row["status"], row["attempts"], row["last_error"]) == ("failed", 1, "HTTP 400")
+    assert delays == []
+    assert endpoint.requests == 1
+
+
+def test_per_endpoint_concurrency_cap(endpoints, dispatcher_factory):
+    slow = endpoints([200], latency=0.05)
+    other = endpoints([200], latency=0.05)
+    dispatcher = dispatcher_factory(max_workers=8, per_endpoint_limit=2, on_result=lambda d, s: None)
+
+    ids = [dispatcher.submit(slow.url, {"i": i}) for i in range(12)]
+    ids += [dispatcher.submit(other.url, {"i": i}) for i in range(4)]
+    assert dispatcher.drain(timeout=20)
+
+    assert all(row["status"] == "delivered" for row in webhook_outbox.status(ids))
+    assert slow.peak == 2
+    assert other.peak <= 2
+    assert (slow.requests, other.requests) == (12, 4)
+
+
+def test_due_deliveries_are_capped_per_endpoint():
+    # مسارات مختلفة على الخادم نفسه تُحسب على حد واحد كما في WebhookDispatcher
+    for i in range(10):
+        url = f"http://busy.example/hook/{i % 3}"
+        assessment_store.enqueue_delivery(url, {"i": i}, endpoint=webhook_outbox.endpoint_of(url))
+    url = "http://quiet.example/hook"
+    assessment_store.enqueue_delivery(url, {"i": 0}, endpoint=webhook_outbox.endpoint_of(url))
+
+    due = assessment_store.due_deliveries(limit=5, per_endpoint=2)
+    endpoints = [d["endpoint"] for d in due]
+    assert endpoints.count("http://busy.example") == 2
+    assert "http://quiet.example" in endpoints
+    assert len(due) == 3
+
+
+def test_final_status_is_written_to_log(endpoints, dispatcher_factory):
+    ok = endpoints([200])
+    rejected = endpoints([422])
+    dispatcher = dispatcher_factory()
+
+    def entry(company):
+        return {"الشركة": company, "القطاع": "التصنيع", "الدولة": "مصر", "الطريقة": "Webhook"}
+
+    dispatcher.submit(ok.url, {"company": "أ"}, entry("شركة أ"))
+    dispatcher.submit(rejected.url, {"company": "ب"}, entry("شركة ب"))
+    assert dispatcher.drain(timeout=10)
+    assert audit_log.get_log_writer().flush(timeout=10)
+
+    log = assessment_store.load_log()
+    statuses = dict(zip(log["الشركة"], log["حالة العملية"]))
+    assert statuses == {"شركة أ": "نجاح", "شركة ب": "فشل"}
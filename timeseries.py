@@ -0,0 +1,113 @@
+# محرك السلاسل الزمنية لصفحة تحليل الأداء الزمني
+# السجل يُفهرس مرة واحدة لكل إصدار من السجل (شركة → مصفوفات مرتبة بالتاريخ)، ثم تُقلَّص كل سلسلة
+# إلى عدد نقاط مستهدف بخوارزمية LTTB قبل الرسم، وتُرسم كل السلاسل في شكل واحد متعدد المسارات.
+
+import threading
+
+import numpy as np
+
+import assessment_store
+import log_loader
+from lazy_imports import lazy_import
+
+go = lazy_import("plotly.graph_objects")
+
+DEFAULT_TARGET_POINTS = 500
+
+SERIES = {
+    "نتيجة CPM": "CPM",
+    "متوسط IoT": "IoT",
+}
+SERIES.update({f"SCOR - {phase}": f"SCOR - {phase}" for phase in assessment_store.SCOR_PHASES})
+
+_lock = threading.Lock()
+_cache = {"version": None, "index": None}
+
+
+# ======================= #
+#     الفهرسة حسب الشركة
+# ======================= #
+def _build_index(df):
+    df = df.dropna(subset=["الشركة", "التاريخ"])
+    columns = [col for col in SERIES if col in df.columns]
+    index = {}
+    for company, group in df.groupby("الشركة", sort=False):
+        group = group.sort_values("التاريخ", kind="stable")
+        index[company] = {
+            # التاريخ كعدد نانوثوانٍ (int64) حتى تعمل LTTB بحساب عددي مباشر
+            "x": group["التاريخ"].to_numpy(dtype="datetime64[ns]").astype(np.int64),
+            "series": {col: group[col].to_numpy(dtype=float) for col in columns},
+        }
+    return index
+
+
+def company_index():
+    # يعيد {الشركة: {"x": ..., "series": {...}}} ويُعاد بناؤه فقط عند تغيّر إصدار السجل
+    version = assessment_store.log_version()
+    with _lock:
+        if _cache["index"] is not None and _cache["version"] == version:
+            return _cache["index"]
+    index = _build_index(log_loader.load_log())
+    with _lock:
+        _cache.update(version=version, index=index)
+    return index
+
+
+# ======================= #
+#     التقليص (LTTB)
+# ======================= #
+def lttb(x, y, threshold):
+    # Largest-Triangle-Three-Buckets: يحتفظ بالنقاط التي تحافظ على شكل المنحنى (القمم والقيعان)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+    x_f = x.astype(float)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x_f[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        area = np.abs(
+            (x_f[a] - avg_x) * (y[start:end] - y[a])
+            - (x_f[a] - x_f[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return x[selected], y[selected]
+
+
+def downsample(entry, target_points=DEFAULT_TARGET_POINTS):
+    # يعيد {العمود: (x, y)} لكل سلسلة بعد حذف القيم الفارغة وتقليصها
+    out = {}
+    for col, y in entry["series"].items():
+        mask = ~np.isnan(y)
+        if mask.any():
+            out[col] = lttb(entry["x"][mask], y[mask], target_points)
+    return out
+
+
+# ======================= #
+#        الرسم
+# ======================= #
+def build_figure(series, title=None):
+    fig = go.Figure()
+    for col, (x, y) in series.items():
+        fig.add_trace(go.Scatter(
+            x=x.astype("datetime64[ns]"), y=np.round(y, 2),
+            mode="lines+markers" if len(x) <= 100 else "lines",
+            name=SERIES.get(col, col),
+        ))
+    fig.update_layout(
+        title=title, xaxis_title="التاريخ", yaxis_title="الدرجة", yaxis=dict(range=[0, 5.2]),
+        hovermode="x unified", legend=dict(orientation="h"), height=500,
+    )
+    return fig
+
+
+def payload_size(fig):
+    # حجم JSON الذي يُرسل إلى المتصفح (بالبايت)
+    return len(fig.to_json().encode("utf-8"))
@@ -0,0 +1,208 @@
+# إرسال Webhook غير متزامن عبر صندوق صادر دائم (SQLite)
+# زر الإرسال يضيف الطلب إلى جدول webhook_outbox ويعود فورًا، وخيط في الخلفية يرسل الطلبات
+# عبر جلسة HTTP مشتركة (Connection pooling) مع مهلة لكل طلب، وإعادة محاولة بتأخير أُسّي عشوائي،
+# وحد أقصى للطلبات المتزامنة لكل نظام خارجي، ثم يكتب النتيجة في عمود "حالة العملية" بسجل العمليات.
+
+import atexit
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import assessment_store
+import audit_log
+
+# ======================= #
+#        الإعدادات
+# ======================= #
+CONNECT_TIMEOUT = 3.05      # ثوانٍ
+READ_TIMEOUT = 10.0
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 1.0          # التأخير قبل المحاولة الثانية، ويتضاعف بعدها
+BACKOFF_MAX = 60.0
+MAX_WORKERS = 8
+PER_ENDPOINT_LIMIT = 2      # طلبات متزامنة لكل نظام خارجي (host:port)
+POLL_INTERVAL = 1.0
+
+STATUS_LABELS = {
+    "pending": "⏳ في الانتظار",
+    "sending": "📤 جارٍ الإرسال",
+    "delivered": "✅ تم التسليم",
+    "failed": "❌ فشل",
+}
+
+
+def backoff_delay(attempts, base=BACKOFF_BASE, cap=BACKOFF_MAX):
+    # Full jitter: تأخير عشوائي بين 0 و base * 2^(n-1) حتى لا تعود كل المحاولات في اللحظة نفسها
+    return random.uniform(0, min(cap, base * 2 ** (attempts - 1)))
+
+
+def endpoint_of(url):
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def make_session(pool_size):
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Content-Type"] = "application/json; charset=utf-8"
+    return session
+
+
+class WebhookDispatcher:
+    def __init__(self, session=None, max_workers=MAX_WORKERS, per_endpoint_limit=PER_ENDPOINT_LIMIT,
+                 max_attempts=MAX_ATTEMPTS, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
+                 backoff=backoff_delay, poll_interval=POLL_INTERVAL, on_result=None):
+        self._session = session or make_session(max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scor-webhook")
+        self._per_endpoint_limit = per_endpoint_limit
+        self._limits = {}
+        self._max_attempts = max_attempts
+        self._timeout = timeout
+        self._backoff = backoff
+        self._poll_interval = poll_interval
+        self._on_result = on_result or _log_result
+        self._wake = threading.Event()
+        self._idle = threading.Condition()
+        self._inflight = 0
+        self._closed = False
+        assessment_store.reset_inflight_deliveries()
+        self._thread = threading.Thread(target=self._run, name="scor-webhook-dispatcher", daemon=True)
+        self._thread.start()
+
+    # --- واجهة الاستخدام ---
+    def submit(self, url, payload, log_entry=None):
+        if self._closed:
+            raise RuntimeError("WebhookDispatcher is closed")
+        delivery_id = assessment_store.enqueue_delivery(url, payload, log_entry, endpoint=endpoint_of(url))
+        self._wake.set()
+        return delivery_id
+
+    def drain(self, timeout=None):
+        # ينتظر حتى لا يبقى في الصندوق إرسال معلّق (مفيد للاختبار وسكربتات الدفعات)
+        # ولا إرسال لم تُسجَّل نتيجته بعد (on_result يُستدعى بعد تحديث الصندوق)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._inflight or assessment_store.count_pending_deliveries():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            self._wake.set()
+            with self._idle:
+                self._idle.wait(0.05)
+        return True
+
+    def close(self, timeout=5.0):
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join(timeout)
+        self._executor.shutdown(wait=True)
+        self._session.close()
+
+    # --- خيط التوزيع ---
+    def _limit_for(self, endpoint):
+        if endpoint not in self._limits:
+            self._limits[endpoint] = threading.BoundedSemaphore(self._per_endpoint_limit)
+        return self._limits[endpoint]
+
+    def _dispatch_due(self):
+        for delivery in assessment_store.due_deliveries(per_endpoint=self._per_endpoint_limit):
+            limit = self._limit_for(delivery["endpoint"])
+            # النظام المشغول يُتخطى في هذه الدورة بدل حجز عامل ينتظره
+            if not limit.acquire(blocking=False):
+                continue
+            if not assessment_store.claim_delivery(delivery["id"]):
+                limit.release()
+                continue
+            with self._idle:
+                self._inflight += 1
+            self._executor.submit(self._deliver, delivery, limit)
+
+    def _run(self):
+        while not self._closed:
+            try:
+                self._dispatch_due()
+            except Exception as e:
+                print(f"⚠️ تعذر قراءة صندوق الصادر: {e}", file=sys.stderr)
+            self._wake.wait(self._poll_interval)
+            self._wake.clear()
+
+    # --- إرسال طلب واحد ---
+    def _post(self, delivery):
+        import requests
+
+        try:
+            response = self._session.post(
+                delivery["url"], data=delivery["payload"].encode("utf-8"), timeout=self._timeout
+            )
+        except requests.RequestException as e:
+            return False, True, f"{type(e).__name__}: {e}"
+        if 200 <= response.status_code < 300:
+            return True, False, None
+        # 5xx و 429 أخطاء مؤقتة تستحق إعادة المحاولة، وباقي 4xx خطأ دائم
+        retryable = response.status_code >= 500 or response.status_code == 429
+        return False, retryable, f"HTTP {response.status_code}"
+
+    def _deliver(self, delivery, limit):
+        try:
+            ok, retryable, error = self._post(delivery)
+            attempts = delivery["attempts"] + 1
+            if ok:
+                assessment_store.finish_delivery(delivery["id"], "delivered", attempts)
+                self._on_result(delivery, "delivered")
+            elif retryable and attempts < self._max_attempts:
+                next_attempt_at = time.time() + self._backoff(attempts)
+                assessment_store.reschedule_delivery(delivery["id"], attempts, next_attempt_at, error)
+            else:
+                assessment_store.finish_delivery(delivery["id"], "failed", attempts, error)
+                self._on_result(delivery, "failed")
+        except Exception as e:
+            print(f"⚠️ تعذر تحديث حالة الإرسال {delivery['id']}: {e}", file=sys.stderr)
+        finally:
+            limit.release()
+            with self._idle:
+                self._inflight -= 1
+                self._idle.notify_all()
+            self._wake.set()
+
+
+def _log_result(delivery, status):
+    # النتيجة النهائية فقط تُكتب في السجل (نجاح / فشل) حتى لا تتضاعف قيود الشركة في مجاميع القطاع
+    entry = delivery.get("log_entry")
+    if entry is None:
+        return
+    entry = dict(entry)
+    entry["حالة العملية"] = "نجاح" if status == "delivered" else "فشل"
+    audit_log.log_entry(entry)
+
+
+# ======================= #
+#   موزّع واحد لكل عملية
+# ======================= #
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher():
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = WebhookDispatcher()
+            atexit.register(_dispatcher.close)
+        return _dispatcher
+
+
+def send(url, payload, log_entry=None):
+    # إضافة الإرسال إلى الصندوق والعودة فورًا برقم الإرسال
+    return get_dispatcher().submit(url, payload, log_entry)
+
+
+def status(delivery_ids):
+    return assessment_store.delivery_status(delivery_ids)